@@ -1,6 +1,7 @@
 from fastapi import APIRouter
+from app.api.responses import FastJSONResponse
 from app.api.v1.router import router as v1_router
 
-router = APIRouter()
+router = APIRouter(default_response_class=FastJSONResponse)
 
 router.include_router(v1_router, prefix="/v1")
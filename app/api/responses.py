@@ -0,0 +1,39 @@
+from typing import Any, AsyncIterable, AsyncIterator
+
+from pydantic_core import to_json
+from starlette.responses import JSONResponse, StreamingResponse
+
+
+class FastJSONResponse(JSONResponse):
+    """JSON response rendered by pydantic-core's serializer instead of ``json.dumps``.
+
+    Pydantic models are serialised directly (with their aliases and field
+    serializers), datetimes as ISO 8601 and anything else unknown, such as
+    ``ObjectId``, through ``str``. Endpoints returning large lists of documents
+    can return ``FastJSONResponse(models)`` to also skip FastAPI's
+    ``jsonable_encoder`` pass.
+    """
+
+    def render(self, content: Any) -> bytes:
+        return to_json(content, by_alias=True, fallback=str)
+
+
+class StreamingJSONArrayResponse(StreamingResponse):
+    """JSON array written item by item as ``items`` yields them.
+
+    Rendered like ``FastJSONResponse``, but the whole list never exists in
+    memory, so endpoints can return any number of documents from an
+    ``iter_by_fields``/``iter_all`` cursor. Errors raised while iterating
+    cannot change the status code any more, they just cut the response short.
+    """
+
+    def __init__(self, items: AsyncIterable[Any], status_code: int = 200, **kwargs: Any):
+        super().__init__(self._render(items), status_code=status_code, media_type="application/json", **kwargs)
+
+    @staticmethod
+    async def _render(items: AsyncIterable[Any]) -> AsyncIterator[bytes]:
+        separator = b"["
+        async for item in items:
+            yield separator + to_json(item, by_alias=True, fallback=str)
+            separator = b","
+        yield b"[]" if separator == b"[" else b"]"
@@ -0,0 +1,118 @@
+import re
+from typing import Callable, Dict, Iterable, List, Optional, Pattern, TypeVar
+
+from fastapi import APIRouter
+from starlette.routing import BaseRoute, Mount, Route, WebSocketRoute
+
+F = TypeVar("F", bound=Callable)
+
+PUBLIC_ATTRIBUTE = "__public__"
+
+
+def public(endpoint: F) -> F:
+    """Mark an endpoint as reachable without authentication.
+
+    Works in either position relative to the route decorator, since the flag
+    is stored on the endpoint function itself.
+    """
+    setattr(endpoint, PUBLIC_ATTRIBUTE, True)
+    return endpoint
+
+
+def mark_public(router: APIRouter) -> APIRouter:
+    """Mark every endpoint currently registered on ``router`` as public."""
+    for route in router.routes:
+        if isinstance(route, (Route, WebSocketRoute)):
+            public(route.endpoint)
+    return router
+
+
+def is_public_route(route: BaseRoute) -> bool:
+    endpoint = getattr(route, "endpoint", None)
+    return bool(getattr(endpoint, PUBLIC_ATTRIBUTE, False))
+
+
+def _unanchored(pattern: Pattern) -> str:
+    # Drop anchors and group names so many route patterns can share one expression
+    source = pattern.pattern.removeprefix("^").removesuffix("$")
+    return re.sub(r"\(\?P<\w+>", "(?:", source)
+
+
+class PublicRouteMatcher:
+    """Decide whether a request needs authentication from the app's route metadata.
+
+    Every route pattern, public or not, is compiled once into one regular
+    expression per HTTP method (plus one for websockets), each route as a named
+    alternative in declaration order. ``fullmatch`` tries alternatives in order,
+    so the group that matches is the route Starlette would dispatch to, and that
+    route's ``@public`` marker decides: a public ``/{restaurant_id}`` cannot
+    expose a protected ``/paginate`` declared before it. A lookup is still a
+    single regex match over the path.
+    ``extra_prefixes`` covers paths served outside the routers (docs, health).
+    ``fallback_prefix``, when set, keeps every path under it public; it exists
+    to migrate away from the old catch-all and is reported separately.
+    """
+
+    def __init__(
+        self,
+        routes: Iterable[BaseRoute],
+        extra_prefixes: Iterable[str] = (),
+        fallback_prefix: Optional[str] = None,
+    ):
+        self.public_routes: List[str] = []
+        self.protected_routes: List[str] = []
+        patterns: Dict[str, List[str]] = {}
+        # Group name -> whether the route behind it is public
+        self._public_groups: Dict[str, bool] = {}
+
+        for index, route in enumerate(self._flatten(routes)):
+            methods = sorted(route.methods) if isinstance(route, Route) and route.methods else ["WEBSOCKET"]
+            description = f"{','.join(methods)} {route.path}"
+            is_public = is_public_route(route)
+            (self.public_routes if is_public else self.protected_routes).append(description)
+
+            group = f"route{index}"
+            self._public_groups[group] = is_public
+            for method in methods:
+                patterns.setdefault(method, []).append(f"(?P<{group}>{_unanchored(route.path_regex)})")
+
+        self._by_method: Dict[str, Pattern] = {
+            method: re.compile("|".join(alternatives)) for method, alternatives in patterns.items()
+        }
+        # HEAD is answered by GET routes
+        if "GET" in self._by_method and "HEAD" not in self._by_method:
+            self._by_method["HEAD"] = self._by_method["GET"]
+
+        prefixes = sorted(extra_prefixes, key=len, reverse=True)
+        self._prefixes: Optional[Pattern] = (
+            re.compile("|".join(re.escape(p) for p in prefixes)) if prefixes else None
+        )
+        self.fallback_prefix = fallback_prefix
+
+    @staticmethod
+    def _flatten(routes: Iterable[BaseRoute]) -> Iterable[BaseRoute]:
+        for route in routes:
+            if isinstance(route, Mount):
+                continue  # Static mounts and sub-apps handle their own access control
+            if isinstance(route, (Route, WebSocketRoute)):
+                yield route
+
+    def is_public(self, method: str, path: str) -> bool:
+        if self._prefixes is not None and self._prefixes.match(path):
+            return True
+        pattern = self._by_method.get(method)
+        match = pattern.fullmatch(path) if pattern is not None else None
+        if match is not None and self._public_groups[match.lastgroup]:
+            return True
+        return self.fallback_prefix is not None and path.startswith(self.fallback_prefix)
+
+    def report(self) -> str:
+        lines = [f"{len(self.public_routes)} public routes:"]
+        lines += [f"  {route}" for route in sorted(self.public_routes)]
+        if self.fallback_prefix:
+            exposed = [r for r in self.protected_routes if r.split(" ", 1)[1].startswith(self.fallback_prefix)]
+            lines.append(
+                f"{len(exposed)} routes are only public through the {self.fallback_prefix} fallback:"
+            )
+            lines += [f"  {route}" for route in sorted(exposed)]
+        return "\n".join(lines)
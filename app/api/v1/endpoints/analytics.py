@@ -10,8 +10,10 @@ from app.services.analytics import (
     count_cancelled_orders,
     count_cancelled_sessions,
     average_session_duration,
-    active_sessions_count, last_seven_days_order_count
+    active_sessions_count, last_seven_days_order_count,
+    order_count_time_series
 )
+from app.schema.analytics import TimeSeriesGranularity
 from app.utils.time import now_in_luanda, to_luanda_timezone
 
 router = APIRouter()
@@ -167,4 +169,14 @@ async def active_sessions_summary(
 async def get_last_seven_days_order_count(
     restaurant_id: str = Query(..., alias="restaurantId")
 ):
-    return await last_seven_days_order_count(restaurant_id)
\ No newline at end of file
+    return await last_seven_days_order_count(restaurant_id)
+
+
+@router.get("/orders/time-series")
+async def get_order_count_time_series(
+    restaurant_id: str = Query(..., alias="restaurantId"),
+    days: int = Query(7, ge=1, le=366),
+    granularity: TimeSeriesGranularity = Query(TimeSeriesGranularity.DAY),
+):
+    """Return order counts bucketed by hour, day or week over the last ``days`` days."""
+    return await order_count_time_series(restaurant_id, days=days, granularity=granularity)
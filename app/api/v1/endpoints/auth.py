@@ -3,6 +3,7 @@ from datetime import datetime
 from fastapi import APIRouter, Depends, Request, Response, HTTPException, Body
 from starlette.status import HTTP_401_UNAUTHORIZED
 
+from app.api.route_policy import public
 from app.core.dependencies import get_settings
 from app.services.user import create_user
 from app.utils.auth import (
@@ -11,7 +12,8 @@ from app.utils.auth import (
     verify_session_cookie,
     get_token_from_request,
     revoke_user_sessions,
-    get_current_user
+    get_current_user,
+    verified_sessions,
 )
 from app.models.user import UserModel
 from app.schema.user import User, UserCreate
@@ -25,6 +27,7 @@ settings = get_settings()
 
 
 @router.post("/login")
+@public
 async def login(
         response: Response,
         id_token: str = Body(..., embed=True, alias="idToken")
@@ -81,6 +84,7 @@ async def login(
 
 @router.post("/logout")
 async def logout(
+        request: Request,
         response: Response,
         uid: str = Depends(get_current_user)
 ):
@@ -90,6 +94,11 @@ async def logout(
         if uid:
             revoke_user_sessions(uid)
 
+        # Stop accepting the cookie in this worker right away instead of after the cache window
+        token = get_token_from_request(request)
+        if token:
+            verified_sessions.discard(token)
+
         # Clear cookies
         clear_auth_cookies(response)
 
@@ -133,6 +142,7 @@ async def get_current_user_info(
 
 
 @router.post("/refresh")
+@public
 async def refresh_token(
         request: Request,
         response: Response
@@ -177,6 +187,7 @@ async def refresh_token(
 
 
 @router.post("/register", response_model=User   )
+@public
 async def register_user(
         response: Response,
         payload: dict = Body(...)
@@ -1,12 +1,12 @@
 from fastapi import APIRouter, HTTPException, Body
 from pydantic import constr
 
+from app.api.route_policy import public
 from app.schema import category as category_schema
 from app.services import category as category_service
 from app.services import item as item_service
 from app.services.category import category_model
 from app.services.menu import menu_model
-from app.utils.slug import generate_unique_slug
 
 router = APIRouter()
 
@@ -14,15 +14,12 @@ router = APIRouter()
 async def create_category(data: category_schema.CategoryCreate):
     try:
         category = await category_service.create_category(data)
-        slug = await generate_unique_slug(name=category.name, model=category_schema.CategoryDocument)
-        category = await category_model.update(category.id, {"slug": slug})
         return category.to_response()
     except Exception as error:
-        if category:
-            await category_model.delete(category.id)
         raise HTTPException(status_code=500, detail=str(error))
 
 @router.get("/{category_id}")
+@public
 async def get_category(category_id: str):
     category = await category_service.get_category(category_id)
     if not category:
@@ -60,11 +57,13 @@ async def switch_category_availability(
     return updated.to_response()
 
 @router.get("/{category_id}/items")
+@public
 async def list_category_items(category_id: str):
     items = await item_service.list_items_by_category(category_id)
     return [i.to_response() for i in items]
 
 @router.get("/{category_slug}/slug/items")
+@public
 async def list_category_items_by_slug(category_slug: str):
     category = await category_model.get_by_slug(category_slug)
     if not category:
@@ -92,11 +91,13 @@ async def remove_item(category_id: str, item_id: str):
         raise HTTPException(status_code=404, detail=str(error))
 
 @router.get("/menu/{menu_id}")
+@public
 async def list_menu_categories(menu_id: str):
     categories = await category_service.list_categories_for_menu(menu_id)
     return [c.to_response() for c in categories]
 
 @router.get("/menu/slug/{menu_slug}")
+@public
 async def list_menu_categories_by_slug(menu_slug: str):
     try:
         menu = await menu_model.get_by_slug(menu_slug)
@@ -116,6 +117,7 @@ async def list_menu_categories_by_slug(menu_slug: str):
 
 
 @router.get("/menu/slug/{menu_slug}/count")
+@public
 async def count_menu_categories(menu_slug: str):
     """Return how many categories belong to the menu with the given slug."""
     try:
@@ -134,11 +136,13 @@ async def count_menu_categories(menu_slug: str):
         raise HTTPException(detail=str(error), status_code=400)
 
 @router.get("/restaurant/{restaurant_id}")
+@public
 async def list_restaurant_categories(restaurant_id: str):
     categories = await category_service.list_categories_for_restaurant(restaurant_id)
     return [c.to_response() for c in categories]
 
 @router.get("/slug/{slug}")
+@public
 async def get_category_by_slug(slug: str):
     category = await category_service.get_category_by_slug(slug)
     if not category:
@@ -1,6 +1,16 @@
-from fastapi import APIRouter
+from typing import Optional
 
+from fastapi import APIRouter, Query
+
+from app.api.responses import StreamingJSONArrayResponse
+
+from app.core.dependencies import get_mongo
+from app.db.cache import get_cache_stats
+from app.db.query_audit import audit_queries
 from app.services import diagnostics as diag_service
+from app.services import restaurant_metrics as metrics_service
+from app.services.websocket_manager import get_websocket_manger
+from app.utils.auth import verified_sessions
 
 router = APIRouter()
 
@@ -14,13 +24,13 @@ async def get_duplicate_sessions():
 @router.get("/sessions/current-mismatch")
 async def get_current_session_mismatches():
     """Find tables whose currentSessionId does not match an active session."""
-    return await diag_service.mismatched_current_sessions()
+    return StreamingJSONArrayResponse(diag_service.iter_mismatched_current_sessions())
 
 
 @router.get("/sessions/orphans")
 async def get_orphan_sessions():
     """Return sessions not linked to any table."""
-    return await diag_service.orphan_sessions()
+    return StreamingJSONArrayResponse(diag_service.iter_orphan_sessions())
 
 
 @router.get("/run-all")
@@ -34,3 +44,54 @@ async def delete_orphan_images():
     """Remove images in cloud storage not linked to any item or restaurant."""
     deleted = await diag_service.cleanup_unlinked_images()
     return {"deleted": deleted}
+
+
+@router.post("/metrics/rebuild")
+async def rebuild_restaurant_metrics(
+    restaurant_id: Optional[str] = Query(None, alias="restaurantId"),
+):
+    """Rebuild the hourly metrics rollup from raw orders, invoices and sessions."""
+    buckets = await metrics_service.rebuild_metrics(restaurant_id)
+    return {"buckets": buckets}
+
+
+@router.get("/cache")
+async def get_cache_metrics():
+    """Report hit, miss and invalidation counters for every read cache in this worker."""
+    return get_cache_stats()
+
+
+@router.get("/websockets")
+async def get_websocket_metrics():
+    """Report per-channel connections, queue depth, drops and send latency for this worker."""
+    return get_websocket_manger().get_metrics()
+
+
+@router.get("/auth-cache")
+async def get_auth_cache_metrics():
+    """Report the hit rate of the verified session cookie cache in this worker."""
+    return verified_sessions.stats()
+
+
+@router.get("/pagination-plans")
+async def get_pagination_plans():
+    """Explain every paginated query shape served by this worker and flag those not served by an index.
+
+    Empty unless ``QUERY_AUDIT`` is enabled.
+    """
+    return await audit_queries(paginated_only=True)
+
+
+@router.get("/indexes")
+async def get_index_sync_report():
+    """Report the indexes created, rebuilt or left undeclared when this worker synced them at startup."""
+    return get_mongo().index_reports
+
+
+@router.get("/query-plans")
+async def get_query_plans():
+    """Explain every query shape sent by the services of this worker, collection scans first.
+
+    Empty unless ``QUERY_AUDIT`` is enabled.
+    """
+    return await audit_queries()
@@ -33,6 +33,7 @@ from app.schema.insights import (
 from app.models.order import OrderModel
 from app.services import table as table_service
 from app.services import restaurant as restaurant_service
+from app.services import restaurant_metrics as metrics_service
 from app.services.table_session import session_model
 from app.utils.time import now_in_luanda, to_luanda_timezone
 from app.utils.format import format_number
@@ -75,30 +76,30 @@ async def _get_occupancy_data(restaurant_id: str, days: int) -> List[TableOccupa
     if total_tables == 0:
         return []
 
-    cutoff = now_in_luanda() - timedelta(days=days)
-    sessions = await session_model.get_by_fields({
-        "restaurantId": restaurant_id,
-        "startTime": {"$gte": cutoff},
-    })
-    now = to_luanda_timezone(now_in_luanda())
+    now = now_in_luanda()
+    cutoff = now - timedelta(days=days)
     occ_map: dict[datetime.date, dict[int, int]] = defaultdict(lambda: defaultdict(int))
 
+    # Hours occupied by sessions that already ended come pre-aggregated from the rollup
+    for bucket in await metrics_service.list_hourly_metrics(restaurant_id, cutoff, now):
+        if bucket.occupied_sessions:
+            hour = to_luanda_timezone(bucket.hour)
+            occ_map[hour.date()][hour.hour] += bucket.occupied_sessions
+
+    # Sessions that are still open are not in the rollup yet
+    open_sessions = await session_model.get_by_fields(
+        {"restaurantId": restaurant_id, "endTime": None}, limit=0
+    )
+
     try:
-        for s in sessions:
+        for s in open_sessions:
             if not s.start_time:
                 continue
 
-            start_dt = to_luanda_timezone(s.start_time)
-            if start_dt is None:
-                continue
-
-            start = start_dt.replace(minute=0, second=0, microsecond=0)
-            end_dt = to_luanda_timezone(s.end_time) or now
-            end = end_dt.replace(minute=0, second=0, microsecond=0)
-            current = start
-            while current <= end:
-                occ_map[current.date()][current.hour] += 1
-                current += timedelta(hours=1)
+            start = max(to_luanda_timezone(s.start_time), to_luanda_timezone(cutoff))
+            for hour in metrics_service.hours_between(start, now):
+                hour = to_luanda_timezone(hour)
+                occ_map[hour.date()][hour.hour] += 1
     except Exception as e:
         print(e)
 
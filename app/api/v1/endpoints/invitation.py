@@ -3,6 +3,7 @@ from typing import List
 from fastapi import APIRouter, HTTPException
 from pydantic import EmailStr
 
+from app.api.route_policy import public
 from app.schema import invitation as invitation_schema
 from app.models.invitation import InvitationModel
 from app.services import invitation as invitation_service
@@ -30,6 +31,7 @@ async def delete_invitation(invitation_id: str):
 
 
 @router.get("/{email}/email", response_model=List[invitation_schema.Invitation])
+@public
 async def get_user_invitations(email: EmailStr):
     documents = await invitation_model.get_by_fields({"email": email})
     invitations = [inv.to_response() for inv in documents]
@@ -45,6 +47,7 @@ async def list_restaurant_invitations(restaurant_id: str):
 
 
 @router.get("/{invitation_id}")
+@public
 async def get_invitation(invitation_id: str):
     invitation = await invitation_model.get(invitation_id)
     if not invitation:
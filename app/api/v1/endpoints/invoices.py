@@ -1,8 +1,10 @@
 from datetime import datetime
-from typing import Optional, Dict, Any
+from typing import Literal, Optional, Dict, Any
 
 from fastapi import APIRouter, HTTPException, Body, Query
 
+from app.api.responses import StreamingJSONArrayResponse
+from app.db.pagination import CountMode
 from app.schema import invoice as invoice_schema
 from app.services import invoice as invoice_service
 from app.services.invoice import invoice_model
@@ -44,7 +46,10 @@ async def paginate_invoices(
     cursor: Optional[str] = Query(None),
     restaurant_id: str = Query(..., alias="restaurantId"),
     from_date: datetime = Query(..., alias="fromDate"),
-    to_date: datetime = Query(..., alias="toDate")
+    to_date: datetime = Query(..., alias="toDate"),
+    sort_by: Literal["_id", "createdAt"] = Query("_id", alias="sortBy"),
+    descending: bool = Query(False),
+    count: CountMode = Query(CountMode.CACHED),
 ):
     try:
         filters: Dict[str, Any] = {
@@ -54,7 +59,14 @@ async def paginate_invoices(
                 "$lt": to_date
             }
         }
-        result = await invoice_model.paginate(filters=filters, limit=limit, cursor=cursor)
+        result = await invoice_model.paginate(
+            filters=filters,
+            limit=limit,
+            cursor=cursor,
+            sort_field=sort_by,
+            descending=descending,
+            count=count,
+        )
         return result
     except Exception as error:
         print(error)
@@ -127,8 +139,8 @@ async def cancel_invoice(invoice_id: str):
 
 @router.get("/")
 async def list_invoices():
-    invoices = await invoice_model.get_all()
-    return [i.to_response() for i in invoices]
+    invoices = invoice_model.iter_all()
+    return StreamingJSONArrayResponse(i.to_response() async for i in invoices)
 
 
 
@@ -2,13 +2,18 @@ from fastapi import APIRouter, HTTPException, UploadFile, File, Form
 from typing import Optional
 import json
 
-from app.utils.images import save_item_image, delete_item_image
+from app.api.route_policy import public
+from app.utils.images import (
+    save_item_image,
+    delete_item_image,
+    delete_image_variants,
+    responsive_image,
+)
 from app.services import category as category_service
 
 from app.schema import item as item_schema
 from app.services import item as item_service
 from app.services.item import item_model
-from app.utils.slug import generate_unique_slug
 
 router = APIRouter()
 
@@ -50,12 +55,13 @@ async def create_item(
             await item_model.delete(created.id)
             raise HTTPException(status_code=500, detail="Failed to upload item image")
 
-        slug = await generate_unique_slug(
-            name=created.name, model=item_schema.ItemDocument
-        )
+        image = responsive_image(upload)
         item = await item_model.update(
             created.id,
-            {"slug": slug, "imageUrl": upload.public_url},
+            {
+                "imageUrl": upload.public_url,
+                "image": image.model_dump() if image else None,
+            },
         )
 
         await category_service.add_item_to_category(category_id, str(created.id))
@@ -68,6 +74,7 @@ async def create_item(
 
 
 @router.get("/{item_id}")
+@public
 async def get_item(item_id: str):
     item = await item_service.get_item(item_id)
     if not item:
@@ -76,6 +83,7 @@ async def get_item(item_id: str):
 
 
 @router.get("/{item_slug}/slug")
+@public
 async def get_item_by_slug(item_slug: str):
     try:
         item = await item_service.get_item_by_slug(item_slug)
@@ -121,8 +129,13 @@ async def update_item_image(item_id: str, image_file: UploadFile = File(..., ali
 
         if item.image_url:
             await delete_item_image(item.image_url)
+        await delete_image_variants(item.image)
 
-        updated = await item_service.update_item(item_id, {"imageUrl": upload.public_url})
+        image = responsive_image(upload)
+        updated = await item_service.update_item(
+            item_id,
+            {"imageUrl": upload.public_url, "image": image.model_dump() if image else None},
+        )
         return updated.to_response()
     except HTTPException as http_error:
         print(str(http_error))
@@ -210,6 +223,7 @@ async def delete_customization_option(item_id: str, c_index: int, o_index: int):
 
 
 @router.get("/{category_id}/category")
+@public
 async def list_active_items(category_id: str):
     """Return all active items that belong to the given category."""
     items = await item_service.list_items_by_category(category_id)
@@ -1,11 +1,11 @@
 from fastapi import APIRouter, HTTPException, Body
 
+from app.api.route_policy import public
 from app.schema import menu as menu_schema
 from app.services import menu as menu_service
 from app.services import category as category_service
 from app.services import item as item_service
 from app.services.menu import menu_model
-from app.utils.slug import generate_unique_slug
 
 router = APIRouter()
 
@@ -13,12 +13,8 @@ router = APIRouter()
 async def create_menu(data: menu_schema.MenuCreate):
     try:
         menu = await menu_service.create_menu(data)
-        slug = await generate_unique_slug(name=menu.name, model=menu_schema.MenuDocument)
-        menu = await menu_model.update(menu.id, {"slug": slug})
         return menu.to_response()
     except Exception as error:
-        if menu:
-            await menu_model.delete(menu.id)
         raise HTTPException(status_code=500, detail=str(error))
 
 @router.delete("/{menu_id}")
@@ -68,6 +64,7 @@ async def activate_menu(menu_id: str):
         raise HTTPException(status_code=404, detail=str(error))
 
 @router.get("/{menu_id}")
+@public
 async def get_menu(menu_id: str):
     menu = await menu_service.get_menu(menu_id)
     if not menu:
@@ -75,6 +72,7 @@ async def get_menu(menu_id: str):
     return menu.to_response()
 
 @router.get("/slug/{slug}")
+@public
 async def get_menu_by_slug(slug: str):
     menu = await menu_service.get_menu_by_slug(slug)
     if not menu:
@@ -82,16 +80,19 @@ async def get_menu_by_slug(slug: str):
     return menu.to_response()
 
 @router.get("/restaurant/{restaurant_id}")
+@public
 async def list_restaurant_menus(restaurant_id: str):
     menus = await menu_service.list_menus(restaurant_id)
     return [m.to_response() for m in menus]
 
 @router.get("/{menu_id}/categories")
+@public
 async def list_menu_categories(menu_id: str):
     categories = await category_service.list_categories_for_menu(menu_id)
     return [c.to_response() for c in categories]
 
 @router.get("/items/slug/{menu_slug}")
+@public
 async def list_menu_items_by_slug(menu_slug: str):
     try:
         menu = await menu_model.get_by_slug(menu_slug)
@@ -1,15 +1,19 @@
-from typing import Optional, Dict, Any
+from typing import Literal, Optional, Dict, Any
 
 from fastapi import APIRouter, HTTPException, Body, Query
 
+from app.api.route_policy import public
 from app.schema import order as order_schema
 from app.services import order as order_service
 from app.services.order import order_model
+from app.api.responses import FastJSONResponse
+from app.db.pagination import CountMode
 
 router = APIRouter()
 
 
 @router.post("/")
+@public
 async def create_order(order_data: order_schema.OrderCreate = Body(..., alias="orderData"), session_id: str = Body(..., alias="sessionId")):
     """Create a new order and append it to the related session."""
     try:
@@ -23,11 +27,12 @@ async def create_order(order_data: order_schema.OrderCreate = Body(..., alias="o
 
 
 @router.post("/bulk")
+@public
 async def create_orders(
     orders_data: list[order_schema.OrderCreate] = Body(..., alias="ordersData"),
     session_id: str | None = Body(None, alias="sessionId"),
 ):
-    """Create multiple orders sequentially."""
+    """Create multiple orders in a single batch."""
     try:
         payloads = [data.model_dump(by_alias=True) for data in orders_data]
         orders = await order_service.place_orders(payloads, session_id)
@@ -41,13 +46,23 @@ async def create_orders(
 async def paginate_orders(
     limit: int = Query(10, gt=0),
     cursor: Optional[str] = Query(None),
+    sort_by: Literal["_id", "orderTime"] = Query("_id", alias="sortBy"),
+    descending: bool = Query(False),
+    count: CountMode = Query(CountMode.CACHED),
 ):
     try:
         filters: Dict[str, Any] = {}
 
-        result = await order_model.paginate(filters=filters, limit=limit, cursor=cursor)
+        result = await order_model.paginate(
+            filters=filters,
+            limit=limit,
+            cursor=cursor,
+            sort_field=sort_by,
+            descending=descending,
+            count=count,
+        )
 
-        return result
+        return FastJSONResponse(result)
     except Exception as error:
         print(error)
 
@@ -101,15 +116,16 @@ async def cancel_order_endpoint(order_id: str):
 
 
 @router.get("/sessions/{session_id}")
+@public
 async def list_session_orders(session_id: str):
     orders = await order_service.list_orders_for_session(session_id)
-    return [o.to_response() for o in orders]
+    return FastJSONResponse([o.to_response() for o in orders])
 
 
 @router.get("/restaurant/{restaurant_id}")
 async def list_restaurant_orders(restaurant_id: str):
     orders = await order_service.list_orders_for_restaurant(restaurant_id)
-    return [o.to_response() for o in orders]
+    return FastJSONResponse([o.to_response() for o in orders])
 
 
 @router.get("/restaurant/{restaurant_id}/recent")
@@ -120,7 +136,7 @@ async def list_recent_restaurant_orders(
     orders = await order_service.list_recent_orders_for_restaurant(
         restaurant_id, hours
     )
-    return [o.to_response() for o in orders]
+    return FastJSONResponse([o.to_response() for o in orders])
 
 
 @router.get("/status/{prep_status}")
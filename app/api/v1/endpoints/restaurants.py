@@ -9,7 +9,7 @@ from fastapi import (
     File,
     Request,
     HTTPException,
-    Query, Body,
+    Query, Body, Header, Response,
 )
 from pymongo.errors import DuplicateKeyError
 
@@ -29,9 +29,11 @@ from app.services.restaurant import (
     restaurant_model,
     change_current_menu,
     get_current_menu,
-    list_current_menu_items_by_slug,
 )
 from app.schema import restaurant as restaurant_schema
+from app.api.route_policy import public
+from app.api.responses import StreamingJSONArrayResponse
+from app.services.menu_snapshot import CompiledBody, get_menu_snapshot
 from app.services.roles import create_default_roles_for_restaurant
 from app.models.role import RoleModel
 from app.utils.auth import (
@@ -44,13 +46,13 @@ from app.utils.images import (
     RESTAURANT_BANNER,
     RESTAURANT_LOGO,
     validate_image_dimensions,
-    rename_restaurant_image,
     cleanup_restaurant_images,
     delete_restaurant_image,
+    delete_image_variants,
+    responsive_image,
     _blob_name_from_url,
 )
 from app.models.user import UserModel
-from app.utils.slug import generate_unique_slug
 
 router = APIRouter()
 
@@ -86,6 +88,7 @@ async def create(
     logo_file: Optional[UploadFile] = File(None),
     firebase_uid: str = Depends(get_current_user),
 ):
+    restaurant = None
     try:
         # Parse openingHours from form data
         form = await request.form()
@@ -104,134 +107,76 @@ async def create(
         # Create restaurant settings with opening hours
         settings = restaurant_schema.RestaurantSettings(openingHours=opening_hours)
 
-        # Save banner image
-        banner_content = await banner_file.read()
+        # Validate images from their headers before anything is stored
         is_valid, error_msg = validate_image_dimensions(
-            banner_content, RESTAURANT_BANNER
+            banner_file.file, RESTAURANT_BANNER
         )
         if not is_valid:
             raise HTTPException(status_code=400, detail=error_msg)
 
-        banner_file.file.seek(0)  # Reset file pointer after reading
-        banner_result = await save_restaurant_image(
-            image=banner_file,
-            restaurant_id="temp",  # Will be updated after restaurant creation
-            image_type=RESTAURANT_BANNER,
-        )
-
-        if not banner_result.success:
-            raise HTTPException(status_code=500, detail="Failed to upload banner image")
-
-        # Save logo image if provided
-        logo_url = None
         if logo_file:
-            logo_content = await logo_file.read()
             is_valid, error_msg = validate_image_dimensions(
-                logo_content, RESTAURANT_LOGO
+                logo_file.file, RESTAURANT_LOGO
             )
             if not is_valid:
-                # Clean up banner image before raising error
-                await cleanup_restaurant_images(
-                    "temp", RESTAURANT_BANNER, keep_latest=False
-                )
                 raise HTTPException(status_code=400, detail=error_msg)
 
-            logo_file.file.seek(0)  # Reset file pointer after reading
-            logo_result = await save_restaurant_image(
-                image=logo_file,
-                restaurant_id="temp",  # Will be updated after restaurant creation
-                image_type=RESTAURANT_LOGO,
-            )
-
-            if not logo_result.success:
-                # Clean up banner image before raising error
-                await cleanup_restaurant_images(
-                    "temp", RESTAURANT_BANNER, keep_latest=False
-                )
-                raise HTTPException(
-                    status_code=500, detail="Failed to upload logo image"
-                )
-
-            logo_url = logo_result.public_url
-
-        banner_url = banner_result.public_url
-        # Create restaurant data object
+        # Create the restaurant first so its images (and their variants) are
+        # stored under its final id and never need renaming
         restaurant_data = restaurant_schema.RestaurantCreate(
             name=name,
             address=address,
             description=description,
             phoneNumber=phone_number,
             settings=settings,
-            bannerUrl=banner_url,
-            logoUrl=logo_url,
+            bannerUrl="",
         )
 
         # Create restaurant in database
         restaurant = await create_restaurant(restaurant_data)
 
         if restaurant is None:
-            # Clean up uploaded images if restaurant creation fails
-            await cleanup_restaurant_images(
-                "temp", RESTAURANT_BANNER, keep_latest=False
-            )
-            if logo_file:
-                await cleanup_restaurant_images(
-                    "temp", RESTAURANT_LOGO, keep_latest=False
-                )
             raise HTTPException(status_code=500, detail="Failed to create restaurant")
 
-        # Update image paths with actual restaurant ID
-        # Rename banner
-        new_banner_blob_name = await rename_restaurant_image(
-            old_restaurant_id="temp",
-            new_restaurant_id=str(restaurant.id),
+        # Save banner image
+        banner_result = await save_restaurant_image(
+            image=banner_file,
+            restaurant_id=str(restaurant.id),
             image_type=RESTAURANT_BANNER,
-            blob_name=banner_result.blob_name,
         )
 
-        if not new_banner_blob_name:
-            # Clean up uploaded images if renaming fails
-            await cleanup_restaurant_images(
-                "temp", RESTAURANT_BANNER, keep_latest=False
-            )
-            if logo_file:
-                await cleanup_restaurant_images(
-                    "temp", RESTAURANT_LOGO, keep_latest=False
-                )
-            raise HTTPException(
-                status_code=500, detail="Failed to update banner image path"
-            )
+        if not banner_result.success:
+            raise HTTPException(status_code=500, detail="Failed to upload banner image")
 
-        # Rename logo if exists
+        # Save logo image if provided
+        logo_url = None
+        logo_image = None
         if logo_file:
-            new_logo_blob_name = await rename_restaurant_image(
-                old_restaurant_id="temp",
-                new_restaurant_id=str(restaurant.id),
+            logo_result = await save_restaurant_image(
+                image=logo_file,
+                restaurant_id=str(restaurant.id),
                 image_type=RESTAURANT_LOGO,
-                blob_name=logo_result.blob_name,
             )
 
-            if not new_logo_blob_name:
-                # Clean up uploaded images if renaming fails
-                await cleanup_restaurant_images(
-                    str(restaurant.id), RESTAURANT_BANNER, keep_latest=False
-                )
-                await cleanup_restaurant_images(
-                    "temp", RESTAURANT_LOGO, keep_latest=False
-                )
+            if not logo_result.success:
                 raise HTTPException(
-                    status_code=500, detail="Failed to update logo image path"
+                    status_code=500, detail="Failed to upload logo image"
                 )
 
-        # Update restaurant with image URLs
+            logo_url = logo_result.public_url
+            logo_image = responsive_image(logo_result)
 
-        slug = await generate_unique_slug(
-            name=restaurant.name, model=restaurant_schema.RestaurantDocument
-        )
+        # Update restaurant with image URLs
+        banner_image = responsive_image(banner_result)
 
-        await restaurant_model.update(
+        restaurant = await restaurant_model.update(
             str(restaurant.id),
-            {"bannerUrl": banner_result.public_url, "logoUrl": logo_url, "slug": slug},
+            {
+                "bannerUrl": banner_result.public_url,
+                "bannerImage": banner_image.model_dump() if banner_image else None,
+                "logoUrl": logo_url,
+                "logoImage": logo_image.model_dump() if logo_image else None,
+            },
         )
 
         # Add manager membership to the user
@@ -283,14 +228,14 @@ async def create(
     except Exception as e:
         print(str(e))
         # Clean up any uploaded images if restaurant creation fails
-        if "banner_result" in locals() and banner_result.success:
+        if restaurant:
+            restaurant_id = str(restaurant.id)
             await cleanup_restaurant_images(
-                "temp", RESTAURANT_BANNER, keep_latest=False
+                restaurant_id, RESTAURANT_BANNER, keep_latest=False
+            )
+            await cleanup_restaurant_images(
+                restaurant_id, RESTAURANT_LOGO, keep_latest=False
             )
-        if "logo_result" in locals() and logo_result.success:
-            await cleanup_restaurant_images("temp", RESTAURANT_LOGO, keep_latest=False)
-        if restaurant:
-            restaurant_id = restaurant.id
             await delete_restaurant(restaurant_id)
 
         raise HTTPException(status_code=500, detail=str(e))
@@ -302,6 +247,7 @@ async def deactivate_existing_restaurant(restaurant_id: str):
 
 
 @router.get("/{restaurant_id}")
+@public
 async def get_single_restaurant(restaurant_id: str):
     try:
         restaurant = await get_restaurant(restaurant_id)
@@ -314,6 +260,7 @@ async def get_single_restaurant(restaurant_id: str):
 
 
 @router.get("/slug/{slug}")
+@public
 async def get_restaurant_by_slug(slug: str):
     restaurant = await get_by_slug(slug)
     if not restaurant:
@@ -321,12 +268,28 @@ async def get_restaurant_by_slug(slug: str):
     return restaurant.to_response()
 
 
+def _compiled_response(compiled: CompiledBody, if_none_match: Optional[str]) -> Response:
+    headers = {"ETag": compiled.etag, "Cache-Control": "no-cache"}
+    if if_none_match and compiled.etag in [tag.strip() for tag in if_none_match.split(",")]:
+        return Response(status_code=304, headers=headers)
+    return Response(content=compiled.body, media_type="application/json", headers=headers)
+
+
+@router.get("/slug/{slug}/menu")
+@public
+async def get_current_menu_snapshot(slug: str, if_none_match: Optional[str] = Header(None)):
+    """Return the restaurant, its current menu and the menu's categories with their items."""
+    snapshot = await get_menu_snapshot(slug)
+    return _compiled_response(snapshot.menu, if_none_match)
+
+
 @router.get("/slug/{slug}/menu/items")
-async def list_current_menu_items(slug: str):
+@public
+async def list_current_menu_items(slug: str, if_none_match: Optional[str] = Header(None)):
     """Return all items in the restaurant's current menu identified by slug."""
     try:
-        items = await list_current_menu_items_by_slug(slug)
-        return [i.to_response() for i in items]
+        snapshot = await get_menu_snapshot(slug)
+        return _compiled_response(snapshot.items, if_none_match)
     except HTTPException:
         raise
     except Exception as error:
@@ -371,12 +334,10 @@ async def update_restaurant_banner(
     if not restaurant:
         raise HTTPException(status_code=404, detail="Restaurant not found")
 
-    content = await banner_file.read()
-    is_valid, error = validate_image_dimensions(content, RESTAURANT_BANNER)
+    is_valid, error = validate_image_dimensions(banner_file.file, RESTAURANT_BANNER)
     if not is_valid:
         raise HTTPException(status_code=400, detail=error)
 
-    banner_file.file.seek(0)
     upload = await save_restaurant_image(banner_file, restaurant_id, RESTAURANT_BANNER)
     if not upload.success:
         raise HTTPException(status_code=500, detail="Failed to upload banner image")
@@ -387,9 +348,12 @@ async def update_restaurant_banner(
             await delete_restaurant_image(
                 restaurant_id, RESTAURANT_BANNER, blob_name=blob
             )
+    await delete_image_variants(restaurant.banner_image)
 
+    image = responsive_image(upload)
     updated = await restaurant_model.update(
-        restaurant_id, {"bannerUrl": upload.public_url}
+        restaurant_id,
+        {"bannerUrl": upload.public_url, "bannerImage": image.model_dump() if image else None},
     )
     return updated.to_response()
 
@@ -403,12 +367,10 @@ async def update_restaurant_logo(
     if not restaurant:
         raise HTTPException(status_code=404, detail="Restaurant not found")
 
-    content = await logo_file.read()
-    is_valid, error = validate_image_dimensions(content, RESTAURANT_LOGO)
+    is_valid, error = validate_image_dimensions(logo_file.file, RESTAURANT_LOGO)
     if not is_valid:
         raise HTTPException(status_code=400, detail=error)
 
-    logo_file.file.seek(0)
     upload = await save_restaurant_image(logo_file, restaurant_id, RESTAURANT_LOGO)
     if not upload.success:
         raise HTTPException(status_code=500, detail="Failed to upload logo image")
@@ -419,9 +381,12 @@ async def update_restaurant_logo(
             await delete_restaurant_image(
                 restaurant_id, RESTAURANT_LOGO, blob_name=blob
             )
+    await delete_image_variants(restaurant.logo_image)
 
+    image = responsive_image(upload)
     updated = await restaurant_model.update(
-        restaurant_id, {"logoUrl": upload.public_url}
+        restaurant_id,
+        {"logoUrl": upload.public_url, "logoImage": image.model_dump() if image else None},
     )
     return updated.to_response()
 
@@ -433,6 +398,7 @@ async def change_current_menu_endpoint(restaurant_id: str, menu_id: str):
 
 
 @router.get("/{restaurant_id}/menu")
+@public
 async def get_current_menu_endpoint(restaurant_id: str):
     menu = await get_current_menu(restaurant_id)
     if not menu:
@@ -475,22 +441,11 @@ async def get_all_members(restaurant_id: str):
 
     try:
 
-        # Get all users who have a membership for this restaurant
-        users = await user_model.get_all()
-
-        # Filter users to only include those with active memberships for this restaurant
-        restaurant_members = []
-        for user in users:
-            for membership in user.memberships:
-                if membership:
-
-                    # Get the role to check if it belongs to this restaurant
-                    role = await role_model.get(membership.role_id)
-                    if role and role.restaurant_id == restaurant_id:
-                        restaurant_members.append(user.to_response())
-                        break
+        # Users with a membership in one of this restaurant's roles, streamed from the server
+        role_ids = [str(_id) for _id in await role_model.values("id", {"restaurantId": restaurant_id})]
+        members = user_model.iter_by_fields({"memberships.roleId": {"$in": role_ids}})
 
-        return restaurant_members
+        return StreamingJSONArrayResponse(user.to_response() async for user in members)
     except Exception as error:
         print(error)
 
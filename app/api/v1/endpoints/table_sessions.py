@@ -1,6 +1,8 @@
-from typing import Dict, Optional, Any
+from typing import Dict, Literal, Optional, Any
 
 from fastapi import APIRouter, HTTPException, Query, Depends
+from app.api.route_policy import public
+from app.db.pagination import CountMode
 from app.services import table_session as session_service
 from app.services.table_session import session_model
 from app.utils.auth import admin_required
@@ -12,11 +14,19 @@ router = APIRouter()
 async def paginate_sessions(
     limit: int = Query(10, gt=0),
     cursor: Optional[str] = Query(None),
+    sort_by: Literal["_id", "startTime"] = Query("_id", alias="sortBy"),
+    descending: bool = Query(False),
+    count: CountMode = Query(CountMode.CACHED),
 ):
     try:
         filters: Dict[str, Any] = {}
         result = await session_model.paginate(
-            filters=filters, limit=limit, cursor=cursor
+            filters=filters,
+            limit=limit,
+            cursor=cursor,
+            sort_field=sort_by,
+            descending=descending,
+            count=count,
         )
         return result
     except Exception as error:
@@ -24,6 +34,7 @@ async def paginate_sessions(
 
 
 @router.get("/active/{restaurant_id}/{table_number}")
+@public
 async def get_active_session_by_number(restaurant_id: str, table_number: str):
     try:
         session = await session_service.get_active_session_for_restaurant_table(
@@ -41,6 +52,7 @@ async def get_active_session_by_number(restaurant_id: str, table_number: str):
 
 
 @router.get("/active/{table_id}")
+@public
 async def get_active_session(table_id: str):
     try:
         session = await session_service.get_active_session_for_table(table_id)
@@ -109,6 +121,7 @@ async def pay_session(session_id: str):
 
 
 @router.post("/{session_id}/needs-bill")
+@public
 async def mark_session_needs_bill_endpoint(session_id: str):
     try:
         session = await session_service.mark_session_needs_bill(session_id)
@@ -121,6 +134,7 @@ async def mark_session_needs_bill_endpoint(session_id: str):
 
 
 @router.post("/{session_id}/cancel-checkout")
+@public
 async def cancel_session_checkout_endpoint(session_id: str):
     try:
         session = await session_service.cancel_session_checkout(session_id)
@@ -133,6 +147,7 @@ async def cancel_session_checkout_endpoint(session_id: str):
 
 
 @router.post("/{session_id}/request-assistance")
+@public
 async def mark_session_needs_assistance_endpoint(session_id: str):
     try:
         session = await session_service.mark_session_needs_assistance(session_id)
@@ -145,6 +160,7 @@ async def mark_session_needs_assistance_endpoint(session_id: str):
 
 
 @router.post("/{session_id}/cancel-assistance")
+@public
 async def cancel_session_assistance_endpoint(session_id: str):
     try:
         session = await session_service.cancel_session_assistance(session_id)
@@ -1,6 +1,7 @@
 from fastapi import APIRouter, HTTPException, Query, Depends
 from typing import Optional, Dict, Any
 
+from app.api.route_policy import public
 from app.models.table import TableModel
 from app.schema import table as table_schema
 from app.services import table as table_service
@@ -39,6 +40,7 @@ async def create_table(data: table_schema.TableCreate):
 
 
 @router.get("/{table_id}")
+@public
 async def get_table(table_id: str):
     table = await table_service.get_table(table_id)
     if not table:
@@ -52,6 +54,13 @@ async def list_tables(restaurant_id: str):
     return [t.to_response() for t in tables]
 
 
+@router.post("/restaurant/{restaurant_id}/renumber")
+async def renumber_tables(restaurant_id: str):
+    """Make the restaurant's table numbers sequential starting at 1."""
+    tables = await table_service.organize_table_numbers(restaurant_id)
+    return [t.to_response() for t in tables]
+
+
 @router.put("/{table_id}")
 async def update_table(table_id: str, data: table_schema.TableUpdate):
     updated = await table_service.update_table(table_id, data)
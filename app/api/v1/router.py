@@ -1,5 +1,7 @@
 from fastapi import APIRouter
 
+from app.api.route_policy import mark_public
+
 from app.api.v1.endpoints.auth import router as auth_router
 from app.api.v1.endpoints.stock import router as stock_router
 from app.api.v1.endpoints.movements import router as movements_router
@@ -32,6 +34,10 @@ from app.api.v1.endpoints.reports import router as reports_router
 
 router = APIRouter()
 
+# Customer-facing routers: the blog is public as a whole; every other router marks
+# its customer-facing endpoints with ``@public`` and keeps the rest authenticated
+mark_public(blog_router)
+
 
 router.include_router(blog_router, prefix="/blog", tags=["Blog"])
 router.include_router(invitation_router, prefix="/invitations", tags=["Invitation"])
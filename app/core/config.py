@@ -33,6 +33,19 @@ class Settings(BaseSettings):
     # MongoDB Config
     MONGO_DB_URI: str
     MONGO_DB_DATABASE_NAME: str = Field(default="neemble_eat_db")
+    # Evict cached reads written by other workers through a change stream (needs a replica set)
+    CACHE_INVALIDATION_STREAM: bool = Field(default=False)
+    # Drop indexes no schema declares when syncing at startup (otherwise they are only reported)
+    MONGO_DROP_UNDECLARED_INDEXES: bool = Field(default=False)
+    # Record the shape of every query for the /diagnostics query plan audits
+    QUERY_AUDIT: bool = Field(default=False)
+
+    # Keep every /api/v1/ route public while clients move to the route-level public markers;
+    # off by default so only routes marked ``@public`` skip authentication
+    AUTH_PUBLIC_API_FALLBACK: bool = Field(default=False)
+
+    # Websocket fan-out: "memory" (single worker) or "mongo" (capped collection shared by all workers)
+    WEBSOCKET_BROKER: str = Field(default="memory")
 
     # Firebase/Auth settings
     FIREBASE_SERVICE_ACCOUNT_KEY: str
@@ -40,6 +53,9 @@ class Settings(BaseSettings):
 
     # Cloud Storage config
     BUCKET_NAME: str
+    # Processes decoding/encoding uploaded images (0 runs them on threads) and concurrent storage calls
+    IMAGE_PROCESS_WORKERS: int = Field(default=2)
+    STORAGE_IO_CONCURRENCY: int = Field(default=8)
 
     # Google Cloud
     GOOGLE_CLOUD_SERVICE_ACCOUNT_KEY: str
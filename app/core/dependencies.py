@@ -25,7 +25,8 @@ from app.schema import (
     payment_history,
     subscription_plan,
     user_subscription,
-    notification
+    notification,
+    restaurant_metrics
 
 
 )
@@ -99,6 +100,8 @@ def get_mongo():
             payment_history.PaymentHistoryDocument,
             subscription_plan.SubscriptionPlanDocument,
             user_subscription.UserSubscriptionDocument,
-            notification.NotificationDocument
-        ]
+            notification.NotificationDocument,
+            restaurant_metrics.RestaurantMetricsHourlyDocument
+        ],
+        drop_undeclared_indexes=settings.MONGO_DROP_UNDECLARED_INDEXES,
     )
\ No newline at end of file
@@ -0,0 +1,152 @@
+import asyncio
+from dataclasses import dataclass, asdict
+from threading import Lock
+from typing import Any, Callable, Dict, Iterable, List, Mapping, Optional
+
+from cachetools import TTLCache
+from motor.motor_asyncio import AsyncIOMotorDatabase
+from pymongo.errors import PyMongoError
+
+
+@dataclass
+class CacheStats:
+    hits: int = 0
+    misses: int = 0
+    invalidations: int = 0
+
+
+class DocumentCache:
+    """Read-through cache of raw Mongo documents keyed by ``_id``.
+
+    Entries expire after ``ttl`` seconds and the least recently used ones are
+    evicted once ``maxsize`` is reached. Raw documents are stored (not the
+    validated Beanie instances) so callers always receive their own copy and
+    can mutate it freely.
+    """
+
+    def __init__(self, name: str, ttl: float = 60, maxsize: int = 1024):
+        self.name = name
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self.stats = CacheStats()
+        self._entries: TTLCache = TTLCache(maxsize=maxsize, ttl=ttl)
+        self._lock = Lock()
+
+    def get(self, _id: Any) -> Optional[Mapping[str, Any]]:
+        with self._lock:
+            raw = self._entries.get(str(_id))
+            if raw is None:
+                self.stats.misses += 1
+            else:
+                self.stats.hits += 1
+            return raw
+
+    def set(self, raw: Mapping[str, Any]) -> None:
+        with self._lock:
+            self._entries[str(raw["_id"])] = raw
+
+    def invalidate(self, _id: Any) -> None:
+        with self._lock:
+            if self._entries.pop(str(_id), None) is not None:
+                self.stats.invalidations += 1
+
+    def invalidate_many(self, ids: Iterable[Any]) -> None:
+        for _id in ids:
+            self.invalidate(_id)
+
+    def clear(self) -> None:
+        with self._lock:
+            self.stats.invalidations += len(self._entries)
+            self._entries.clear()
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                **asdict(self.stats),
+                "size": len(self._entries),
+                "maxsize": self.maxsize,
+                "ttl": self.ttl,
+            }
+
+
+_caches: Dict[str, DocumentCache] = {}
+
+
+def document_cache(name: str, ttl: float = 60, maxsize: int = 1024) -> DocumentCache:
+    """Return the process-wide cache for collection ``name``, creating it on first use.
+
+    Every service builds its own model instances, so caches are shared per
+    collection to keep invalidation in one place.
+    """
+    cache = _caches.get(name)
+    if cache is None:
+        cache = _caches[name] = DocumentCache(name, ttl=ttl, maxsize=maxsize)
+    return cache
+
+
+_write_listeners: Dict[str, List[Callable[[Any], None]]] = {}
+
+
+def on_write(name: str, callback: Callable[[Any], None]) -> None:
+    """Call ``callback(document)`` whenever a ``MongoCrud`` model writes to collection ``name``.
+
+    Used by derived caches (e.g. compiled menu snapshots) that are keyed by
+    something other than the written document's ``_id``.
+    """
+    _write_listeners.setdefault(name, []).append(callback)
+
+
+def notify_write(name: str, document: Any) -> None:
+    for callback in _write_listeners.get(name, ()):
+        try:
+            callback(document)
+        except Exception as error:
+            print(f"Write listener for {name} failed: {error}")
+
+
+def invalidate(name: str, _id: Any) -> None:
+    cache = _caches.get(name)
+    if cache:
+        cache.invalidate(_id)
+
+
+def clear_all() -> None:
+    for cache in _caches.values():
+        cache.clear()
+
+
+def get_cache_stats() -> Dict[str, Dict[str, Any]]:
+    return {name: cache.snapshot() for name, cache in _caches.items()}
+
+
+async def watch_invalidations(db: AsyncIOMotorDatabase, retry_delay: float = 5) -> None:
+    """Evict cached documents written by other workers, using a Mongo change stream.
+
+    Only the cached collections are watched, and only for the ``_id`` of each
+    changed document. Change streams require a replica set; on a standalone
+    server this logs once and returns, leaving the TTL as the only bound on
+    staleness. If the stream breaks, every cache is cleared (events may have
+    been missed) before reconnecting.
+    """
+    pipeline = [
+        {"$match": {
+            "ns.coll": {"$in": list(_caches)},
+            "operationType": {"$in": ["update", "replace", "delete"]},
+        }},
+        {"$project": {"ns.coll": 1, "documentKey._id": 1, "operationType": 1}},
+    ]
+    while True:
+        try:
+            async with db.watch(pipeline) as stream:
+                async for change in stream:
+                    invalidate(change["ns"]["coll"], change["documentKey"]["_id"])
+        except asyncio.CancelledError:
+            raise
+        except PyMongoError as error:
+            if getattr(error, "code", None) == 40573:
+                print(f"Cache invalidation stream unavailable (no replica set): {error}")
+                return
+            print(f"Cache invalidation stream interrupted, reconnecting: {error}")
+            clear_all()
+            await asyncio.sleep(retry_delay)
+
@@ -3,13 +3,22 @@ from datetime import datetime
 from beanie import Document, PydanticObjectId
 from beanie.odm.operators.find.logical import LogicalOperatorForListOfExpressions
 from bson import ObjectId
-from typing import Any, Dict, List, Optional, Type, TypeVar, Generic, Union, Mapping
+from typing import Any, AsyncIterator, Dict, List, Optional, Sequence, Tuple, Type, TypeVar, Generic, Union, Mapping
 
-from motor.motor_asyncio import AsyncIOMotorCollection
+from motor.motor_asyncio import AsyncIOMotorCollection, AsyncIOMotorCursor
 from pydantic import Field, BaseModel
 from pymongo import DESCENDING
 
-from app.schema.collection_id.object_id import PyObjectId
+from app.db.cache import DocumentCache, notify_write
+from app.db.rows import Row, row_type
+from app.db.pagination import (
+    CountMode,
+    encode_cursor,
+    keyset_filter,
+    sort_spec,
+    total_count,
+)
+from app.db.query_audit import record_query
 from app.utils.time import now_in_luanda
 
 T = TypeVar("T", bound=Document)
@@ -26,8 +35,8 @@ def to_object_id(_id: str) -> PydanticObjectId:
 
 class PaginationResult[T](BaseModel):
     items: List[T]
-    next_cursor: Optional[PyObjectId] = Field(default=None, alias="nextCursor")
-    total_count: int = Field(..., alias="totalCount")
+    next_cursor: Optional[str] = Field(default=None, alias="nextCursor")
+    total_count: Optional[int] = Field(default=None, alias="totalCount")
     has_more: bool = Field(..., alias="hasMore")
 
     model_config = {
@@ -39,10 +48,12 @@ class PaginationResult[T](BaseModel):
 
 class MongoCrud(Generic[T]):
 
-    def __init__(self, model: Type[T]):
+    def __init__(self, model: Type[T], cache: Optional[DocumentCache] = None):
         if not issubclass(model, Document):
             raise ValueError("model must be a Beanie Document")
         self.model = model
+        # Optional read-through cache for ``get``/``get_many``, invalidated by ``update``/``delete``
+        self.cache = cache
 
     def _sort_by_created_at(self, documents: List[T], descending: bool = True) -> List[T]:
         return sorted(documents, key=lambda doc: doc.created_at, reverse=descending)
@@ -53,6 +64,10 @@ class MongoCrud(Generic[T]):
     def _get_collection(self) -> AsyncIOMotorCollection:
         return self.model.get_motor_collection()
 
+    def _notify_write(self, document: Optional[T]) -> None:
+        if document is not None:
+            notify_write(self.model.Settings.name, document)
+
     async def get_document_count(self) -> int:
         return await self._get_collection().count_documents({})
 
@@ -61,19 +76,53 @@ class MongoCrud(Generic[T]):
         data["updated_at"] = now_in_luanda()
 
         document = self.model(**data)
-        return await document.insert()
+        document = await document.insert()
+        self._notify_write(document)
+        return document
+
+    async def create_many(self, data_list: List[Dict[str, Any]]) -> List[T]:
+        """Insert several documents with a single ``insert_many`` round trip."""
+        now = now_in_luanda()
+        documents = []
+        for data in data_list:
+            data["created_at"] = now
+            data["updated_at"] = now
+            documents.append(self.model(**data))
+
+        if not documents:
+            return []
+
+        result = await self.model.insert_many(documents)
+        for document, inserted_id in zip(documents, result.inserted_ids):
+            document.id = inserted_id
+            self._notify_write(document)
+        return documents
 
     async def get_all(self) -> List[T]:
         documents = await self._get_collection().find().to_list()
         return [self._validate(doc) for doc in documents]
 
+    def invalidate(self, _id: Any) -> None:
+        """Drop ``_id`` from the read cache; call after writing to the collection directly."""
+        if self.cache:
+            self.cache.invalidate(_id)
+
     async def get_many(self, ids: List[str]) -> List[T]:
         try:
             object_ids = [to_object_id(id) for id in ids]
-            collection = self._get_collection()
-            documents = await collection.find(
-                {"_id": {"$in": object_ids}}
-            ).to_list()
+            documents = []
+            if self.cache:
+                documents = [raw for raw in map(self.cache.get, object_ids) if raw is not None]
+                cached = {raw["_id"] for raw in documents}
+                object_ids = [_id for _id in object_ids if _id not in cached]
+            if object_ids:
+                fetched = await self._get_collection().find(
+                    {"_id": {"$in": object_ids}}
+                ).to_list()
+                if self.cache:
+                    for raw in fetched:
+                        self.cache.set(raw)
+                documents.extend(fetched)
             return [self._validate(doc) for doc in documents]
         except Exception as error:
             print("Error trying to fetch it all")
@@ -81,9 +130,13 @@ class MongoCrud(Generic[T]):
 
     async def get(self, _id: str) -> Optional[T]:
         try:
-            raw = await self._get_collection().find_one({"_id": ObjectId(_id)})
-            if not raw:
-                return None
+            raw = self.cache.get(_id) if self.cache else None
+            if raw is None:
+                raw = await self._get_collection().find_one({"_id": ObjectId(_id)})
+                if not raw:
+                    return None
+                if self.cache:
+                    self.cache.set(raw)
             document = self._validate(raw)
             return document
         except Exception as e:
@@ -93,7 +146,9 @@ class MongoCrud(Generic[T]):
 
     async def get_by_slug(self, slug: str, slug_field: str = "slug") -> Optional[T]:
         try:
-            raw = await self.model.get_motor_collection().find_one({slug_field: slug})
+            collection = self._get_collection()
+            record_query(collection, {slug_field: slug})
+            raw = await collection.find_one({slug_field: slug})
             if not raw:
                 return None
             return self.model.model_validate(raw)
@@ -101,10 +156,123 @@ class MongoCrud(Generic[T]):
             print(f"❌ Failed to retrieve document by slug {slug}: {e}")
             return None
 
+    async def count(self, filters: Dict[str, Any]) -> int:
+        collection = self._get_collection()
+        record_query(collection, filters)
+        return await collection.count_documents(filters)
+
+    async def aggregate(self, pipeline: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Run an aggregation pipeline on the server and return the raw result documents."""
+        return await self._get_collection().aggregate(pipeline).to_list(None)
+
+    # -----------------------------------------------------------------
+    # Lean reads: projected raw documents, no Pydantic validation
+    # -----------------------------------------------------------------
+
+    def _key(self, field: str) -> str:
+        """Document key of a model field given by attribute name or alias."""
+        if field == "id":
+            return "_id"
+        info = self.model.model_fields.get(field)
+        return info.alias if info and info.alias else field
+
+    def projection(self, fields: Sequence[str]) -> Dict[str, int]:
+        """Projection spec for ``fields`` (attribute names or aliases); ``_id`` is always included."""
+        return {self._key(field): 1 for field in fields}
+
+    def _find(
+            self,
+            filters: Dict[str, Any],
+            fields: Optional[Sequence[str]] = None,
+            sort: Optional[List[Tuple[str, int]]] = None,
+            skip: int = 0,
+            limit: int = 0,
+            batch_size: Optional[int] = None,
+    ) -> AsyncIOMotorCursor:
+        collection = self._get_collection()
+        record_query(collection, filters, sort)
+        cursor = collection.find(filters, self.projection(fields) if fields else None)
+        if sort:
+            cursor = cursor.sort(sort)
+        if skip:
+            cursor = cursor.skip(skip)
+        if limit:
+            cursor = cursor.limit(limit)
+        if batch_size:
+            cursor = cursor.batch_size(batch_size)
+        return cursor
+
+    async def find_raw(
+            self,
+            filters: Dict[str, Any],
+            fields: Optional[Sequence[str]] = None,
+            sort: Optional[List[Tuple[str, int]]] = None,
+            skip: int = 0,
+            limit: int = 0,
+    ) -> List[Dict[str, Any]]:
+        """Raw documents matching ``filters``, restricted to ``fields`` when given. ``limit=0`` means no limit."""
+        return await self._find(filters, fields, sort, skip, limit).to_list(None)
+
+    async def find_rows(
+            self,
+            filters: Dict[str, Any],
+            fields: Sequence[str],
+            sort: Optional[List[Tuple[str, int]]] = None,
+            skip: int = 0,
+            limit: int = 0,
+    ) -> List[Row]:
+        """Like ``find_raw`` but as ``Row`` objects, read by attribute name: ``row.current_session_id``."""
+        cls = row_type([(field, self._key(field)) for field in fields])
+        return [cls(raw) for raw in await self._find(filters, fields, sort, skip, limit).to_list(None)]
+
+    async def values(self, field: str, filters: Dict[str, Any]) -> List[Any]:
+        """The non-null values of one field across the matching documents, in natural order."""
+        key = self._key(field)
+        documents = await self._find(filters, [key]).to_list(None)
+        return [doc[key] for doc in documents if doc.get(key) is not None]
+
+    async def stream(
+            self,
+            filters: Dict[str, Any],
+            fields: Optional[Sequence[str]] = None,
+            sort: Optional[List[Tuple[str, int]]] = None,
+            batch_size: int = 500,
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """Yield raw documents one at a time, fetching ``batch_size`` per round trip."""
+        async for raw in self._find(filters, fields, sort, batch_size=batch_size):
+            yield raw
+
+    async def iter_by_fields(
+            self,
+            filters: Dict[str, Any],
+            batch_size: int = 500,
+            sort: Optional[List[Tuple[str, int]]] = None,
+    ) -> AsyncIterator[T]:
+        """Yield validated documents matching ``filters``, ``batch_size`` per round trip.
+
+        Memory stays constant however many documents match; prefer this over
+        ``get_all``/``get_by_fields(limit=0)`` on collections that keep growing.
+        """
+        async for raw in self.stream(filters, sort=sort, batch_size=batch_size):
+            yield self._validate(raw)
+
+    def iter_all(self, batch_size: int = 500) -> AsyncIterator[T]:
+        """Yield every document of the collection, see ``iter_by_fields``."""
+        return self.iter_by_fields({}, batch_size=batch_size)
+
+    async def aggregate_iter(
+            self, pipeline: List[Dict[str, Any]], batch_size: int = 500
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """Yield the raw results of an aggregation pipeline as the server produces them."""
+        async for document in self._get_collection().aggregate(pipeline, batchSize=batch_size):
+            yield document
+
     async def get_by_fields(
             self, filters: Dict[str, Any] | LogicalOperatorForListOfExpressions, skip: int = 0, limit: int = 100
     ) -> List[T]:
-        documents = await self._get_collection().find(filters).skip(skip).limit(limit).to_list()
+        collection = self._get_collection()
+        record_query(collection, filters)
+        documents = await collection.find(filters).skip(skip).limit(limit).to_list()
         return [self._validate(doc) for doc in documents]
 
     async def update(self, _id: str, data: Dict[str, Any]) -> Optional[T]:
@@ -119,11 +287,14 @@ class MongoCrud(Generic[T]):
             {"$set": data}
         )
 
+        self.invalidate(_id)
+
         if result.matched_count == 0:
             return None
 
         # Return the updated document
         updated_doc = await self.get(_id)
+        self._notify_write(updated_doc)
         return updated_doc
 
 
@@ -131,6 +302,8 @@ class MongoCrud(Generic[T]):
         document = await self.get(_id)
         if document:
             await self._get_collection().delete_one({"_id": ObjectId(_id)})
+            self.invalidate(_id)
+            self._notify_write(document)
             return True
         return False
 
@@ -138,32 +311,58 @@ class MongoCrud(Generic[T]):
                        filters: Dict[str, Any],
                        limit: int = 10,
                        cursor: Optional[str] = None,
-                       descending: bool = False) -> PaginationResult[T]:
-
+                       descending: bool = False,
+                       sort_field: str = "_id",
+                       count: CountMode = CountMode.CACHED,
+                       projection: Optional[Dict[str, Any]] = None) -> PaginationResult:
+        """Return one page of ``filters`` in ``(sort_field, _id)`` order.
+
+        ``cursor`` is the ``nextCursor`` of the previous page; pages are found
+        by keyset so deep pages cost the same as the first one, provided an
+        index on the filter fields followed by ``sort_field`` (and ``_id``)
+        exists, see ``app.db.query_audit.audit_queries``. ``count``
+        chooses how ``totalCount`` is filled. With a ``projection`` the items
+        are the projected raw documents (``_id`` as a string) instead of
+        validated models.
+        """
         query = filters.copy()
-
-        sort_direction = -1 if descending else 1
-
         if cursor:
-            query["_id"] = {'$lt' if descending else '$gt': ObjectId(cursor)}
+            after = keyset_filter(sort_field, descending, cursor)
+            query = {"$and": [query, after]} if query else after
+
+        sort = sort_spec(sort_field, descending)
+        lean = projection is not None
+        if lean:
+            # The cursor is built from ``_id`` and ``sort_field``, so the page must carry both.
+            # MongoDB rejects mixing inclusions with exclusions: an inclusion projection gains
+            # ``sort_field``, an exclusion projection just stops excluding it.
+            projection = {key: value for key, value in projection.items() if key != "_id"}
+            inclusive = any(value not in (0, False) for value in projection.values())
+            if inclusive:
+                projection[sort_field] = 1
+            else:
+                projection.pop(sort_field, None)
+            projection = projection or None
 
         collection = self._get_collection()
+        record_query(collection, filters, sort, paginated=True)
 
-        raw = await collection.find(query).sort({"_id": sort_direction}).limit(limit + 1).to_list()
-
-        documents = [self._validate(doc) for doc in raw]
-
-        items = documents[:limit]
+        raw = await collection.find(query, projection).sort(sort).limit(limit + 1).to_list()
 
-        has_more = len(documents) > limit
+        has_more = len(raw) > limit
+        raw = raw[:limit]
+        next_cursor = encode_cursor(sort_field, raw[-1]) if has_more else None
 
-        next_cursor = str(items[-1].id) if has_more else None
+        if lean:
+            items = [{**doc, "_id": str(doc["_id"])} for doc in raw]
+        else:
+            items = [self._validate(doc) for doc in raw]
 
-        total_count = await self.model.find(filters).count()
+        total = await total_count(collection, filters, count)
 
-        return PaginationResult[T](
+        return PaginationResult(
             items=items,
             next_cursor=next_cursor,
-            totalCount=total_count,
+            totalCount=total,
             hasMore=has_more
         )
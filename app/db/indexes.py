@@ -0,0 +1,138 @@
+"""Declared indexes and the queries they are meant to serve.
+
+Every document declares its indexes in ``Settings.indexes``, one compound
+index per query shape, equality fields first and the sort/range field last.
+``sync_indexes`` makes the server match those declarations at startup:
+missing indexes are created, indexes whose keys or options changed are
+rebuilt, and indexes no document declares are reported, and dropped only
+when asked. Beanie's own index step is skipped in favour of this one, as it
+can only fix a changed index by dropping every undeclared index too.
+
+Which queries those indexes actually serve is checked by
+``app.db.query_audit``.
+"""
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterable, List, Tuple, Type
+
+from beanie import Document
+from motor.motor_asyncio import AsyncIOMotorCollection, AsyncIOMotorDatabase
+from pymongo import IndexModel
+from pymongo.errors import PyMongoError
+
+# Options that change what an index does; anything else the server reports (v, ns, ...) is ignored
+_INDEX_OPTIONS = ("unique", "sparse", "expireAfterSeconds", "partialFilterExpression")
+
+
+@dataclass
+class IndexSyncReport:
+    collection: str
+    created: List[str] = field(default_factory=list)
+    rebuilt: List[str] = field(default_factory=list)
+    undeclared: List[str] = field(default_factory=list)
+    dropped: List[str] = field(default_factory=list)
+    errors: List[str] = field(default_factory=list)
+
+
+def declared_indexes(model: Type[Document]) -> List[Dict[str, Any]]:
+    """Index specs of ``model.Settings.indexes`` as ``{"key": {field: direction}, "name": ..., **options}``."""
+    specs = []
+    for index in getattr(model.Settings, "indexes", None) or []:
+        if not isinstance(index, IndexModel):
+            index = IndexModel(index)
+        specs.append(index.document)
+    return specs
+
+
+def _key(spec: Dict[str, Any]) -> List[Tuple[str, Any]]:
+    # The server may hand back 1.0 for an index created as 1
+    return [(name, int(direction) if isinstance(direction, float) else direction)
+            for name, direction in spec["key"].items()]
+
+
+def _options(spec: Dict[str, Any]) -> Dict[str, Any]:
+    return {option: spec[option] for option in _INDEX_OPTIONS if spec.get(option) not in (None, False)}
+
+
+def _same_index(declared: Dict[str, Any], existing: Dict[str, Any]) -> bool:
+    return _key(declared) == _key(existing) and _options(declared) == _options(existing)
+
+
+def _index_model(spec: Dict[str, Any]) -> IndexModel:
+    """``IndexModel`` for a declared spec or for one listed by the server (minus its ``v`` and ``ns``)."""
+    options = {k: v for k, v in spec.items() if k not in ("key", "v", "ns")}
+    return IndexModel(list(spec["key"].items()), **options)
+
+
+async def sync_collection_indexes(
+        collection: AsyncIOMotorCollection,
+        declared: List[Dict[str, Any]],
+        drop_undeclared: bool = False,
+) -> IndexSyncReport:
+    report = IndexSyncReport(collection=collection.name)
+    existing = {spec["name"]: spec async for spec in collection.list_indexes()}
+    kept = {"_id_"}
+
+    for spec in declared:
+        name = spec["name"]
+        # The same keys may already be built under another name; the server refuses a second copy
+        current = existing.get(name) or next(
+            (other for other in existing.values() if _key(other) == _key(spec)), None
+        )
+        if current is not None and _same_index(spec, current):
+            kept.add(current["name"])
+            continue
+
+        if current is None:
+            try:
+                await collection.create_indexes([_index_model(spec)])
+                report.created.append(name)
+                kept.add(name)
+            except PyMongoError as error:
+                report.errors.append(f"{name}: {error}")
+            continue
+
+        # The server refuses a second index on the same keys, so the old one has to go first
+        kept.add(current["name"])
+        try:
+            await collection.drop_index(current["name"])
+        except PyMongoError as error:
+            report.errors.append(f"{name}: {error}")
+            continue
+        try:
+            await collection.create_indexes([_index_model(spec)])
+            report.rebuilt.append(name)
+        except PyMongoError as error:
+            # Duplicate keys for a new unique index, a rejected option, an interrupted build:
+            # put the old index back rather than leave its queries without one
+            report.errors.append(f"{name}: {error}")
+            try:
+                await collection.create_indexes([_index_model(current)])
+                report.errors.append(f"{name}: kept the previous definition of {current['name']}")
+            except PyMongoError as restore_error:
+                report.errors.append(f"{current['name']}: could not be restored: {restore_error}")
+
+    for name in existing:
+        if name in kept:
+            continue
+        report.undeclared.append(name)
+        if drop_undeclared:
+            try:
+                await collection.drop_index(name)
+                report.dropped.append(name)
+            except PyMongoError as error:
+                report.errors.append(f"{name}: {error}")
+
+    return report
+
+
+async def sync_indexes(
+        database: AsyncIOMotorDatabase,
+        document_models: Iterable[Type[Document]],
+        drop_undeclared: bool = False,
+) -> List[IndexSyncReport]:
+    """Create, rebuild and optionally drop indexes so each collection matches its document's ``Settings.indexes``."""
+    reports = []
+    for model in document_models:
+        collection = database[model.Settings.name]
+        reports.append(await sync_collection_indexes(collection, declared_indexes(model), drop_undeclared))
+    return reports
@@ -5,14 +5,24 @@ from motor.motor_asyncio import AsyncIOMotorDatabase, AsyncIOMotorClient
 from beanie import init_beanie
 from pymongo.errors import PyMongoError
 
+from app.db.indexes import IndexSyncReport, sync_indexes
+
 
 class MongoDBClient:
-    def __init__(self, mongo_uri: str, database_name: str, document_models: list[Type[Document]] = None):
+    def __init__(
+            self,
+            mongo_uri: str,
+            database_name: str,
+            document_models: list[Type[Document]] = None,
+            drop_undeclared_indexes: bool = False,
+    ):
         self.mongo_uri = mongo_uri
         self.document_models = document_models if document_models is not None else []
         self.database_name = database_name
+        self.drop_undeclared_indexes = drop_undeclared_indexes
         self.client: AsyncIOMotorClient | None = None
         self.db: AsyncIOMotorDatabase | None = None
+        self.index_reports: list[IndexSyncReport] = []
 
     async def init_db(self) -> None:
         try:
@@ -21,13 +31,28 @@ class MongoDBClient:
 
             await self.ping()
 
-            await init_beanie(database=self.db, document_models=self.document_models)
+            # Indexes are synced below, where changed ones can be rebuilt without dropping the rest
+            await init_beanie(database=self.db, document_models=self.document_models, skip_indexes=True)
 
             print("✅ MongoDB connection established and Beanie initialized.")
+
+            await self.sync_indexes()
         except Exception as e:
             print(f"❌ Error initializing MongoDB: {e}")
             raise
 
+    async def sync_indexes(self) -> None:
+        self.index_reports = await sync_indexes(self.db, self.document_models, self.drop_undeclared_indexes)
+        for report in self.index_reports:
+            if report.created or report.rebuilt or report.dropped:
+                print(f"🔧 Indexes on {report.collection}: created {report.created}, "
+                      f"rebuilt {report.rebuilt}, dropped {report.dropped}")
+            if report.undeclared and not report.dropped:
+                print(f"⚠️ Undeclared indexes on {report.collection}: {report.undeclared}")
+            for error in report.errors:
+                print(f"❌ Failed to sync index on {report.collection}: {error}")
+        print("✅ MongoDB indexes synced.")
+
     async def close_connection(self) -> None:
         if self.client:
             self.client.close()
@@ -0,0 +1,82 @@
+import base64
+import binascii
+from enum import Enum
+from typing import Any, Dict, List, Optional, Tuple
+
+from bson import ObjectId, json_util
+from cachetools import TTLCache
+from motor.motor_asyncio import AsyncIOMotorCollection
+
+
+class CountMode(str, Enum):
+    EXACT = "exact"          # count_documents on every page
+    CACHED = "cached"        # count_documents, reused for COUNT_TTL seconds per filter
+    ESTIMATED = "estimated"  # collection metadata, O(1); only used without filters, otherwise CACHED
+    NONE = "none"            # no count, ``totalCount`` is null
+
+
+# Totals may lag writes by this many seconds in CACHED mode
+COUNT_TTL = 30
+_counts: TTLCache = TTLCache(maxsize=2048, ttl=COUNT_TTL)
+
+
+def encode_cursor(sort_field: str, document: Dict[str, Any]) -> str:
+    """Opaque token pointing just after ``document`` in a ``(sort_field, _id)`` ordering.
+
+    ``_id``-only cursors stay plain ObjectId strings, as they have always been.
+    """
+    if sort_field == "_id":
+        return str(document["_id"])
+    raw = json_util.dumps([document.get(sort_field), document["_id"]])
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def decode_cursor(sort_field: str, token: str) -> Tuple[Any, ObjectId]:
+    """Return ``(sort_value, _id)`` from a token made by ``encode_cursor``; raises ``ValueError``."""
+    if sort_field == "_id":
+        if not ObjectId.is_valid(token):
+            raise ValueError("Invalid pagination cursor")
+        return None, ObjectId(token)
+    try:
+        raw = base64.urlsafe_b64decode(token + "=" * (-len(token) % 4))
+        sort_value, last_id = json_util.loads(raw)
+    except (binascii.Error, ValueError, TypeError) as error:
+        raise ValueError("Invalid pagination cursor") from error
+    return sort_value, last_id
+
+
+def keyset_filter(sort_field: str, descending: bool, token: str) -> Dict[str, Any]:
+    """Match the documents after ``token`` in ``(sort_field, _id)`` order."""
+    sort_value, last_id = decode_cursor(sort_field, token)
+    op = "$lt" if descending else "$gt"
+    if sort_field == "_id":
+        return {"_id": {op: last_id}}
+    return {"$or": [
+        {sort_field: {op: sort_value}},
+        {sort_field: sort_value, "_id": {op: last_id}},
+    ]}
+
+
+def sort_spec(sort_field: str, descending: bool) -> List[Tuple[str, int]]:
+    direction = -1 if descending else 1
+    if sort_field == "_id":
+        return [("_id", direction)]
+    # ``_id`` breaks ties so every document has exactly one position
+    return [(sort_field, direction), ("_id", direction)]
+
+
+async def total_count(
+    collection: AsyncIOMotorCollection, filters: Dict[str, Any], mode: CountMode
+) -> Optional[int]:
+    if mode == CountMode.NONE:
+        return None
+    if mode == CountMode.ESTIMATED and not filters:
+        return await collection.estimated_document_count()
+    if mode == CountMode.EXACT:
+        return await collection.count_documents(filters)
+
+    key = (collection.name, json_util.dumps(filters, sort_keys=True))
+    count = _counts.get(key)
+    if count is None:
+        count = _counts[key] = await collection.count_documents(filters)
+    return count
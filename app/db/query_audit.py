@@ -0,0 +1,123 @@
+"""Which queries the services send, and whether an index serves them.
+
+When enabled (``QUERY_AUDIT``), ``MongoCrud`` records the shape of every
+filtered query it sends: the filter with its values replaced by type names,
+plus the sort. ``audit_queries`` replays the last concrete filter of each
+shape through ``explain``. Recording is off by default since it costs a few
+microseconds per query and keeps the last filter values of each shape.
+"""
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Tuple
+
+from bson import json_util
+from motor.motor_asyncio import AsyncIOMotorCollection
+
+_MAX_SHAPES = 512
+_enabled = False
+
+
+@dataclass
+class RecordedQuery:
+    collection: AsyncIOMotorCollection
+    filters: Dict[str, Any]  # Last concrete filters seen with this shape, replayed by the audit
+    sort: List[Tuple[str, int]]
+    paginated: bool = False
+
+
+_queries: "OrderedDict[str, RecordedQuery]" = OrderedDict()
+
+
+def enable_query_audit(enabled: bool = True) -> None:
+    global _enabled
+    _enabled = enabled
+    if not enabled:
+        _queries.clear()
+
+
+def query_audit_enabled() -> bool:
+    return _enabled
+
+
+def query_shape(value: Any) -> Any:
+    """Replace the values of a filter with their type names, keeping fields and operators."""
+    if isinstance(value, dict):
+        return {key: query_shape(item) for key, item in sorted(value.items())}
+    if isinstance(value, (list, tuple)):
+        return [query_shape(item) for item in value[:1]]
+    return type(value).__name__
+
+
+def record_query(
+        collection: AsyncIOMotorCollection,
+        filters: Dict[str, Any],
+        sort: Optional[List[Tuple[str, int]]] = None,
+        paginated: bool = False,
+) -> None:
+    """Remember the shape of a query for ``audit_queries``; a no-op unless the audit is enabled."""
+    if not _enabled or (not filters and not sort):
+        return  # Whole-collection reads scan by design
+    sort = list(sort or [])
+    key = f"{collection.name} {json_util.dumps(query_shape(filters))} {sort}"
+    previous = _queries.get(key)
+    _queries[key] = RecordedQuery(collection, filters, sort, paginated or bool(previous and previous.paginated))
+    _queries.move_to_end(key)
+    while len(_queries) > _MAX_SHAPES:
+        _queries.popitem(last=False)
+
+
+def plan_stages(plan: Dict[str, Any]) -> List[str]:
+    """Flatten a winning plan into its stage names, outermost first."""
+    plan = plan.get("queryPlan", plan)  # Slot-based engine nests the classic plan
+    stages = [plan.get("stage", "?")]
+    children = plan.get("inputStages") or ([plan["inputStage"]] if "inputStage" in plan else [])
+    for child in children:
+        stages.extend(plan_stages(child))
+    return stages
+
+
+def plan_indexes(plan: Dict[str, Any]) -> List[str]:
+    plan = plan.get("queryPlan", plan)
+    names = [plan["indexName"]] if "indexName" in plan else []
+    for child in plan.get("inputStages") or ([plan["inputStage"]] if "inputStage" in plan else []):
+        names.extend(plan_indexes(child))
+    return names
+
+
+async def explain_query(
+    collection: AsyncIOMotorCollection, filters: Dict[str, Any], sort: List[Tuple[str, int]]
+) -> Dict[str, Any]:
+    """Summarise how the server would run one page of ``filters`` in ``sort`` order."""
+    cursor = collection.find(filters)
+    if sort:
+        cursor = cursor.sort(sort)
+    explanation = await cursor.limit(1).explain()
+    winning_plan = explanation["queryPlanner"]["winningPlan"]
+    stages = plan_stages(winning_plan)
+    return {
+        "collection": collection.name,
+        "filters": query_shape(filters),
+        "sort": [list(key) for key in sort],
+        "stages": stages,
+        "indexes": plan_indexes(winning_plan),
+        "collscan": "COLLSCAN" in stages,
+        # A page must come off an index in order; a COLLSCAN or in-memory SORT costs O(collection)
+        "covered": "COLLSCAN" not in stages and "SORT" not in stages,
+    }
+
+
+async def audit_queries(paginated_only: bool = False) -> List[Dict[str, Any]]:
+    """Explain every recorded query shape; collection scans first, then in-memory sorts."""
+    report = []
+    for query in list(_queries.values()):
+        if paginated_only and not query.paginated:
+            continue
+        try:
+            report.append(await explain_query(query.collection, query.filters, query.sort))
+        except Exception as error:
+            report.append({
+                "collection": query.collection.name,
+                "filters": query_shape(query.filters),
+                "error": str(error),
+            })
+    return sorted(report, key=lambda entry: (not entry.get("collscan", True), entry.get("covered", False)))
@@ -0,0 +1,37 @@
+from typing import Any, Dict, Mapping, Sequence, Tuple, Type
+
+
+class Row:
+    """A projected document with attribute access and no validation.
+
+    Rows are built straight from the raw Mongo document, so values keep their
+    BSON types (``ObjectId``, naive UTC ``datetime``, nested dicts) and missing
+    keys read as ``None``. Use them where only a few fields of many documents
+    are needed; use the model when behaviour or serialisation matters.
+    """
+    __slots__ = ()
+    _keys: Tuple[Tuple[str, str], ...] = ()  # (attribute, document key)
+
+    def __init__(self, raw: Mapping[str, Any]):
+        for attribute, key in self._keys:
+            setattr(self, attribute, raw.get(key))
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {attribute: getattr(self, attribute) for attribute, _ in self._keys}
+
+    def __repr__(self) -> str:
+        values = ", ".join(f"{attribute}={getattr(self, attribute)!r}" for attribute, _ in self._keys)
+        return f"Row({values})"
+
+
+_row_types: Dict[Tuple[Tuple[str, str], ...], Type[Row]] = {}
+
+
+def row_type(keys: Sequence[Tuple[str, str]]) -> Type[Row]:
+    """Slotted ``Row`` subclass for ``(attribute, document key)`` pairs, created once per shape."""
+    keys = tuple(keys)
+    cls = _row_types.get(keys)
+    if cls is None:
+        cls = type("Row", (Row,), {"__slots__": tuple(a for a, _ in keys), "_keys": keys})
+        _row_types[keys] = cls
+    return cls
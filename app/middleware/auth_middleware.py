@@ -1,13 +1,16 @@
-from typing import Callable, Awaitable
+from typing import Iterable
 
 from fastapi import Request, Response
-from starlette.middleware.base import BaseHTTPMiddleware
 from starlette.responses import JSONResponse
+from starlette.routing import BaseRoute
 from starlette.status import HTTP_401_UNAUTHORIZED
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
+from app.api.route_policy import PublicRouteMatcher
+from app.middleware.response_middleware import error_envelope
 from app.utils.auth import (
     get_token_from_request,
-    verify_session_cookie,
+    verify_session_cookie_cached,
     get_refresh_token_from_request,
     set_auth_cookies
 )
@@ -17,58 +20,66 @@ from firebase_admin import auth
 logger = get_logger()
 settings = get_settings()
 
-class AuthMiddleware(BaseHTTPMiddleware):
-    async def dispatch(
-            self, request: Request, call_next: Callable[[Request], Awaitable[Response]]
-    ) -> Response:
 
-        if request.method == "OPTIONS":
-            return await call_next(request)
+class AuthMiddleware:
+    """Reject requests to non-public endpoints that lack a valid session cookie.
 
-        # Skip auth for public endpoints
-        if self._is_public_endpoint(request.url.path):
-            return await call_next(request)
+    Plain ASGI: the verified claims are stored on ``request.state`` and the
+    request is handed to the app without wrapping the response. Which routes
+    are public comes from the ``@public`` markers on ``routes``, compiled once
+    when the middleware stack is built.
+    """
+
+    # Served by FastAPI itself rather than by a marked endpoint
+    DOCS_PREFIXES = ("/docs", "/redoc", "/openapi.json")
+
+    def __init__(self, app: ASGIApp, routes: Iterable[BaseRoute] = ()):
+        self.app = app
+        self.public_routes = PublicRouteMatcher(
+            routes,
+            extra_prefixes=self.DOCS_PREFIXES,
+            fallback_prefix="/api/v1/" if settings.AUTH_PUBLIC_API_FALLBACK else None,
+        )
+        logger.info(f"Route access policy\n{self.public_routes.report()}")
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        request = Request(scope)
+
+        # Skip auth for preflight requests and public endpoints
+        if request.method == "OPTIONS" or self.public_routes.is_public(request.method, scope["path"]):
+            await self.app(scope, receive, send)
+            return
 
         # Get token from request
         token = get_token_from_request(request)
 
         if not token:
-            return JSONResponse(
-                status_code=HTTP_401_UNAUTHORIZED,
-                content={
-                    "status": HTTP_401_UNAUTHORIZED,
-                    "success": False,
-                    "message": "Authentication required",
-                    "data": None,
-                    "error": {
-                        "code": HTTP_401_UNAUTHORIZED,
-                        "message": "Authentication required"
-                    },
-                    "meta": None
-                }
-            )
+            await self._unauthorized(scope, receive, send, "Authentication required")
+            return
 
         try:
             # Verify token
-            decoded_claims = verify_session_cookie(token)
-
-            # Add user info to request state
-            request.state.user = decoded_claims
-            request.state.user_id = decoded_claims.get("uid")
-
-            # Continue with the request
-            response = await call_next(request)
-            return response
+            decoded_claims = await verify_session_cookie_cached(token)
 
         except auth.ExpiredSessionCookieError:
             # Session cookie has expired
             logger.warning("Session cookie expired.")
+            await self._unauthorized(scope, receive, send, "Session cookie expired")
+            return
         except auth.RevokedSessionCookieError:
             # Session cookie has been revoked
             logger.warning("Revoked session cookie.")
+            await self._unauthorized(scope, receive, send, "Session cookie has been revoked")
+            return
         except auth.InvalidSessionCookieError:
             # Session cookie is invalid
             logger.warning("Invalid session cookie.")
+            await self._unauthorized(scope, receive, send, "Invalid session cookie")
+            return
 
         except ValueError as e:
             # Try to refresh the token if session is invalid
@@ -76,60 +87,43 @@ class AuthMiddleware(BaseHTTPMiddleware):
             if refresh_token:
                 try:
                     # Verify refresh token (Note: Firebase doesn't officially support backend refresh via ID token)
-                    decoded_token = auth.verify_id_token(refresh_token, clock_skew_seconds=settings.CLOCK_SKEW_SECONDS)
-
-                    # Issue new custom token (this should be sent back to client to re-authenticate)
-                    new_custom_token = auth.create_custom_token(decoded_token["uid"])
+                    auth.verify_id_token(refresh_token, clock_skew_seconds=settings.CLOCK_SKEW_SECONDS)
 
-                    response = await call_next(request)
-                    set_auth_cookies(response, refresh_token)
-                    return response
+                    cookies = Response()
+                    set_auth_cookies(cookies, refresh_token)
+                    await self.app(scope, receive, self._with_cookies(send, cookies))
+                    return
 
                 except Exception as refresh_error:
                     logger.error(f"Token refresh failed: {str(refresh_error)}")
 
             # If we get here, authentication failed
-            return JSONResponse(
-                status_code=HTTP_401_UNAUTHORIZED,
-                content={
-                    "status": HTTP_401_UNAUTHORIZED,
-                    "success": False,
-                    "message": str(e),
-                    "data": None,
-                    "error": {
-                        "code": HTTP_401_UNAUTHORIZED,
-                        "message": str(e)
-                    },
-                    "meta": None
-                }
-            )
-
-    def _is_public_endpoint(self, path: str) -> bool:
-        """Check if the endpoints is public (doesn't require authentication)."""
-
-        public_paths = [
-            "/api/health",
-            "/health",
-            "/api/v1/auth/login",
-            "/api/v1/auth/register",
-            "/api/v1/auth/refresh",
-            "/api/v1/invitations",
-            "/api/v1/blog/",
-            "/docs",
-            "/redoc",
-            "/ws",
-            "/openapi.json",
-            "/api/v1/restaurants/slug",
-            "/api/v1/tables",
-            "/api/v1/restaurants/slug",
-            "/api/v1/restaurants/",
-            "/api/v1/menus",
-            "/api/v1/sessions",
-            "/api/v1/categories/",
-            "/api/v1/orders/sessions/",
-            "/api/v1/",
-            "/health",
-            "/compile-latex"
-        ]
-
-        return any(path.startswith(public_path) for public_path in public_paths)
+            await self._unauthorized(scope, receive, send, str(e))
+            return
+
+        # Add user info to request state
+        request.state.user = decoded_claims
+        request.state.user_id = decoded_claims.get("uid")
+
+        # Continue with the request
+        await self.app(scope, receive, send)
+
+    @staticmethod
+    async def _unauthorized(scope: Scope, receive: Receive, send: Send, message: str) -> None:
+        response = JSONResponse(
+            status_code=HTTP_401_UNAUTHORIZED,
+            content=error_envelope(HTTP_401_UNAUTHORIZED, message),
+        )
+        await response(scope, receive, send)
+
+    @staticmethod
+    def _with_cookies(send: Send, cookies: Response) -> Send:
+        """Wrap ``send`` so the ``Set-Cookie`` headers of ``cookies`` are added to the response."""
+        set_cookie = [(name, value) for name, value in cookies.raw_headers if name == b"set-cookie"]
+
+        async def send_wrapper(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                message["headers"] = [*message.get("headers", []), *set_cookie]
+            await send(message)
+
+        return send_wrapper
@@ -1,57 +1,55 @@
-import json
+from typing import Any, Optional
 
-from starlette.middleware.base import BaseHTTPMiddleware
-from starlette.requests import Request
 from starlette.responses import JSONResponse
 from starlette.status import HTTP_500_INTERNAL_SERVER_ERROR
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
 
-class ResponseFormatterMiddleware(BaseHTTPMiddleware):
-    async def dispatch(self, request: Request, call_next):
-        try:
-            response = await call_next(request)
-            status_code = response.status_code
-
-            # Decode JSON response
-            if isinstance(response, JSONResponse):
-                original_content = json.loads(response.body.decode("utf-8"))
-
-                # Check if response already has the expected fields
-                is_already_structured = any(
-                    key in original_content for key in ["data", "message", "error", "meta"]
-                )
-
-                formatted_response = {
-                    "status": status_code,
-                    "success": 200 <= status_code < 300,
-                    "message": original_content.get("message", "Request successful"),
-                    "data": original_content.get("data") if is_already_structured else original_content,
-                    "error": original_content.get("error") if "error" in original_content else (
-                        None if 200 <= status_code < 300 else {
-                            "code": status_code,
-                            "message": "An error occurred"
-                        }
-                    ),
-                    "meta": original_content.get("meta", None),
-                }
-
-                return JSONResponse(content=formatted_response, status_code=status_code)
-
-            # If response is not JSON (e.g., files), return as is
-            return response
+def error_envelope(status_code: int, message: str, error_message: Optional[str] = None) -> dict[str, Any]:
+    """Standard body for errors raised outside the routers."""
+    return {
+        "status": status_code,
+        "success": False,
+        "message": message,
+        "data": None,
+        "error": {
+            "code": status_code,
+            "message": error_message if error_message is not None else message
+        },
+        "meta": None
+    }
+
+
+class ResponseFormatterMiddleware:
+    """Turn unhandled exceptions into the standard error envelope.
+
+    Implemented as plain ASGI so responses stream straight through without
+    being buffered, decoded and re-encoded.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
 
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        response_started = False
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal response_started
+            if message["type"] == "http.response.start":
+                response_started = True
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
         except Exception as e:
-            return JSONResponse(
+            if response_started:
+                raise
+            response = JSONResponse(
                 status_code=HTTP_500_INTERNAL_SERVER_ERROR,
-                content={
-                    "status": HTTP_500_INTERNAL_SERVER_ERROR,
-                    "success": False,
-                    "message": "An internal server error occurred",
-                    "data": None,
-                    "error": {
-                        "code": HTTP_500_INTERNAL_SERVER_ERROR,
-                        "message": str(e)
-                    },
-                    "meta": None
-                }
+                content=error_envelope(HTTP_500_INTERNAL_SERVER_ERROR, "An internal server error occurred", str(e)),
             )
+            await response(scope, receive, send)
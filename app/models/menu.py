@@ -1,3 +1,4 @@
+from app.db.cache import document_cache
 from app.db.crud import MongoCrud
 from app.schema import menu as menu_schema
 
@@ -5,4 +6,7 @@ from app.schema import menu as menu_schema
 class MenuModel(MongoCrud[menu_schema.MenuDocument]):
 
     def __init__(self):
-        super().__init__(menu_schema.MenuDocument)
\ No newline at end of file
+        super().__init__(
+            menu_schema.MenuDocument,
+            cache=document_cache(menu_schema.MenuDocument.Settings.name, ttl=60, maxsize=1024),
+        )
\ No newline at end of file
@@ -1,3 +1,4 @@
+from app.db.cache import document_cache
 from app.db.crud import MongoCrud
 from app.schema import restaurant as restaurant_schema
 
@@ -5,4 +6,7 @@ from app.schema import restaurant as restaurant_schema
 class RestaurantModel(MongoCrud[restaurant_schema.RestaurantDocument]):
 
     def __init__(self):
-        super().__init__(restaurant_schema.RestaurantDocument)
\ No newline at end of file
+        super().__init__(
+            restaurant_schema.RestaurantDocument,
+            cache=document_cache(restaurant_schema.RestaurantDocument.Settings.name, ttl=60, maxsize=512),
+        )
\ No newline at end of file
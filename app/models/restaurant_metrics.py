@@ -0,0 +1,170 @@
+from datetime import datetime, timezone
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from pymongo import UpdateOne
+
+from app.db.crud import MongoCrud
+from app.schema import restaurant_metrics as metrics_schema
+from app.schema.invoice import InvoiceDocument, InvoiceStatus
+from app.schema.order import OrderDocument
+from app.schema.table_session import TableSessionDocument
+from app.utils.time import now_in_luanda
+
+
+def hour_bucket(value: datetime) -> datetime:
+    """Truncate a datetime to the start of its UTC hour."""
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return value.astimezone(timezone.utc).replace(minute=0, second=0, microsecond=0)
+
+
+class RestaurantMetricsModel(MongoCrud[metrics_schema.RestaurantMetricsHourlyDocument]):
+    def __init__(self):
+        super().__init__(metrics_schema.RestaurantMetricsHourlyDocument)
+
+    def _increment_update(self, counters: Dict[str, float]) -> Dict[str, Any]:
+        now = now_in_luanda()
+        return {
+            "$inc": counters,
+            "$set": {"updatedAt": now},
+            "$setOnInsert": {"createdAt": now},
+        }
+
+    async def increment(self, restaurant_id: str, at: datetime, counters: Dict[str, float]) -> None:
+        """Atomically add ``counters`` to the bucket of the hour containing ``at``."""
+        await self._get_collection().update_one(
+            {"restaurantId": restaurant_id, "hour": hour_bucket(at)},
+            self._increment_update(counters),
+            upsert=True,
+        )
+
+    async def increment_many(self, increments: Iterable[Tuple[str, datetime, Dict[str, float]]]) -> None:
+        """Apply several ``(restaurant_id, at, counters)`` increments in a single ``bulk_write``."""
+        operations = [
+            UpdateOne(
+                {"restaurantId": restaurant_id, "hour": hour_bucket(at)},
+                self._increment_update(counters),
+                upsert=True,
+            )
+            for restaurant_id, at, counters in increments
+        ]
+        if operations:
+            await self._get_collection().bulk_write(operations, ordered=False)
+
+    async def increment_hours(self, restaurant_id: str, hours: Iterable[datetime], counters: Dict[str, float]) -> None:
+        """Add ``counters`` to several hourly buckets in a single ``bulk_write``."""
+        await self.increment_many((restaurant_id, hour, counters) for hour in hours)
+
+    async def get_range(self, restaurant_id: str, from_date: datetime, to_date: datetime) -> List[metrics_schema.RestaurantMetricsHourlyDocument]:
+        filters = {
+            "restaurantId": restaurant_id,
+            "hour": {"$gte": hour_bucket(from_date), "$lte": to_date},
+        }
+        documents = await self._get_collection().find(filters).sort("hour", 1).to_list(None)
+        return [self._validate(doc) for doc in documents]
+
+    async def rebuild(self, restaurant_id: Optional[str] = None) -> int:
+        """Recompute the rollup from the raw ``orders``, ``invoices`` and ``table_sessions`` history.
+
+        Existing buckets in scope are dropped first and every source collection is
+        grouped on the server and ``$merge``-d into the rollup collection. Returns
+        the number of hourly buckets written.
+        """
+        collection = self._get_collection()
+        scope: Dict[str, Any] = {"restaurantId": restaurant_id} if restaurant_id else {}
+
+        await collection.delete_many(scope)
+
+        merge = {
+            "$merge": {
+                "into": collection.name,
+                "on": ["restaurantId", "hour"],
+                "whenMatched": "merge",
+                "whenNotMatched": "insert",
+            }
+        }
+
+        def _bucket(date_field: str, counters: Dict[str, Any]) -> List[Dict[str, Any]]:
+            return [
+                {
+                    "$group": {
+                        "_id": {
+                            "restaurantId": "$restaurantId",
+                            "hour": {"$dateTrunc": {"date": date_field, "unit": "hour"}},
+                        },
+                        **counters,
+                    }
+                },
+                {
+                    "$project": {
+                        "_id": 0,
+                        "restaurantId": "$_id.restaurantId",
+                        "hour": "$_id.hour",
+                        "createdAt": "$$NOW",
+                        "updatedAt": "$$NOW",
+                        **{name: 1 for name in counters},
+                    }
+                },
+                merge,
+            ]
+
+        orders = OrderDocument.get_motor_collection()
+        await orders.aggregate([
+            {"$match": scope},
+            *_bucket("$createdAt", {
+                "orders": {"$sum": 1},
+                "itemsOrdered": {"$sum": "$quantity"},
+            }),
+        ]).to_list(None)
+
+        invoices = InvoiceDocument.get_motor_collection()
+        await invoices.aggregate([
+            {"$match": {**scope, "status": InvoiceStatus.PAID.value}},
+            *_bucket("$createdAt", {
+                "paidInvoices": {"$sum": 1},
+                "revenue": {"$sum": {"$ifNull": ["$total", 0]}},
+            }),
+        ]).to_list(None)
+
+        sessions = TableSessionDocument.get_motor_collection()
+        ended_sessions = {**scope, "startTime": {"$ne": None}, "endTime": {"$ne": None}}
+        await sessions.aggregate([
+            {"$match": ended_sessions},
+            *_bucket("$endTime", {"closedSessions": {"$sum": 1}}),
+        ]).to_list(None)
+
+        # Expand every ended session into the hours it spanned
+        await sessions.aggregate([
+            {"$match": ended_sessions},
+            {
+                "$project": {
+                    "restaurantId": 1,
+                    "start": {"$dateTrunc": {"date": "$startTime", "unit": "hour"}},
+                    "end": {"$dateTrunc": {"date": "$endTime", "unit": "hour"}},
+                }
+            },
+            {
+                "$project": {
+                    "restaurantId": 1,
+                    "occupiedHour": {
+                        "$map": {
+                            "input": {
+                                "$range": [
+                                    0,
+                                    {"$add": [
+                                        {"$max": [0, {"$dateDiff": {"startDate": "$start", "endDate": "$end", "unit": "hour"}}]},
+                                        1,
+                                    ]},
+                                ]
+                            },
+                            "as": "offset",
+                            "in": {"$dateAdd": {"startDate": "$start", "unit": "hour", "amount": "$$offset"}},
+                        }
+                    },
+                }
+            },
+            {"$unwind": "$occupiedHour"},
+            *_bucket("$occupiedHour", {"occupiedSessions": {"$sum": 1}}),
+        ]).to_list(None)
+
+        return await collection.count_documents(scope)
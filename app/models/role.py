@@ -1,3 +1,4 @@
+from app.db.cache import document_cache
 from app.db.crud import MongoCrud
 from app.schema import role as role_schema
 
@@ -5,4 +6,7 @@ from app.schema import role as role_schema
 class RoleModel(MongoCrud[role_schema.RoleDocument]):
 
     def __init__(self):
-        super().__init__(role_schema.RoleDocument)
\ No newline at end of file
+        super().__init__(
+            role_schema.RoleDocument,
+            cache=document_cache(role_schema.RoleDocument.Settings.name, ttl=120, maxsize=2048),
+        )
\ No newline at end of file
@@ -1,4 +1,8 @@
-from typing import Dict, Any, Optional
+import asyncio
+from typing import Dict, Any, List, Optional, Tuple
+
+from bson import ObjectId
+from pymongo import ReturnDocument
 
 from app.db.crud import MongoCrud
 from app.schema import stock_item as stock_item_schema
@@ -94,7 +98,84 @@ class StockItemModel(MongoCrud[stock_item_schema.StockItemDocument]):
 
         return deleted
 
+    def _status_expression(self) -> Dict[str, Any]:
+        """Server-side equivalent of ``_calculate_status`` for update pipelines."""
+        return {
+            "$switch": {
+                "branches": [
+                    {"case": {"$eq": ["$currentQuantity", 0]}, "then": StockStatus.OUTOFSTOCK.value},
+                    {"case": {"$lte": ["$currentQuantity", {"$multiply": ["$minQuantity", 0.25]}]}, "then": StockStatus.CRITICO.value},
+                    {"case": {"$lte": ["$currentQuantity", "$minQuantity"]}, "then": StockStatus.BAIXO.value},
+                ],
+                "default": StockStatus.OK.value,
+            }
+        }
+
+    async def remove_many(self, removals: List[Tuple[str, float, str]], *, user: str = "Ajuste Automático") -> int:
+        """Apply several ``(item_id, quantity, reason)`` stock removals atomically.
+
+        Each item is decremented with one ``find_one_and_update`` update pipeline
+        that floors the quantity at zero and recomputes ``status`` on the server,
+        so concurrent removals never overwrite each other. The updates run
+        concurrently and return the stock as it was right before each one, so the
+        ``Movement`` rows (written with one ``insert_many``) record exactly what
+        was removed. Returns the number of stock items that were updated.
+        """
+        totals: Dict[str, float] = {}
+        for item_id, quantity, _ in removals:
+            if quantity > 0 and ObjectId.is_valid(item_id):
+                totals[item_id] = totals.get(item_id, 0.0) + quantity
+        if not totals:
+            return 0
+
+        collection = self._get_collection()
+        now = now_in_luanda()
+
+        async def decrement(item_id: str, quantity: float) -> Optional[Dict[str, Any]]:
+            return await collection.find_one_and_update(
+                {"_id": ObjectId(item_id)},
+                [
+                    {
+                        "$set": {
+                            "currentQuantity": {"$max": [0, {"$subtract": ["$currentQuantity", quantity]}]},
+                            "updatedAt": now,
+                        }
+                    },
+                    {"$set": {"status": self._status_expression()}},
+                ],
+                projection={"name": 1, "restaurantId": 1, "unit": 1, "cost": 1, "currentQuantity": 1},
+                return_document=ReturnDocument.BEFORE,
+            )
+
+        before = await asyncio.gather(*(decrement(item_id, quantity) for item_id, quantity in totals.items()))
+        items = {str(raw["_id"]): raw for raw in before if raw}
+
+        # What each update actually took off, shared out between that item's removals in order
+        remaining = {
+            item_id: min(totals[item_id], max(raw.get("currentQuantity") or 0, 0))
+            for item_id, raw in items.items()
+        }
+        movements: List[Dict[str, Any]] = []
+        for item_id, quantity, reason in removals:
+            item = items.get(item_id)
+            if not item or quantity <= 0:
+                continue
+            moved = min(quantity, remaining[item_id])
+            remaining[item_id] -= moved
+            if moved <= 0:
+                continue
+            movements.append({
+                "productId": item_id,
+                "productName": item.get("name"),
+                "type": movement_schema.MovementType.SAIDA,
+                "quantity": moved,
+                "restaurantId": item.get("restaurantId"),
+                "unit": item.get("unit"),
+                "date": now,
+                "reason": reason,
+                "user": user,
+                "cost": item.get("cost"),
+            })
+        await movement_model.create_many(movements)
 
-
-
-
+        return len(items)
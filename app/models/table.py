@@ -1,6 +1,11 @@
+from app.db.cache import document_cache
 from app.db.crud import MongoCrud
 from app.schema import table as table_schema
 
 class TableModel(MongoCrud[table_schema.TableDocument]):
     def __init__(self):
-        super().__init__(table_schema.TableDocument)
+        # Short TTL: currentSessionId changes on every seating and other workers may write it
+        super().__init__(
+            table_schema.TableDocument,
+            cache=document_cache(table_schema.TableDocument.Settings.name, ttl=10, maxsize=4096),
+        )
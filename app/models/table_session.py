@@ -1,15 +1,32 @@
-from typing import Dict, Any, Optional
-import json
+from typing import Dict, Any, List, Optional
+
+from bson import ObjectId
 
 from app.db.crud import MongoCrud
 from app.schema import table_session as table_session_schema
+from app.services.websocket_events import encode_event
 from app.services.websocket_manager import get_websocket_manger
+from app.utils.time import now_in_luanda
 
 
 class TableSessionModel(MongoCrud[table_session_schema.TableSessionDocument]):
     def __init__(self):
         super().__init__(table_session_schema.TableSessionDocument)
 
+    async def _broadcast_status(
+        self, session: table_session_schema.TableSessionDocument, assistance: bool = False
+    ) -> None:
+        websocket_manager = get_websocket_manger()
+        event = encode_event(session.to_response().model_dump(mode="json", by_alias=True))
+        await websocket_manager.broadcast(
+            event, f"{str(session.restaurant_id)}/session-status"
+        )
+
+        if assistance:
+            await websocket_manager.broadcast(
+                event, f"{str(session.restaurant_id)}/assistance"
+            )
+
     async def update(
         self, _id: str, data: Dict[str, Any]
     ) -> Optional[table_session_schema.TableSessionDocument]:
@@ -17,15 +34,24 @@ class TableSessionModel(MongoCrud[table_session_schema.TableSessionDocument]):
         if updated and (
             "orders" in data or "status" in data or "needsAssistance" in data
         ):
-            websocket_manager = get_websocket_manger()
-            json_session = updated.to_response().model_dump(by_alias=True)
-            session_data = json.dumps(json_session)
-            await websocket_manager.broadcast(
-                session_data, f"{str(updated.restaurant_id)}/session-status"
-            )
+            await self._broadcast_status(updated, assistance="needsAssistance" in data)
+        return updated
+
+    async def add_orders(
+        self, _id: str, order_ids: List[str]
+    ) -> Optional[table_session_schema.TableSessionDocument]:
+        """Append order ids to the session with a single ``$addToSet``/``$each`` update."""
+        result = await self._get_collection().update_one(
+            {"_id": ObjectId(_id)},
+            {
+                "$addToSet": {"orders": {"$each": order_ids}},
+                "$set": {"updatedAt": now_in_luanda()},
+            },
+        )
+        if result.matched_count == 0:
+            return None
 
-            if "needsAssistance" in data:
-                await websocket_manager.broadcast(
-                    session_data, f"{str(updated.restaurant_id)}/assistance"
-                )
+        updated = await self.get(_id)
+        if updated:
+            await self._broadcast_status(updated)
         return updated
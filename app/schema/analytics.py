@@ -1,6 +1,15 @@
+from datetime import datetime
+from enum import Enum
+
 from pydantic import BaseModel, Field, ConfigDict
 
 
+class TimeSeriesGranularity(str, Enum):
+    HOUR = "hour"
+    DAY = "day"
+    WEEK = "week"
+
+
 class ItemOrderQuantity(BaseModel):
     item_id: str = Field(..., alias="itemId")
     item_name: str = Field(..., alias="itemName")
@@ -81,4 +90,13 @@ class ActiveSessionCount(BaseModel):
 class TotalOrdersCount(BaseModel):
     date: str
     sales: int
-    day: str
\ No newline at end of file
+    day: str
+
+
+class OrderCountPoint(BaseModel):
+    date: datetime
+    order_count: int = Field(..., alias="orderCount")
+
+    model_config = ConfigDict(
+        populate_by_name=True
+    )
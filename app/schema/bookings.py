@@ -3,6 +3,7 @@ from datetime import datetime
 from beanie import Document
 from bson import ObjectId
 from pydantic import BaseModel, Field
+from pymongo import IndexModel, ASCENDING
 
 from app.schema.collection_id.document_id import DocumentId
 from app.utils.make_optional_model import make_optional_model
@@ -46,4 +47,7 @@ class BookingDocument(Document, Booking):
         bson_encoders = {
             ObjectId: str
         }
-        indexes = []
\ No newline at end of file
+        indexes = [
+            IndexModel([("restaurantId", ASCENDING)], name="idx_restaurant_id"),
+            IndexModel([("tableId", ASCENDING)], name="idx_table_id"),
+        ]
\ No newline at end of file
@@ -53,6 +53,7 @@ class CategoryDocument(Document, Category):
         bson_encoders = {ObjectId: str}
         indexes = [
             IndexModel([("restaurantId", ASCENDING)], name="idx_restaurant_id"),
+            IndexModel([("menuId", ASCENDING), ("isActive", ASCENDING)], name="idx_menu_active"),
             IndexModel([("isActive", ASCENDING)], name="idx_is_active"),
             IndexModel([("position", ASCENDING)], name="idx_position"),
             IndexModel([("slug", ASCENDING)], unique=True, name="idx_slug")
@@ -0,0 +1,53 @@
+from typing import Dict, List
+
+from pydantic import BaseModel, Field
+
+
+class ImageVariant(BaseModel):
+    url: str
+    width: int
+    height: int
+    type: str  # MIME type, e.g. image/webp
+
+
+class ImageSource(BaseModel):
+    """One ``<source>`` of a ``<picture>``: a format and all its widths."""
+    type: str
+    srcset: str  # "https://...320w.webp 320w, https://...640w.webp 640w"
+
+
+class ResponsiveImage(BaseModel):
+    """Resized copies of an uploaded image, ready for ``srcset``.
+
+    ``sources`` has one entry per format, smallest format first, so it maps
+    directly onto ``<picture><source type srcset>`` elements; ``src``,
+    ``width`` and ``height`` describe the largest JPEG, for ``<img>``.
+    """
+    src: str
+    width: int
+    height: int
+    sources: List[ImageSource] = Field(default_factory=list)
+    variants: List[ImageVariant] = Field(default_factory=list)
+
+    @classmethod
+    def from_variants(cls, variants: List[ImageVariant]) -> "ResponsiveImage":
+        by_type: Dict[str, List[ImageVariant]] = {}
+        for variant in variants:
+            by_type.setdefault(variant.type, []).append(variant)
+
+        sources = [
+            ImageSource(
+                type=image_type,
+                srcset=", ".join(f"{v.url} {v.width}w" for v in sorted(group, key=lambda v: v.width)),
+            )
+            for image_type, group in by_type.items()
+        ]
+
+        fallback = max(by_type.get("image/jpeg") or variants, key=lambda v: v.width)
+        return cls(
+            src=fallback.url,
+            width=fallback.width,
+            height=fallback.height,
+            sources=sources,
+            variants=variants,
+        )
@@ -71,5 +71,7 @@ class InvoiceDocument(Document, Invoice):
         indexes = [
             IndexModel([("sessionId", ASCENDING)], name="idx_session_id"),
             IndexModel([("restaurantId", ASCENDING)], name="idx_restaurant_id"),
+            # Keyset pagination of a restaurant's invoices by date
+            IndexModel([("restaurantId", ASCENDING), ("createdAt", ASCENDING), ("_id", ASCENDING)], name="idx_restaurant_created_id"),
             IndexModel([("status", ASCENDING)], name="idx_status")
         ]
@@ -5,6 +5,7 @@ from typing import List, Optional
 from pymongo import IndexModel, ASCENDING
 from enum import Enum
 from app.schema.collection_id.document_id import DocumentId
+from app.schema.image import ResponsiveImage
 from app.utils.make_optional_model import make_optional_model
 
 
@@ -46,6 +47,7 @@ class ItemCreate(BaseModel):
 
 class ItemBase(ItemCreate):
     image_url: str = Field(..., alias="imageUrl")
+    image: Optional[ResponsiveImage] = None  # Resized variants of imageUrl
 
     # Optional
     is_available: bool = Field(default=True, alias="isAvailable")
@@ -71,7 +73,8 @@ class ItemDocument(Document, Item):
         name = "items"
         bson_encoders = {ObjectId: str}
         indexes = [
-            IndexModel([("slug", ASCENDING)], unique=True, name="idx_slug")
+            IndexModel([("slug", ASCENDING)], unique=True, name="idx_slug"),
+            IndexModel([("categoryId", ASCENDING), ("isAvailable", ASCENDING)], name="idx_category_available"),
         ]
 
 
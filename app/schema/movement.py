@@ -59,4 +59,5 @@ class MovementDocument(Document, Movement):
         indexes = [
             IndexModel([("productId", ASCENDING)], name="idx_product_id"),
             IndexModel([("type", ASCENDING)], name="idx_type"),
+            IndexModel([("restaurantId", ASCENDING), ("_id", ASCENDING)], name="idx_restaurant_id"),
         ]
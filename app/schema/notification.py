@@ -67,4 +67,5 @@ class NotificationDocument(Document, Notification):
         bson_encoders = {ObjectId: str}
         indexes = [
             IndexModel([("userId", ASCENDING), ("restaurantId", ASCENDING)], name="idx_user_restaurant"),
+            IndexModel([("userId", ASCENDING), ("isRead", ASCENDING)], name="idx_user_is_read"),
         ]
\ No newline at end of file
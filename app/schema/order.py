@@ -71,4 +71,7 @@ class OrderDocument(Document, Order):
         indexes = [
             IndexModel([("sessionId", ASCENDING)], name="idx_session_id"),
             IndexModel([("prepStatus", ASCENDING)], name="idx_prep_status"),
+            IndexModel([("restaurantId", ASCENDING), ("createdAt", ASCENDING)], name="idx_restaurant_created"),
+            # Keyset pagination by order time
+            IndexModel([("orderTime", ASCENDING), ("_id", ASCENDING)], name="idx_order_time_id"),
         ]
\ No newline at end of file
@@ -47,5 +47,6 @@ class RecipeDocument(Document, Recipe):
         bson_encoders = {ObjectId: str}
         indexes = [
             IndexModel([("dishName", ASCENDING)], name="idx_dish_name"),
+            IndexModel([("restaurantId", ASCENDING), ("_id", ASCENDING)], name="idx_restaurant_id"),
         ]
 
@@ -6,6 +6,7 @@ from pydantic import Field, BaseModel, ConfigDict
 from pymongo import IndexModel, ASCENDING
 
 from app.schema.collection_id.document_id import DocumentId
+from app.schema.image import ResponsiveImage
 from app.utils.make_optional_model import make_optional_model
 
 class OpeningHours(BaseModel):
@@ -32,6 +33,8 @@ class RestaurantCreate(BaseModel):
     phone_number: str = Field(..., alias="phoneNumber")
     banner_url: str = Field(..., alias="bannerUrl")
     logo_url: Optional[str] = Field(default=None, alias="logoUrl")
+    banner_image: Optional[ResponsiveImage] = Field(default=None, alias="bannerImage")
+    logo_image: Optional[ResponsiveImage] = Field(default=None, alias="logoImage")
 
     settings: Optional[RestaurantSettings] = Field(default_factory=RestaurantSettings)
 
@@ -0,0 +1,51 @@
+from datetime import datetime
+
+from beanie import Document
+from bson import ObjectId
+from pydantic import BaseModel, Field, field_serializer
+from pymongo import IndexModel, ASCENDING
+
+from app.schema.collection_id.document_id import DocumentId
+from app.utils.time import to_luanda_timezone
+
+
+class RestaurantMetricsHourlyBase(BaseModel):
+    """Pre-aggregated counters for one restaurant during one (UTC) hour."""
+
+    restaurant_id: str = Field(..., alias="restaurantId")
+    hour: datetime
+
+    # Orders placed during the hour
+    orders: int = 0
+    items_ordered: int = Field(default=0, alias="itemsOrdered")
+
+    # Paid invoices, bucketed by the invoice creation time
+    paid_invoices: int = Field(default=0, alias="paidInvoices")
+    revenue: float = 0.0
+
+    # Sessions that ended during the hour and sessions that occupied a table during the hour
+    closed_sessions: int = Field(default=0, alias="closedSessions")
+    occupied_sessions: int = Field(default=0, alias="occupiedSessions")
+
+    @field_serializer('hour')
+    def serialize_hour(self, value: datetime, _info):
+        return to_luanda_timezone(value).isoformat()
+
+
+class RestaurantMetricsHourly(RestaurantMetricsHourlyBase, DocumentId):
+    model_config = {
+        "populate_by_name": True,
+        "arbitrary_types_allowed": True,
+    }
+
+
+class RestaurantMetricsHourlyDocument(Document, RestaurantMetricsHourly):
+    def to_response(self):
+        return RestaurantMetricsHourly(**self.model_dump(by_alias=True))
+
+    class Settings:
+        name = "restaurant_metrics_hourly"
+        bson_encoders = {ObjectId: str}
+        indexes = [
+            IndexModel([("restaurantId", ASCENDING), ("hour", ASCENDING)], unique=True, name="idx_restaurant_hour"),
+        ]
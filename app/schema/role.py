@@ -3,6 +3,7 @@ from typing import List
 from beanie import Document
 from bson import ObjectId
 from pydantic import BaseModel, Field
+from pymongo import IndexModel, ASCENDING
 from app.schema.collection_id.document_id import DocumentId  # your existing DocumentId with id, createdAt, updatedAt
 from app.utils.make_optional_model import make_optional_model
 from enum import Enum
@@ -105,4 +106,7 @@ class RoleDocument(Document, Role):
     class Settings:
         name = "roles"
         bson_encoders = {ObjectId: str}
+        indexes = [
+            IndexModel([("restaurantId", ASCENDING), ("name", ASCENDING)], name="idx_restaurant_name"),
+        ]
 
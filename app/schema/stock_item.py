@@ -65,4 +65,5 @@ class StockItemDocument(Document, StockItem):
         indexes = [
             IndexModel([("name", ASCENDING)], name="idx_name"),
             IndexModel([("supplier", ASCENDING)], name="idx_supplier"),
+            IndexModel([("restaurantId", ASCENDING), ("_id", ASCENDING)], name="idx_restaurant_id"),
         ]
@@ -36,7 +36,7 @@ class TableDocument(Document, Table):
         name = "tables"
         bson_encoders = {ObjectId: str}
         indexes = [
+            # Also serves restaurantId-only filters
             IndexModel([("restaurantId", ASCENDING), ("number", ASCENDING)], unique=True, name="idx_restaurant_number"),
-            IndexModel([("restaurantId", ASCENDING)], name="idx_restaurant_id"),
             IndexModel([("isActive", ASCENDING)], name="idx_is_active")
         ]
\ No newline at end of file
@@ -80,6 +80,9 @@ class TableSessionDocument(Document, TableSession):
         bson_encoders = {ObjectId: str}
         indexes = [
             IndexModel([("tableId", ASCENDING), ("status", ASCENDING)], name="idx_table_active_status"),
-            IndexModel([("restaurantId", ASCENDING)], name="idx_restaurant"),
+            # Also serves restaurantId-only and restaurantId+status filters
+            IndexModel([("restaurantId", ASCENDING), ("status", ASCENDING), ("startTime", ASCENDING)], name="idx_restaurant_status_start"),
+            # Keyset pagination by start time
+            IndexModel([("startTime", ASCENDING), ("_id", ASCENDING)], name="idx_start_time_id"),
             IndexModel([("status", ASCENDING)], name="idx_status")
         ]
\ No newline at end of file
@@ -87,9 +87,13 @@ class UserDocument(Document, UserBase, DocumentId):
                 unique=True,
                 name="idx_email"
             ),
-            # IndexModel(
-            #     "firebase_uuid",
-            #     unique=True,
-            #     name="idx_firebase_uuid"
-            # )
+            IndexModel(
+                "firebaseUUID",
+                unique=True,
+                name="idx_firebase_uuid"
+            ),
+            IndexModel(
+                "memberships.roleId",
+                name="idx_membership_role_id"
+            ),
         ]
\ No newline at end of file
@@ -1,5 +1,5 @@
 from datetime import datetime, timedelta
-from typing import Dict, List
+from typing import List
 from starlette.exceptions import HTTPException
 
 from app.models.invoice import InvoiceModel
@@ -14,10 +14,12 @@ from app.schema.analytics import (
     AverageSessionDuration,
     ActiveSessionCount,
     TotalOrdersCount,
+    TimeSeriesGranularity,
+    OrderCountPoint,
 )
-from app.schema.invoice import InvoiceDocument, InvoiceStatus
+from app.schema.invoice import InvoiceStatus
 from app.schema.order import OrderPrepStatus
-from app.utils.time import now_in_luanda
+from app.utils.time import now_in_luanda, to_luanda_timezone, LUANDA_TIMEZONE
 
 
 valid_orders = [
@@ -31,6 +33,29 @@ order_model = OrderModel()
 invoice_model = InvoiceModel()
 session_model = TableSessionModel()
 
+def _sales_metrics_pipeline(from_date: datetime, to_date: datetime) -> List[dict]:
+    """Sub-pipeline computing the sales metrics of invoices in ``[from_date, to_date]``."""
+    return [
+        {"$match": {"createdAt": {"$gte": from_date, "$lte": to_date}}},
+        {
+            "$group": {
+                "_id": None,
+                "totalSales": {"$sum": {"$ifNull": ["$total", 0]}},
+                "invoiceCount": {"$sum": 1},
+                "sessions": {"$addToSet": "$sessionId"},
+            }
+        },
+        {
+            "$project": {
+                "_id": 0,
+                "totalSales": 1,
+                "invoiceCount": 1,
+                "distinctTables": {"$size": "$sessions"},
+            }
+        },
+    ]
+
+
 async def get_sales_summary(
     restaurant_id: str,
     from_date: datetime,
@@ -40,15 +65,17 @@ async def get_sales_summary(
 
     Metrics include total sales, invoice counts and revenue per table. It
     also calculates the growth for the same duration immediately preceding
-    the provided range.
+    the provided range. Both periods are aggregated on the server in a single
+    ``$facet`` round trip.
     """
-    def _compute_metrics(inv_list: List[InvoiceDocument]):
-        total_sales = sum(inv.total or 0.0 for inv in inv_list)
-        invoice_count = len(inv_list)
+    def _compute_metrics(facet: List[dict]):
+        result = facet[0] if facet else {}
+        total_sales = result.get("totalSales", 0.0) or 0.0
+        invoice_count = result.get("invoiceCount", 0)
         average_invoice = (
             total_sales / invoice_count if invoice_count > 0 else 0.0
         )
-        distinct_tables = len(set(inv.session_id for inv in inv_list))
+        distinct_tables = result.get("distinctTables", 0)
         revenue_per_table = (
             total_sales / distinct_tables if distinct_tables > 0 else 0.0
         )
@@ -65,25 +92,29 @@ async def get_sales_summary(
             return None
         return round(((current - previous) / previous) * 100, 2)
 
-    # current period invoices
-    filters = {
-        "restaurantId": restaurant_id,
-        "createdAt": {"$gte": from_date, "$lte": to_date},
-    }
-    invoices = await invoice_model.get_by_fields(filters)
-
-    current_metrics = _compute_metrics(invoices or [])
-
-    # previous period invoices
     period_delta = to_date - from_date
     prev_from = from_date - period_delta
     prev_to = prev_from + period_delta
-    prev_filters = {
-        "restaurantId": restaurant_id,
-        "createdAt": {"$gte": prev_from, "$lte": prev_to},
-    }
-    previous_invoices = await invoice_model.get_by_fields(prev_filters)
-    previous_metrics = _compute_metrics(previous_invoices or [])
+
+    pipeline = [
+        {
+            "$match": {
+                "restaurantId": restaurant_id,
+                "createdAt": {"$gte": prev_from, "$lte": to_date},
+            }
+        },
+        {
+            "$facet": {
+                "current": _sales_metrics_pipeline(from_date, to_date),
+                "previous": _sales_metrics_pipeline(prev_from, prev_to),
+            }
+        },
+    ]
+    docs = await invoice_model.aggregate(pipeline)
+    facets = docs[0] if docs else {}
+
+    current_metrics = _compute_metrics(facets.get("current", []))
+    previous_metrics = _compute_metrics(facets.get("previous", []))
 
     growths = [
         _growth(curr, prev)
@@ -118,8 +149,7 @@ async def count_invoices(
         "status": InvoiceStatus.PAID,
     }
 
-    invoices = await invoice_model.get_by_fields(filters)
-    count = len(invoices)
+    count = await invoice_model.count(filters)
 
     return InvoiceCount(invoice_count=count)
 
@@ -132,16 +162,18 @@ async def count_orders(
     """Count all orders within a date range for a restaurant."""
 
     try:
-        filters = {
-            "restaurantId": restaurant_id,
-            # "prepStatus": {"$in": [OrderPrepStatus.QUEUED, OrderPrepStatus.READY, OrderPrepStatus.IN_PROGRESS, OrderPrepStatus.Se]},
-            "createdAt": {"$gte": from_date, "$lte": to_date},
-        }
-        documents = await order_model.get_by_fields(filters)
-
-        orders_count = [order.quantity for order in documents]
+        pipeline = [
+            {
+                "$match": {
+                    "restaurantId": restaurant_id,
+                    "createdAt": {"$gte": from_date, "$lte": to_date},
+                }
+            },
+            {"$group": {"_id": None, "count": {"$sum": "$quantity"}}},
+        ]
+        docs = await order_model.aggregate(pipeline)
 
-        count = sum(orders_count)
+        count = docs[0]["count"] if docs else 0
         return OrderCount(order_count=count)
 
     except Exception as e:
@@ -159,37 +191,36 @@ async def get_top_items(
 
     """Return the most frequently ordered items within a period."""
 
-    # 1. Filter orders
-    orders = await order_model.get_by_fields(
+    pipeline = [
         {
-            "restaurantId": restaurant_id,
-            "createdAt": {"$gte": from_date, "$lte": to_date},
-            "prepStatus": {
-                "$in": ["queued", "in_progress", "ready", "delivered"]
-            },
-        }
-    )
-
-    if not orders:
-        return []
-
-    # 2. Count by item_id
-    counter: Dict[str, ItemOrderQuantity] = {}
-
-    for order in orders:
-        key = order.item_id
-        if key not in counter:
-            item = ItemOrderQuantity(
-                item_id=key,
-                item_name=getattr(order, "ordered_item_name", None),
-                quantity=0,
-            )
-            counter[key] = item
-        counter[key].quantity += order.quantity
+            "$match": {
+                "restaurantId": restaurant_id,
+                "createdAt": {"$gte": from_date, "$lte": to_date},
+                "prepStatus": {
+                    "$in": ["queued", "in_progress", "ready", "delivered"]
+                },
+            }
+        },
+        {
+            "$group": {
+                "_id": "$itemId",
+                "itemName": {"$first": "$orderedItemName"},
+                "quantity": {"$sum": "$quantity"},
+            }
+        },
+        {"$sort": {"quantity": -1}},
+        {"$limit": top_n},
+    ]
+    docs = await order_model.aggregate(pipeline)
 
-    # 3. Sort and return top N
-    sorted_items = sorted(counter.values(), key=lambda x: x.quantity, reverse=True)
-    return sorted_items[:top_n]
+    return [
+        ItemOrderQuantity(
+            item_id=doc["_id"],
+            item_name=doc.get("itemName") or doc["_id"],
+            quantity=doc.get("quantity", 0),
+        )
+        for doc in docs
+    ]
 
 
 async def count_cancelled_orders(
@@ -200,14 +231,13 @@ async def count_cancelled_orders(
 
     """Count the number of cancelled orders in the period."""
 
-    documents = await order_model.get_by_fields(
+    count = await order_model.count(
         {
             "restaurantId": restaurant_id,
             "prepStatus": "cancelled",
             "createdAt": {"$gte": from_date, "$lte": to_date},
         }
     )
-    count = len(documents)
 
     return CancelledCount(cancelled_count=count)
 
@@ -219,7 +249,7 @@ async def count_cancelled_sessions(
 ) -> CancelledCount:
     """Count the number of cancelled sessions in the period."""
 
-    documents = await session_model.get_by_fields(
+    count = await session_model.count(
         {
             "restaurantId": restaurant_id,
             "status": "cancelled",
@@ -227,7 +257,6 @@ async def count_cancelled_sessions(
             "endTime": {"$lte": to_date},
         }
     )
-    count = len(documents)
 
     return CancelledCount(cancelled_count=count)
 
@@ -240,25 +269,28 @@ async def average_session_duration(
 
     """Compute the average duration of closed sessions for a period."""
 
-    sessions = await session_model.get_by_fields(
+    pipeline = [
         {
-            "restaurantId": restaurant_id,
-            "status": "closed",
-            "startTime": {"$gte": from_date},
-            "endTime": {"$lte": to_date},
-        }
-    )
-
-    if not sessions:
-        return AverageSessionDuration(average_duration_minutes=0.0)
-
-    durations = [
-        (s.end_time - s.start_time).total_seconds() / 60.0
-        for s in sessions
-        if s.end_time and s.start_time
+            "$match": {
+                "restaurantId": restaurant_id,
+                "status": "closed",
+                "startTime": {"$gte": from_date},
+                "endTime": {"$lte": to_date},
+            }
+        },
+        {
+            "$group": {
+                "_id": None,
+                "averageMilliseconds": {
+                    "$avg": {"$subtract": ["$endTime", "$startTime"]}
+                },
+            }
+        },
     ]
+    docs = await session_model.aggregate(pipeline)
 
-    avg_duration = sum(durations) / len(durations) if durations else 0.0
+    average_ms = docs[0].get("averageMilliseconds") if docs else None
+    avg_duration = average_ms / 60000.0 if average_ms else 0.0
 
     return AverageSessionDuration(average_duration_minutes=round(avg_duration, 2))
 
@@ -268,61 +300,103 @@ async def active_sessions_count(
 ) -> ActiveSessionCount:
     """Return the number of active sessions with at least one order."""
 
-    sessions = await session_model.get_by_fields(
+    count = await session_model.count(
         {
             "restaurantId": restaurant_id,
             "status": "active",
             "orders": {"$ne": []},
         }
     )
-    count = len(sessions)
     return ActiveSessionCount(active_sessions=count)
 
 
 
+def _bucket_start(value: datetime, granularity: TimeSeriesGranularity) -> datetime:
+    """Return the start of the Luanda-local bucket containing ``value``."""
+    local = to_luanda_timezone(value).replace(minute=0, second=0, microsecond=0)
+    if granularity == TimeSeriesGranularity.HOUR:
+        return local
+    local = local.replace(hour=0)
+    if granularity == TimeSeriesGranularity.WEEK:
+        local -= timedelta(days=local.weekday())
+    return local
+
+
+async def order_count_time_series(
+    restaurant_id: str,
+    days: int = 7,
+    granularity: TimeSeriesGranularity = TimeSeriesGranularity.DAY,
+    end: datetime | None = None,
+) -> List[OrderCountPoint]:
+    """Return the number of valid orders per bucket over the last ``days`` days.
+
+    Orders are grouped with ``$dateTrunc`` on Africa/Luanda bucket boundaries
+    (weeks start on Monday) and empty buckets are filled with zero by
+    ``$densify``, so the whole series is a single round trip regardless of the
+    window size. ``end`` is exclusive and defaults to now.
+    """
+    end = end or now_in_luanda()
+    start = _bucket_start(end - timedelta(days=days), granularity)
+    unit = granularity.value
+
+    date_trunc = {"date": "$createdAt", "unit": unit, "timezone": LUANDA_TIMEZONE}
+    if granularity == TimeSeriesGranularity.WEEK:
+        date_trunc["startOfWeek"] = "monday"
+
+    pipeline = [
+        {
+            "$match": {
+                "restaurantId": restaurant_id,
+                "prepStatus": {"$in": valid_orders},
+                "createdAt": {"$gte": start, "$lt": end},
+            }
+        },
+        {
+            "$group": {
+                "_id": {"$dateTrunc": date_trunc},
+                "count": {"$sum": 1},
+            }
+        },
+        {"$project": {"_id": 0, "bucket": "$_id", "count": 1}},
+        # Seed the first bucket so $densify has a document to fill from on empty windows
+        {"$unionWith": {"pipeline": [{"$documents": [{"bucket": start, "count": 0}]}]}},
+        {"$group": {"_id": "$bucket", "count": {"$sum": "$count"}}},
+        {"$project": {"_id": 0, "bucket": "$_id", "count": 1}},
+        {"$densify": {"field": "bucket", "range": {"step": 1, "unit": unit, "bounds": [start, end]}}},
+        {"$set": {"count": {"$ifNull": ["$count", 0]}}},
+        {"$sort": {"bucket": 1}},
+    ]
+    docs = await order_model.aggregate(pipeline)
+
+    return [
+        OrderCountPoint(date=to_luanda_timezone(doc["bucket"]), order_count=doc["count"])
+        for doc in docs
+    ]
+
+
 async def last_seven_days_order_count(
         restaurant_id: str,
 ):
     """Return the number of orders for each of the last seven days.
 
     The count is based on the ``createdAt`` field so that orders are grouped
-    strictly by the day they were placed. ``createdAt`` was previously used
-    which could include documents created on a different day from when the
-    order was placed. Using ``createdAt`` ensures each day's window is
-    correctly respected.
+    strictly by the day they were placed. Days follow the Luanda calendar and
+    today is excluded; the most recent day comes first.
     """
 
-    days: List[TotalOrdersCount] = []
-
     try:
-        now = now_in_luanda()
-
-        for i in range(7):
-            day = now - timedelta(days=i + 1)
-
-            day_start = day.replace(hour=0, minute=0, second=0, microsecond=0)
-            day_end = day.replace(hour=23, minute=59, second=59, microsecond=0)
-            weekday = day_start.strftime("%A")
-
-            documents = await order_model.get_by_fields(
-                {
-                    "restaurantId": restaurant_id,
-                    "prepStatus": {"$in": valid_orders},
-                    "createdAt": {"$gte": day_start, "$lte": day_end},
-                },
-                limit=0,
-            )
-
-            count = len(documents)
+        today = _bucket_start(now_in_luanda(), TimeSeriesGranularity.DAY)
+        series = await order_count_time_series(
+            restaurant_id, days=7, granularity=TimeSeriesGranularity.DAY, end=today
+        )
 
-            data = TotalOrdersCount(
-                day=weekday,
-                sales=count,
-                date=str(day_start.isoformat())
+        return [
+            TotalOrdersCount(
+                day=point.date.strftime("%A"),
+                sales=point.order_count,
+                date=str(point.date.isoformat())
             )
-
-            days.append(data)
-
-        return days
+            for point in reversed(series)
+        ]
     except Exception as error:
         print(error)
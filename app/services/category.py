@@ -1,13 +1,12 @@
 from app.models.category import CategoryModel
 from app.schema import category as category_schema
-from app.utils.slug import generate_unique_slug
+from app.utils.slug import create_with_unique_slug
 
 category_model = CategoryModel()
 
 async def create_category(data: category_schema.CategoryCreate):
     payload = data.model_dump(by_alias=False)
-    payload["slug"] = await generate_unique_slug(payload["name"], category_schema.CategoryDocument)
-    return await category_model.create(payload)
+    return await create_with_unique_slug(category_model, payload)
 
 async def update_category(category_id: str, data: category_schema.CategoryUpdate):
     update_data = data.model_dump(
@@ -67,4 +66,4 @@ async def get_category_by_slug(slug: str):
 async def count_categories_for_menu(menu_id: str) -> int:
     """Return the number of categories linked to a menu."""
     filters = {"menuId": menu_id}
-    return await category_schema.CategoryDocument.find(filters).count()
+    return await category_model.count(filters)
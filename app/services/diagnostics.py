@@ -1,5 +1,5 @@
 
-from typing import Any, Dict, List
+from typing import Any, AsyncIterator, Dict, List
 
 from bson import ObjectId
 
@@ -8,8 +8,8 @@ from app.models.table_session import TableSessionModel
 from app.schema.table_session import TableSessionStatus, TableSessionDocument
 from app.models.item import ItemModel
 from app.models.restaurant import RestaurantModel
-from app.utils.images import RESTAURANT_BANNER, RESTAURANT_LOGO
-from app.services.google_bucket import get_google_bucket_manager
+from app.utils.images import RESTAURANT_BANNER, RESTAURANT_LOGO, image_urls
+from app.services.google_bucket import get_async_bucket_manager
 
 
 table_model = TableModel()
@@ -52,65 +52,77 @@ async def duplicate_active_sessions() -> List[Dict[str, Any]]:
     ]
 
 
+async def iter_mismatched_current_sessions() -> AsyncIterator[Dict[str, Any]]:
+    """Yield tables whose currentSessionId does not match an active session.
+
+    Tables are streamed; only the ids of open sessions are held in memory.
+    """
+    # One query for every open session instead of one per table
+    active_by_table: Dict[str, List[str]] = {}
+    sessions = await session_model.find_rows(
+        {"status": {"$in": [TableSessionStatus.ACTIVE, TableSessionStatus.NEED_BILL]}},
+        ["id", "table_id"],
+    )
+    for s in sessions:
+        active_by_table.setdefault(s.table_id, []).append(str(s.id))
+
+    tables = table_model.stream({}, ["restaurant_id", "number", "current_session_id"])
+    async for t in tables:
+        table_id = str(t["_id"])
+        active_ids = active_by_table.get(table_id, [])
+        if t.get("currentSessionId") not in active_ids:
+            yield {
+                "tableId": table_id,
+                "restaurantId": t.get("restaurantId"),
+                "tableNumber": t.get("number"),
+                "currentSessionId": t.get("currentSessionId"),
+                "activeSessionIds": active_ids,
+            }
+
+
 async def mismatched_current_sessions() -> List[Dict[str, Any]]:
     """Return tables whose currentSessionId does not match an active session."""
-    tables = await table_model.get_all()
-    mismatches: List[Dict[str, Any]] = []
-    for t in tables:
-        filter = {
-            "$and": [
-                {
-                    "tableId": str(t.id)
-                }, {
-                    "status": {"$in": [TableSessionStatus.ACTIVE, TableSessionStatus.NEED_BILL]}
-                }
-            ]
-        }
-        sessions = await session_model.get_by_fields(filter)
-
-        active_ids = [str(s.id) for s in sessions]
-        if t.current_session_id not in active_ids:
-            mismatches.append(
-                {
-                    "tableId": str(t.id),
-                    "restaurantId": t.restaurant_id,
-                    "tableNumber": t.number,
-                    "currentSessionId": t.current_session_id,
-                    "activeSessionIds": active_ids,
-                }
-            )
-    return mismatches
+    return [m async for m in iter_mismatched_current_sessions()]
 
 
-async def orphan_sessions() -> List[Dict[str, Any]]:
-    """Return sessions that are not referenced by any table."""
-    tables = await table_model.get_all()
-    linked_ids = {t.current_session_id for t in tables if t.current_session_id}
-    coll = TableSessionDocument.get_motor_collection()
+async def iter_orphan_sessions() -> AsyncIterator[Dict[str, Any]]:
+    """Yield sessions that are not referenced by any table."""
+    linked_ids = set(await table_model.values("current_session_id", {}))
     query: Dict[str, Any] = {}
     if linked_ids:
         object_ids = [ObjectId(sid) for sid in linked_ids]
         query = {"_id": {"$nin": object_ids}}
-    docs = await coll.find(query).to_list(None)
-    return [
-        {
+    async for d in session_model.stream(query, ["table_id", "status"]):
+        yield {
             "sessionId": str(d["_id"]),
             "tableId": d.get("tableId"),
             "status": d.get("status"),
         }
-        for d in docs
-    ]
+
+
+async def orphan_sessions() -> List[Dict[str, Any]]:
+    """Return sessions that are not referenced by any table."""
+    return [o async for o in iter_orphan_sessions()]
+
+
+async def _iter_blobs(manager, prefix: str) -> AsyncIterator[Any]:
+    """Yield the blobs under ``prefix``, fetching one listing page at a time off the event loop.
+
+    Listing already returns each blob's custom metadata, so no per-blob reload is needed.
+    """
+    pages = manager.manager.client.list_blobs(manager.bucket, prefix=prefix).pages
+    while (page := await manager.run_io(next, pages, None)) is not None:
+        for blob in page:
+            yield blob
 
 
 async def cleanup_unlinked_images() -> List[str]:
     """Delete images in cloud storage not linked to any item or restaurant."""
-    manager = get_google_bucket_manager()
+    manager = get_async_bucket_manager()
     deleted: List[str] = []
-    images = manager.list_images(folder="neemble-eat-storage")
 
     # Iterate over all uploaded images
-    for blob in manager.client.list_blobs(manager.bucket, prefix="uploads/"):
-        blob.reload()
+    async for blob in _iter_blobs(manager, prefix="uploads/"):
         metadata = blob.metadata or {}
 
         item_id = metadata.get("item_id")
@@ -122,23 +134,23 @@ async def cleanup_unlinked_images() -> List[str]:
 
         if item_id:
             item = await item_model.get(item_id)
-            if not item or item.image_url != blob_url:
+            if not item or blob_url not in image_urls(item.image_url, item.image):
                 unlink = True
         elif restaurant_id:
             restaurant = await restaurant_model.get(restaurant_id)
-            expected_url = None
+            expected_urls = []
             if restaurant:
                 if image_type == RESTAURANT_BANNER:
-                    expected_url = restaurant.banner_url
+                    expected_urls = image_urls(restaurant.banner_url, restaurant.banner_image)
                 elif image_type == RESTAURANT_LOGO:
-                    expected_url = restaurant.logo_url
-            if not restaurant or expected_url != blob_url:
+                    expected_urls = image_urls(restaurant.logo_url, restaurant.logo_image)
+            if not restaurant or blob_url not in expected_urls:
                 unlink = True
         else:
             unlink = True
 
         if unlink:
-            if manager.delete_image(blob.name):
+            if await manager.delete_image(blob.name):
                 deleted.append(blob.name)
 
     return deleted
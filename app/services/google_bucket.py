@@ -1,12 +1,14 @@
 import os
 import io
 import uuid
-from functools import lru_cache
-from typing import Optional, List, Dict, Union, BinaryIO, Tuple
+import asyncio
+import multiprocessing
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from functools import lru_cache, partial
+from typing import Any, Callable, Optional, List, Dict, Union, BinaryIO, Tuple, TypeVar
 from pathlib import Path
 from datetime import datetime, timedelta
-from dataclasses import dataclass
-from enum import Enum
+from dataclasses import dataclass, field
 
 from google.cloud import storage
 from google.cloud.exceptions import NotFound
@@ -15,15 +17,20 @@ from PIL import Image, ImageOps
 from google.oauth2.service_account import Credentials
 
 from app.core.dependencies import get_logger, get_settings, get_gcp_service_account_credentials
+from app.utils.image_processing import (
+    ImageFormat,
+    ImageInput,
+    ImageVariantData,
+    ProcessedImage,
+    build_variants,
+    make_thumbnail,
+    optimize_image,
+    process_image,
+    read_image_info,
+)
 from app.utils.time import now_in_luanda
 
-
-class ImageFormat(Enum):
-    """Supported image formats"""
-    JPEG = "JPEG"
-    PNG = "PNG"
-    WEBP = "WEBP"
-    AVIF = "AVIF"
+T = TypeVar("T")
 
 
 @dataclass
@@ -49,6 +56,8 @@ class UploadResult:
     signed_url: Optional[str] = None
     metadata: Optional[ImageMetadata] = None
     error: Optional[str] = None
+    # Resized copies uploaded alongside the image, see ``AsyncGCSImageManager.upload_variants``
+    variants: List["UploadResult"] = field(default_factory=list)
 
 
 class GCSImageManager:
@@ -146,59 +155,20 @@ class GCSImageManager:
         Returns:
             Tuple of (optimized_image_bytes, content_type)
         """
-        quality = quality or self.default_quality
-
-        # Resize if needed
-        # if image.size[0] > self.max_image_size[0] or image.size[1] > self.max_image_size[1]:
-        #     image = ImageOps.fit(
-        #         image,
-        #         self.max_image_size,
-        #         Image.Resampling.LANCZOS
-        #     )
-
-        # Convert to RGB if necessary (for JPEG)
-        if format_type == ImageFormat.JPEG and image.mode in ('RGBA', 'LA', 'P'):
-            background = Image.new('RGB', image.size, (255, 255, 255))
-            if image.mode == 'P':
-                image = image.convert('RGBA')
-            background.paste(image, mask=image.split()[-1] if image.mode == 'RGBA' else None)
-            image = background
-
-        # Save optimized image to bytes
-        output = io.BytesIO()
-        save_kwargs = {}
-
-        if format_type in [ImageFormat.JPEG, ImageFormat.WEBP]:
-            save_kwargs['quality'] = quality
-            save_kwargs['optimize'] = True
-
-        if format_type == ImageFormat.PNG:
-            save_kwargs['optimize'] = True
-
-        image.save(output, format=format_type.value, **save_kwargs)
-
-        # Determine content type
-        content_type_map = {
-            ImageFormat.JPEG: 'image/jpeg',
-            ImageFormat.PNG: 'image/png',
-            ImageFormat.WEBP: 'image/webp',
-            ImageFormat.AVIF: 'image/avif'
-        }
-
-        return output.getvalue(), content_type_map[format_type]
+        return optimize_image(image, format_type, quality or self.default_quality)
 
     def _extract_image_metadata(self, image_data: bytes, filename: str) -> ImageMetadata:
         """Extract metadata from image data"""
         try:
-            image = Image.open(io.BytesIO(image_data))
+            width, height, image_format = read_image_info(image_data)
 
             return ImageMetadata(
                 filename=filename,
                 size_bytes=len(image_data),
-                width=image.size[0],
-                height=image.size[1],
-                format=image.format or 'Unknown',
-                content_type=f'image/{image.format.lower()}' if image.format else 'application/octet-stream',
+                width=width,
+                height=height,
+                format=image_format,
+                content_type=f'image/{image_format.lower()}' if image_format != 'Unknown' else 'application/octet-stream',
                 created_at=now_in_luanda()
             )
         except Exception as e:
@@ -213,107 +183,91 @@ class GCSImageManager:
                 created_at=now_in_luanda()
             )
 
-    def upload_image(
+    def read_source(
             self,
             image_source: Union[str, bytes, BinaryIO, Image.Image],
-            filename: Optional[str] = None,
+            filename: Optional[str] = None
+    ) -> Tuple[bytes, str]:
+        """
+        Turn an image file path, bytes, file object or PIL Image into bytes
+
+        Returns:
+            Tuple of (image_bytes, filename)
+
+        Raises:
+            ValueError: If the file does not exist or the source type is unsupported
+        """
+        if isinstance(image_source, str):
+            # File path
+            if not os.path.exists(image_source):
+                raise ValueError(f"File not found: {image_source}")
+            with open(image_source, 'rb') as f:
+                return f.read(), filename or os.path.basename(image_source)
+
+        if isinstance(image_source, bytes):
+            # Raw bytes
+            return image_source, filename or f"image_{uuid.uuid4().hex[:8]}.jpg"
+
+        if hasattr(image_source, 'read'):
+            # File-like object
+            return image_source.read(), filename or f"image_{uuid.uuid4().hex[:8]}.jpg"
+
+        if isinstance(image_source, Image.Image):
+            # PIL Image
+            output = io.BytesIO()
+            image_source.save(output, format='PNG')
+            return output.getvalue(), filename or f"image_{uuid.uuid4().hex[:8]}.png"
+
+        raise ValueError("Unsupported image source type")
+
+    def store_image(
+            self,
+            image: ProcessedImage,
+            filename: str,
             folder: Optional[str] = None,
-            public: bool = False,
-            optimize: Optional[bool] = None,
             format_type: ImageFormat = ImageFormat.JPEG,
-            quality: Optional[int] = None,
             metadata: Optional[Dict[str, str]] = None
     ) -> UploadResult:
         """
-        Upload an image to GCS with optimization options
-
-        Args:
-            image_source: Image file path, bytes, file object, or PIL Image
-            filename: Custom filename (auto-generated if None)
-            folder: Folder to upload to (uses default if None)
-            public: Whether to make the image publicly accessible
-            optimize: Whether to optimize the image (uses auto_optimize if None)
-            format_type: Output format for the image
-            quality: Image quality (1-100)
-            metadata: Additional metadata to store with the image
+        Upload an already processed image to GCS
 
-        Returns:
-            UploadResult with success status and details
+        This is the storage half of ``upload_image``; it does no image decoding.
         """
         try:
-            # Process image source
-            if isinstance(image_source, str):
-                # File path
-                if not os.path.exists(image_source):
-                    return UploadResult(
-                        success=False,
-                        blob_name="",
-                        error=f"File not found: {image_source}"
-                    )
-                with open(image_source, 'rb') as f:
-                    image_data = f.read()
-                filename = filename or os.path.basename(image_source)
-
-            elif isinstance(image_source, bytes):
-                # Raw bytes
-                image_data = image_source
-                filename = filename or f"image_{uuid.uuid4().hex[:8]}.jpg"
-
-            elif hasattr(image_source, 'read'):
-                # File-like object
-                image_data = image_source.read()
-                filename = filename or f"image_{uuid.uuid4().hex[:8]}.jpg"
-
-            elif isinstance(image_source, Image.Image):
-                # PIL Image
-                output = io.BytesIO()
-                image_source.save(output, format='PNG')
-                image_data = output.getvalue()
-                filename = filename or f"image_{uuid.uuid4().hex[:8]}.png"
-            else:
-                return UploadResult(
-                    success=False,
-                    blob_name="",
-                    error="Unsupported image source type"
-                )
+            if image.error:
+                self.logger.warning(f"Image optimization failed: {image.error}")
+                # Continue with original image
 
-            # Optimize image if requested
-            optimize = optimize if optimize is not None else self.auto_optimize
-            if optimize:
-                try:
-                    image = Image.open(io.BytesIO(image_data))
-                    image_data, content_type = self._optimize_image(
-                        image, format_type, quality
-                    )
-                    # Update filename extension if format changed
-                    filename = Path(filename).stem + f".{format_type.value.lower()}"
-                except Exception as e:
-                    self.logger.warning(f"Image optimization failed: {e}")
-                    # Continue with original image
+            # Update filename extension if format changed
+            if image.optimized:
+                filename = Path(filename).stem + f".{format_type.value.lower()}"
 
             # Generate blob name
             blob_name = self._generate_blob_name(filename, folder)
 
             # Create blob and upload
             blob = self.bucket.blob(blob_name)
-
-            # Set content type
-            if 'content_type' not in locals():
-                content_type = 'image/jpeg'  # default
-            blob.content_type = content_type
+            blob.content_type = image.content_type
 
             # Add custom metadata
             if metadata:
                 blob.metadata = metadata
 
             # Upload the image
-            blob.upload_from_string(image_data, content_type=content_type)
+            blob.upload_from_string(image.data, content_type=image.content_type)
 
             public_url = f"https://storage.googleapis.com/{self.bucket.name}/{blob_name}"
 
-            # Extract image metadata
-            img_metadata = self._extract_image_metadata(image_data, filename)
-            img_metadata.public_url = public_url
+            img_metadata = ImageMetadata(
+                filename=filename,
+                size_bytes=len(image.data),
+                width=image.width,
+                height=image.height,
+                format=image.format,
+                content_type=f'image/{image.format.lower()}' if image.format != 'Unknown' else 'application/octet-stream',
+                created_at=now_in_luanda(),
+                public_url=public_url
+            )
 
             self.logger.info(f"Successfully uploaded image: {blob_name}")
 
@@ -332,6 +286,46 @@ class GCSImageManager:
                 error=str(e)
             )
 
+    def upload_image(
+            self,
+            image_source: Union[str, bytes, BinaryIO, Image.Image],
+            filename: Optional[str] = None,
+            folder: Optional[str] = None,
+            public: bool = False,
+            optimize: Optional[bool] = None,
+            format_type: ImageFormat = ImageFormat.JPEG,
+            quality: Optional[int] = None,
+            metadata: Optional[Dict[str, str]] = None
+    ) -> UploadResult:
+        """
+        Upload an image to GCS with optimization options
+
+        Blocks on both Pillow and network I/O; async code should use
+        ``AsyncGCSImageManager`` instead.
+
+        Args:
+            image_source: Image file path, bytes, file object, or PIL Image
+            filename: Custom filename (auto-generated if None)
+            folder: Folder to upload to (uses default if None)
+            public: Whether to make the image publicly accessible
+            optimize: Whether to optimize the image (uses auto_optimize if None)
+            format_type: Output format for the image
+            quality: Image quality (1-100)
+            metadata: Additional metadata to store with the image
+
+        Returns:
+            UploadResult with success status and details
+        """
+        try:
+            image_data, filename = self.read_source(image_source, filename)
+        except ValueError as e:
+            return UploadResult(success=False, blob_name="", error=str(e))
+
+        optimize = optimize if optimize is not None else self.auto_optimize
+        processed = process_image(image_data, format_type, quality or self.default_quality, optimize)
+
+        return self.store_image(processed, filename, folder, format_type, metadata)
+
     def download_image(self, blob_name: str) -> Optional[bytes]:
         """Download an image from GCS"""
         try:
@@ -427,21 +421,22 @@ class GCSImageManager:
             image_sources: List[Union[str, bytes, BinaryIO]],
             folder: Optional[str] = None,
             public: bool = False,
-            optimize: bool = True
+            optimize: bool = True,
+            max_workers: int = 4
     ) -> List[UploadResult]:
-        """Upload multiple images in batch"""
-        results = []
-
-        for i, source in enumerate(image_sources):
-            filename = f"batch_image_{i}_{uuid.uuid4().hex[:8]}.jpg"
-            result = self.upload_image(
+        """Upload multiple images in batch, ``max_workers`` at a time; results keep the input order"""
+        def upload(indexed_source: Tuple[int, Union[str, bytes, BinaryIO]]) -> UploadResult:
+            i, source = indexed_source
+            return self.upload_image(
                 source,
-                filename=filename,
+                filename=f"batch_image_{i}_{uuid.uuid4().hex[:8]}.jpg",
                 folder=folder,
                 public=public,
                 optimize=optimize
             )
-            results.append(result)
+
+        with ThreadPoolExecutor(max_workers=max(1, max_workers), thread_name_prefix="gcs-batch") as pool:
+            results = list(pool.map(upload, enumerate(image_sources)))
 
         successful = sum(1 for r in results if r.success)
         self.logger.info(f"Batch upload completed: {successful}/{len(results)} successful")
@@ -471,6 +466,56 @@ class GCSImageManager:
             self.logger.error(f"Failed to get image info for {blob_name}: {e}")
             return None
 
+    def thumbnail_name(self, blob_name: str, suffix: str = "_thumb") -> str:
+        """Blob name of the thumbnail of ``blob_name``"""
+        path = Path(blob_name)
+        return f"{path.parent}/{path.stem}{suffix}{path.suffix}"
+
+    def put_bytes(
+            self,
+            blob_name: str,
+            data: bytes,
+            content_type: str,
+            metadata: Optional[Dict[str, str]] = None
+    ) -> None:
+        """Upload raw bytes to ``blob_name``"""
+        blob = self.bucket.blob(blob_name)
+        blob.content_type = content_type
+        if metadata:
+            blob.metadata = metadata
+        blob.upload_from_string(data, content_type=content_type)
+
+    def store_variant(
+            self,
+            variant: ImageVariantData,
+            base_name: str,
+            metadata: Optional[Dict[str, str]] = None
+    ) -> UploadResult:
+        """Upload one image variant as ``{base_name}_{width}w.{ext}``"""
+        blob_name = f"{base_name}_{variant.width}w.{variant.format.value.lower()}"
+        try:
+            self.put_bytes(blob_name, variant.data, variant.content_type, metadata)
+        except Exception as e:
+            self.logger.error(f"Failed to upload image variant {blob_name}: {e}")
+            return UploadResult(success=False, blob_name=blob_name, error=str(e))
+
+        public_url = f"https://storage.googleapis.com/{self.bucket.name}/{blob_name}"
+        return UploadResult(
+            success=True,
+            blob_name=blob_name,
+            public_url=public_url,
+            metadata=ImageMetadata(
+                filename=Path(blob_name).name,
+                size_bytes=len(variant.data),
+                width=variant.width,
+                height=variant.height,
+                format=variant.format.value,
+                content_type=variant.content_type,
+                created_at=now_in_luanda(),
+                public_url=public_url
+            )
+        )
+
     def create_thumbnail(
             self,
             blob_name: str,
@@ -483,22 +528,228 @@ class GCSImageManager:
             original_blob = self.bucket.blob(blob_name)
             image_data = original_blob.download_as_bytes()
 
-            # Create thumbnail
-            image = Image.open(io.BytesIO(image_data))
-            image.thumbnail(size, Image.Resampling.LANCZOS)
+            # Create and upload thumbnail
+            thumb_name = self.thumbnail_name(blob_name, suffix)
+            self.put_bytes(thumb_name, make_thumbnail(image_data, size), 'image/jpeg')
 
-            # Save thumbnail
-            output = io.BytesIO()
-            image.save(output, format='JPEG', quality=85, optimize=True)
+            self.logger.info(f"Created thumbnail: {thumb_name}")
+            return thumb_name
+
+        except Exception as e:
+            self.logger.error(f"Failed to create thumbnail for {blob_name}: {e}")
+            return None
+
+    def rename_image(self, blob_name: str, new_blob_name: str) -> Optional[str]:
+        """Move an image to ``new_blob_name``; return the new name or ``None`` on failure"""
+        try:
+            source_blob = self.bucket.blob(blob_name)
+            self.bucket.copy_blob(source_blob, self.bucket, new_blob_name)
+            source_blob.delete()
+            return new_blob_name
+        except Exception as e:
+            self.logger.error(f"Failed to rename blob {blob_name}: {e}")
+            return None
+
+
+class AsyncGCSImageManager:
+    """
+    Awaitable front for ``GCSImageManager``.
+
+    The storage client and Pillow both block, so calling the manager from a
+    request handler stalls every other request on the worker. Here image
+    decoding/encoding runs in a process pool (it holds the GIL) and storage
+    calls run in a thread pool whose size bounds the concurrent GCS requests.
+    With ``process_workers=0`` image work runs in the thread pool instead,
+    which suits single-CPU instances.
+    """
+
+    def __init__(
+            self,
+            manager: GCSImageManager,
+            process_workers: int = 2,
+            io_concurrency: int = 8
+    ):
+        self.manager = manager
+        self.logger = manager.logger
+        self.process_workers = process_workers
+        self._io_pool = ThreadPoolExecutor(max_workers=io_concurrency, thread_name_prefix="gcs-io")
+        self._cpu_pool: Optional[Executor] = None
+
+    @property
+    def bucket(self):
+        return self.manager.bucket
+
+    def _get_cpu_pool(self) -> Executor:
+        if self._cpu_pool is None:
+            if self.process_workers > 0:
+                # Spawned workers only import app.utils.image_processing; forking would copy the
+                # event loop, database and storage client threads into every worker
+                self._cpu_pool = ProcessPoolExecutor(
+                    max_workers=self.process_workers,
+                    mp_context=multiprocessing.get_context("spawn")
+                )
+            else:
+                self._cpu_pool = self._io_pool
+        return self._cpu_pool
+
+    async def run_io(self, func: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+        """Run a blocking storage call in the I/O pool"""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._io_pool, partial(func, *args, **kwargs))
+
+    async def run_cpu(self, func: Callable[..., T], *args: Any) -> T:
+        """Run an image processing function from ``app.utils.image_processing`` in the process pool"""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._get_cpu_pool(), func, *args)
+
+    async def process_image(
+            self,
+            image_input: ImageInput,
+            format_type: ImageFormat = ImageFormat.JPEG,
+            quality: Optional[int] = None,
+            optimize: Optional[bool] = None
+    ) -> ProcessedImage:
+        optimize = optimize if optimize is not None else self.manager.auto_optimize
+        return await self.run_cpu(
+            process_image, image_input, format_type, quality or self.manager.default_quality, optimize
+        )
+
+    async def upload_image(
+            self,
+            image_source: Union[str, bytes, BinaryIO, Image.Image],
+            filename: Optional[str] = None,
+            folder: Optional[str] = None,
+            public: bool = False,
+            optimize: Optional[bool] = None,
+            format_type: ImageFormat = ImageFormat.JPEG,
+            quality: Optional[int] = None,
+            metadata: Optional[Dict[str, str]] = None
+    ) -> UploadResult:
+        """Same as ``GCSImageManager.upload_image`` without blocking the event loop
+
+        File paths are handed to the image worker as they are, so the file is
+        only read there and only the processed image comes back.
+        """
+        try:
+            if isinstance(image_source, bytes):
+                image_input = image_source
+                filename = filename or f"image_{uuid.uuid4().hex[:8]}.jpg"
+            elif isinstance(image_source, str):
+                if not os.path.exists(image_source):
+                    raise ValueError(f"File not found: {image_source}")
+                image_input = image_source
+                filename = filename or os.path.basename(image_source)
+            else:
+                image_input, filename = await self.run_io(self.manager.read_source, image_source, filename)
+        except ValueError as e:
+            return UploadResult(success=False, blob_name="", error=str(e))
 
-            # Generate thumbnail blob name
-            path = Path(blob_name)
-            thumb_name = f"{path.parent}/{path.stem}{suffix}{path.suffix}"
+        processed = await self.process_image(image_input, format_type, quality, optimize)
+        return await self.run_io(self.manager.store_image, processed, filename, folder, format_type, metadata)
+
+    async def upload_variants(
+            self,
+            image_input: ImageInput,
+            filename: str,
+            folder: str,
+            widths: Tuple[int, ...],
+            quality: Optional[int] = None,
+            metadata: Optional[Dict[str, str]] = None
+    ) -> List[UploadResult]:
+        """
+        Upload resized copies of an image in every width and variant format
+
+        All variants of one upload share a unique blob name prefix. Returns an
+        empty list if any variant fails; the ones already uploaded are removed.
+        """
+        try:
+            variants = await self.run_cpu(
+                build_variants, image_input, widths, quality or self.manager.default_quality
+            )
+        except Exception as e:
+            self.logger.warning(f"Failed to build image variants: {e}")
+            return []
 
-            # Upload thumbnail
-            thumb_blob = self.bucket.blob(thumb_name)
-            thumb_blob.content_type = 'image/jpeg'
-            thumb_blob.upload_from_string(output.getvalue())
+        base_name = self.manager._generate_blob_name(Path(filename).stem, folder)
+        results = await asyncio.gather(
+            *(self.run_io(self.manager.store_variant, variant, base_name, metadata) for variant in variants)
+        )
+
+        if not all(result.success for result in results):
+            await asyncio.gather(
+                *(self.delete_image(result.blob_name) for result in results if result.success)
+            )
+            return []
+        return list(results)
+
+    async def batch_upload(
+            self,
+            image_sources: List[Union[str, bytes, BinaryIO]],
+            folder: Optional[str] = None,
+            public: bool = False,
+            optimize: bool = True,
+            max_workers: int = 4
+    ) -> List[UploadResult]:
+        """Upload multiple images concurrently, at most ``max_workers`` at a time"""
+        slots = asyncio.Semaphore(max(1, max_workers))
+
+        async def upload(i: int, source: Union[str, bytes, BinaryIO]) -> UploadResult:
+            async with slots:
+                return await self.upload_image(
+                    source,
+                    filename=f"batch_image_{i}_{uuid.uuid4().hex[:8]}.jpg",
+                    folder=folder,
+                    public=public,
+                    optimize=optimize
+                )
+
+        results = await asyncio.gather(*(upload(i, source) for i, source in enumerate(image_sources)))
+
+        successful = sum(1 for r in results if r.success)
+        self.logger.info(f"Batch upload completed: {successful}/{len(results)} successful")
+        return list(results)
+
+    async def download_image(self, blob_name: str) -> Optional[bytes]:
+        return await self.run_io(self.manager.download_image, blob_name)
+
+    async def delete_image(self, blob_name: str) -> bool:
+        return await self.run_io(self.manager.delete_image, blob_name)
+
+    async def list_images(
+            self,
+            folder: Optional[str] = None,
+            limit: Optional[int] = None,
+            include_metadata: bool = False
+    ) -> List[Union[str, ImageMetadata]]:
+        return await self.run_io(self.manager.list_images, folder, limit, include_metadata)
+
+    async def get_image_info(self, blob_name: str) -> Optional[ImageMetadata]:
+        return await self.run_io(self.manager.get_image_info, blob_name)
+
+    async def generate_signed_url(
+            self,
+            blob_name: str,
+            expiration_hours: int = 1,
+            method: str = 'GET'
+    ) -> Optional[str]:
+        return await self.run_io(self.manager.generate_signed_url, blob_name, expiration_hours, method)
+
+    async def rename_image(self, blob_name: str, new_blob_name: str) -> Optional[str]:
+        return await self.run_io(self.manager.rename_image, blob_name, new_blob_name)
+
+    async def create_thumbnail(
+            self,
+            blob_name: str,
+            size: Tuple[int, int] = (150, 150),
+            suffix: str = "_thumb"
+    ) -> Optional[str]:
+        """Create a thumbnail version of an image"""
+        try:
+            image_data = await self.run_io(self.manager.bucket.blob(blob_name).download_as_bytes)
+            thumbnail = await self.run_cpu(make_thumbnail, image_data, size)
+
+            thumb_name = self.manager.thumbnail_name(blob_name, suffix)
+            await self.run_io(self.manager.put_bytes, thumb_name, thumbnail, 'image/jpeg')
 
             self.logger.info(f"Created thumbnail: {thumb_name}")
             return thumb_name
@@ -507,6 +758,13 @@ class GCSImageManager:
             self.logger.error(f"Failed to create thumbnail for {blob_name}: {e}")
             return None
 
+    def shutdown(self) -> None:
+        """Stop the worker pools; called when the app shuts down"""
+        if self._cpu_pool is not None and self._cpu_pool is not self._io_pool:
+            self._cpu_pool.shutdown(wait=False, cancel_futures=True)
+        self._cpu_pool = None
+        self._io_pool.shutdown(wait=False, cancel_futures=True)
+
 
 @lru_cache
 def get_google_bucket_manager():
@@ -531,4 +789,21 @@ def get_google_bucket_manager():
         auto_optimize=True,
         max_image_size=(1920, 1080)
     )
-    return manager
\ No newline at end of file
+    return manager
+
+
+@lru_cache
+def get_async_bucket_manager() -> AsyncGCSImageManager:
+    settings = get_settings()
+    return AsyncGCSImageManager(
+        get_google_bucket_manager(),
+        process_workers=settings.IMAGE_PROCESS_WORKERS,
+        io_concurrency=settings.STORAGE_IO_CONCURRENCY
+    )
+
+
+def close_async_bucket_manager() -> None:
+    """Shut down the async manager's pools if it was ever created"""
+    if get_async_bucket_manager.cache_info().currsize:
+        get_async_bucket_manager().shutdown()
+        get_async_bucket_manager.cache_clear()
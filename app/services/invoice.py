@@ -8,6 +8,7 @@ from app.utils.time import now_in_luanda
 from app.schema.invoice_data import InvoiceData, InvoiceItem
 from app.services import restaurant as restaurant_service
 from app.services import table as table_service
+from app.services import restaurant_metrics as metrics_service
 
 
 session_model = TableSessionModel()
@@ -61,10 +62,21 @@ async def get_invoice_by_session(session_id: str):
     return None
 
 async def mark_invoice_paid(invoice_id: str):
-    return await invoice_model.update(invoice_id, {"status": InvoiceStatus.PAID})
+    invoice = await invoice_model.get(invoice_id)
+    if invoice and invoice.status == InvoiceStatus.PAID:
+        return invoice
+
+    updated = await invoice_model.update(invoice_id, {"status": InvoiceStatus.PAID})
+    if updated:
+        await metrics_service.record_invoice_paid(updated)
+    return updated
 
 async def cancel_invoice(invoice_id: str):
-    return await invoice_model.update(invoice_id, {"status": "cancelled", "isActive": False})
+    invoice = await invoice_model.get(invoice_id)
+    updated = await invoice_model.update(invoice_id, {"status": "cancelled", "isActive": False})
+    if updated and invoice and invoice.status == InvoiceStatus.PAID:
+        await metrics_service.record_invoice_paid(updated, reverted=True)
+    return updated
 
 async def list_invoices_for_restaurant(restaurant_id: str):
     filters = {"restaurantId": restaurant_id, "isActive": True}
@@ -1,7 +1,7 @@
 from app.models.item import ItemModel
 from app.models.category import CategoryModel
 from app.services.category import category_model
-from app.utils.slug import generate_unique_slug
+from app.utils.slug import create_with_unique_slug
 from app.schema import item as item_schema
 
 item_model = ItemModel()
@@ -9,8 +9,7 @@ item_model = ItemModel()
 async def create_item(data: dict):
     """Create a new item ensuring a unique slug is generated."""
     payload = data.copy()
-    payload["slug"] = await generate_unique_slug(payload["name"], item_schema.ItemDocument)
-    return await item_model.create(payload)
+    return await create_with_unique_slug(item_model, payload)
 
 async def update_item(item_id: str, data: dict):
     """Update an item by id."""
@@ -132,10 +131,9 @@ async def delete_customization_option(item_id: str, customization_index: int, op
 
 async def list_items_by_menu(menu_id: str):
     """List all available items for a specific menu."""
-    categories = await CategoryModel().get_by_fields({"menuId": menu_id, "isActive": True})
-    all_items: list[item_schema.ItemDocument] = []
-    for category in categories:
-        items = await item_model.get_by_fields({"categoryId": str(category.id), "isAvailable": True})
-        all_items.extend(items)
-    return all_items
-
+    categories = await CategoryModel().get_by_fields({"menuId": menu_id, "isActive": True}, limit=0)
+    if not categories:
+        return []
+    return await item_schema.ItemDocument.find(
+        {"categoryId": {"$in": [str(c.id) for c in categories]}, "isAvailable": True}
+    ).to_list()
@@ -1,4 +1,7 @@
 
+from typing import Dict, List
+
+from bson import ObjectId
 from fastapi import HTTPException
 
 from app.models.menu import MenuModel
@@ -8,9 +11,7 @@ from app.models.item import ItemModel
 from app.schema import menu as menu_schema
 from app.schema import category as category_schema
 from app.schema import item as item_schema
-from app.utils.slug import generate_unique_slug
-from app.services import category as category_service
-from app.services import item as item_service
+from app.utils.slug import create_with_unique_slug, generate_unique_slugs
 
 
 menu_model = MenuModel()
@@ -20,8 +21,7 @@ item_model = ItemModel()
 
 async def create_menu(data: menu_schema.MenuCreate):
     payload = data.model_dump(by_alias=False)
-    payload["slug"] = await generate_unique_slug(payload["name"], menu_schema.MenuDocument)
-    menu = await menu_model.create(payload)
+    menu = await create_with_unique_slug(menu_model, payload)
 
     restaurant = await restaurant_model.get(data.restaurant_id)
     if restaurant:
@@ -118,7 +118,11 @@ async def remove_category_from_menu(menu_id: str, category_id: str):
 
 
 async def copy_menu_by_slug(menu_slug: str, restaurant_id: str) -> menu_schema.MenuDocument:
-    """Duplicate a menu, its categories and items using the menu slug."""
+    """Duplicate a menu, its categories and items using the menu slug.
+
+    Slugs for all copied categories and items are allocated with one query
+    per collection and the copies are written with one insert each.
+    """
     original_menu = await menu_model.get_by_slug(menu_slug)
     if not original_menu:
         raise Exception("Menu not found")
@@ -133,47 +137,55 @@ async def copy_menu_by_slug(menu_slug: str, restaurant_id: str) -> menu_schema.M
     )
     new_menu = await create_menu(new_menu_data)
 
-    new_slug = await generate_unique_slug(new_menu.name, menu_schema.MenuDocument)
-    new_menu = await menu_model.update(str(new_menu.id), {
-        "slug": new_slug,
-        "position": original_menu.position,
-    })
-
-    # Duplicate categories
-    categories = await category_model.get_by_fields({"menuId": str(original_menu.id)})
-    for category in categories:
-        cat_data = category_schema.CategoryCreate(
-            name=category.name,
-            restaurant_id=restaurant_id,
-            description=category.description,
-            menu_id=str(new_menu.id),
+    categories = await category_model.get_by_fields({"menuId": str(original_menu.id)}, limit=0)
+    items = []
+    if categories:
+        items = await item_model.get_by_fields(
+            {"categoryId": {"$in": [str(category.id) for category in categories]}}, limit=0
         )
-        new_cat = await category_service.create_category(cat_data)
-        cat_slug = await generate_unique_slug(new_cat.name, category_schema.CategoryDocument)
-        await category_model.update(str(new_cat.id), {
-            "slug": cat_slug,
+
+    # Ids are assigned up front so categories and items can reference each other in a single pass
+    new_category_ids = {str(category.id): ObjectId() for category in categories}
+    item_payloads = []
+    item_ids_by_category: Dict[str, List[str]] = {}
+    item_slugs = await generate_unique_slugs([item.name for item in items], item_schema.ItemDocument)
+    for item, slug in zip(items, item_slugs):
+        new_item_id = ObjectId()
+        item_ids_by_category.setdefault(item.category_id, []).append(str(new_item_id))
+        item_payloads.append({
+            "id": new_item_id,
+            "name": item.name,
+            "slug": slug,
+            "price": item.price,
+            "restaurantId": restaurant_id,
+            "categoryId": str(new_category_ids[item.category_id]),
+            "description": item.description,
+            "customizations": [c.model_dump(by_alias=True) for c in item.customizations],
+            "imageUrl": item.image_url,
+            "image": item.image.model_dump() if item.image else None,
+            "isAvailable": item.is_available,
+        })
+
+    category_payloads = []
+    category_slugs = await generate_unique_slugs([c.name for c in categories], category_schema.CategoryDocument)
+    for category, slug in zip(categories, category_slugs):
+        category_payloads.append({
+            "id": new_category_ids[str(category.id)],
+            "name": category.name,
+            "slug": slug,
+            "restaurantId": restaurant_id,
+            "description": category.description,
+            "menuId": str(new_menu.id),
+            "itemIds": item_ids_by_category.get(str(category.id), []),
             "position": category.position,
             "isActive": category.is_active,
             "tags": category.tags,
         })
-        await add_category_to_menu(str(new_menu.id), str(new_cat.id))
-
-        # Duplicate items within the category
-        items = await item_model.get_by_fields({"categoryId": str(category.id)})
-        for item in items:
-            item_payload = {
-                "name": item.name,
-                "price": item.price,
-                "restaurantId": restaurant_id,
-                "categoryId": str(new_cat.id),
-                "description": item.description,
-                "customizations": [c.model_dump(by_alias=True) for c in item.customizations],
-                "imageUrl": item.image_url,
-                "isAvailable": item.is_available,
-            }
-            new_item = await item_service.create_item(item_payload)
-            item_slug = await generate_unique_slug(new_item.name, item_schema.ItemDocument)
-            await item_model.update(str(new_item.id), {"slug": item_slug})
-            await category_service.add_item_to_category(str(new_cat.id), str(new_item.id))
-
-    return new_menu
+
+    await category_model.create_many(category_payloads)
+    await item_model.create_many(item_payloads)
+
+    return await menu_model.update(str(new_menu.id), {
+        "position": original_menu.position,
+        "categoryIds": [str(new_category_ids[str(category.id)]) for category in categories],
+    })
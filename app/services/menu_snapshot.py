@@ -0,0 +1,169 @@
+import asyncio
+import hashlib
+import json
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional
+
+from cachetools import TTLCache
+from fastapi import HTTPException
+
+from app.db.cache import on_write
+from app.models.menu import MenuModel
+from app.models.restaurant import RestaurantModel
+from app.schema import category as category_schema
+from app.schema import item as item_schema
+from app.schema import menu as menu_schema
+from app.schema import restaurant as restaurant_schema
+
+restaurant_model = RestaurantModel()
+menu_model = MenuModel()
+
+# Internal bookkeeping that the public menu never needs. ``model_dump(exclude=...)``
+# takes field names, not the camelCase keys they are written under.
+PRIVATE_RESTAURANT_FIELDS = {"table_ids", "session_ids", "order_ids"}
+PRIVATE_RESTAURANT_KEYS = PRIVATE_RESTAURANT_FIELDS | {
+    restaurant_schema.Restaurant.model_fields[name].alias for name in PRIVATE_RESTAURANT_FIELDS
+}
+
+
+@dataclass(frozen=True)
+class CompiledBody:
+    body: bytes
+    etag: str
+
+
+@dataclass(frozen=True)
+class MenuSnapshot:
+    restaurant_id: str
+    menu: CompiledBody   # restaurant + menu + categories with their items
+    items: CompiledBody  # flat list of items, the legacy ``/menu/items`` payload
+
+
+def _compile(payload: Any) -> CompiledBody:
+    body = json.dumps(payload, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+    return CompiledBody(body=body, etag=f'"{hashlib.sha1(body).hexdigest()}"')
+
+
+# Snapshots by restaurant slug. The TTL bounds staleness for writes made by other workers.
+_snapshots: TTLCache = TTLCache(maxsize=512, ttl=300)
+_pending: Dict[str, asyncio.Task] = {}
+_generation = 0
+
+
+def invalidate_restaurant(restaurant_id: str) -> None:
+    global _generation
+    _generation += 1
+    for slug, snapshot in list(_snapshots.items()):
+        if snapshot.restaurant_id == restaurant_id:
+            _snapshots.pop(slug, None)
+
+
+def _on_menu_write(document) -> None:
+    invalidate_restaurant(document.restaurant_id)
+
+
+def _on_restaurant_write(document) -> None:
+    invalidate_restaurant(str(document.id))
+
+
+on_write(restaurant_schema.RestaurantDocument.Settings.name, _on_restaurant_write)
+for _document in (menu_schema.MenuDocument, category_schema.CategoryDocument, item_schema.ItemDocument):
+    on_write(_document.Settings.name, _on_menu_write)
+
+
+def _order_items(
+    categories: List[category_schema.CategoryDocument], items: List[item_schema.ItemDocument]
+) -> Dict[str, List[item_schema.ItemDocument]]:
+    """Group items by category, following each category's ``itemIds`` order."""
+    grouped: Dict[str, List[item_schema.ItemDocument]] = {str(c.id): [] for c in categories}
+    for item in items:
+        grouped[item.category_id].append(item)
+
+    for category in categories:
+        position = {item_id: index for index, item_id in enumerate(category.item_ids)}
+        grouped[str(category.id)].sort(key=lambda i: position.get(str(i.id), len(position)))
+    return grouped
+
+
+def _public_restaurant(restaurant: restaurant_schema.RestaurantDocument) -> Dict[str, Any]:
+    payload = restaurant.to_response().model_dump(
+        mode="json", by_alias=True, exclude=PRIVATE_RESTAURANT_FIELDS
+    )
+    # The snapshot is served without authentication: never let session or order ids through
+    leaked = PRIVATE_RESTAURANT_KEYS & payload.keys()
+    if leaked:
+        print(f"❌ Private restaurant fields in the public menu snapshot: {sorted(leaked)}")
+        for key in leaked:
+            payload.pop(key)
+    return payload
+
+
+async def compile_menu_snapshot(slug: str) -> Optional[MenuSnapshot]:
+    """Build the public menu of a restaurant with one query per collection."""
+    restaurant = await restaurant_model.get_by_slug(slug)
+    if not restaurant:
+        return None
+
+    restaurant_payload = _public_restaurant(restaurant)
+    menu = await menu_model.get(restaurant.current_menu_id) if restaurant.current_menu_id else None
+    if not menu:
+        return MenuSnapshot(
+            restaurant_id=str(restaurant.id),
+            menu=_compile({"restaurant": restaurant_payload, "menu": None, "categories": []}),
+            items=_compile([]),
+        )
+
+    category_docs = await category_schema.CategoryDocument.find(
+        {"menuId": str(menu.id), "isActive": True}
+    ).sort("position").to_list()
+    item_docs = await item_schema.ItemDocument.find(
+        {"categoryId": {"$in": [str(c.id) for c in category_docs]}, "isAvailable": True}
+    ).to_list()
+    grouped = _order_items(category_docs, item_docs)
+
+    categories = []
+    items = []
+    for category in category_docs:
+        category_items = [
+            i.to_response().model_dump(mode="json", by_alias=True)
+            for i in grouped[str(category.id)]
+        ]
+        categories.append({
+            **category.to_response().model_dump(mode="json", by_alias=True),
+            "items": category_items,
+        })
+        items.extend(category_items)
+
+    return MenuSnapshot(
+        restaurant_id=str(restaurant.id),
+        menu=_compile({
+            "restaurant": restaurant_payload,
+            "menu": menu.to_response().model_dump(mode="json", by_alias=True),
+            "categories": categories,
+        }),
+        items=_compile(items),
+    )
+
+
+async def _compile_and_store(slug: str) -> Optional[MenuSnapshot]:
+    generation = _generation
+    snapshot = await compile_menu_snapshot(slug)
+    # Don't keep a snapshot that a concurrent write has already made stale
+    if snapshot and generation == _generation:
+        _snapshots[slug] = snapshot
+    return snapshot
+
+
+async def get_menu_snapshot(slug: str) -> MenuSnapshot:
+    """Return the compiled public menu for ``slug``, compiling it at most once concurrently."""
+    snapshot = _snapshots.get(slug)
+    if not snapshot:
+        task = _pending.get(slug)
+        if task is None:
+            task = _pending[slug] = asyncio.create_task(_compile_and_store(slug))
+            task.add_done_callback(lambda _: _pending.pop(slug, None))
+        snapshot = await asyncio.shield(task)
+
+    if not snapshot:
+        raise HTTPException(status_code=404, detail="Restaurant not found")
+    return snapshot
@@ -35,7 +35,7 @@ async def list_notifications(
 
 async def count_unread_notifications(user_id: str) -> int:
     filters = {"userId": user_id, "isRead": False}
-    return await notification_schema.NotificationDocument.find(filters).count()
+    return await notification_model.count(filters)
 
 
 async def create_notification(
@@ -1,4 +1,4 @@
-import json
+import asyncio
 from datetime import datetime, timedelta
 
 from beanie.operators import And, Eq, GTE, In
@@ -13,7 +13,9 @@ from app.services import (
     recipe as recipe_service,
     stock_item as stock_item_service,
     restaurant as restaurant_service,
+    restaurant_metrics as metrics_service,
 )
+from app.services.websocket_events import encode_event
 from app.services.websocket_manager import get_websocket_manger
 from app.schema import recipe as recipe_schema
 from app.utils.time import now_in_luanda
@@ -43,14 +45,15 @@ async def place_order(data: dict) -> order_schema.OrderDocument:
             data["sessionId"] = session_id
 
     order = await order_model.create(data)
+    await metrics_service.record_order_placed(order)
 
     if session_id:
-        await table_session_service.add_order_to_session(session_id, str(order.id))
+        await table_session_service.add_order_to_session(session_id, str(order.id), order=order)
 
     try:
         websocket_manager = get_websocket_manger()
-        json_data = json.dumps(order.to_response().model_dump(by_alias=True))
-        await websocket_manager.broadcast(json_data, f"{str(restaurant_id)}/order")
+        event = encode_event(order.to_response().model_dump(mode="json", by_alias=True))
+        await websocket_manager.broadcast(event, f"{str(restaurant_id)}/order")
     except Exception as error:
         print(str(error))
         raise HTTPException(
@@ -60,69 +63,147 @@ async def place_order(data: dict) -> order_schema.OrderDocument:
 
     # Adjust stock levels based on recipe if automatic adjustments are enabled
     if restaurant_id:
-        restaurant = await restaurant_service.get_restaurant(restaurant_id)
-        if (
-            restaurant
-            and restaurant.settings
-            and restaurant.settings.automatic_stock_adjustments
-        ):
-            recipe = await recipe_service.get_recipe_by_menu_item(
-                data.get("itemId"), restaurant_id
-            )
-            if recipe:
-                ingredients_updated = False
-                stock_cache = None
-                for ingredient in recipe.ingredients:
-                    stock_item = await stock_item_service.get_stock_item(
-                        ingredient.product_id
-                    )
-                    if not stock_item:
-                        if stock_cache is None:
-                            stock_cache = await stock_item_service.list_stock_items_for_restaurant(
-                                restaurant_id
-                            )
-                        match = next(
-                            (
-                                s
-                                for s in stock_cache
-                                if s.name.lower() == ingredient.product_name.lower()
-                            ),
-                            None,
-                        )
-                        if match:
-                            ingredient.product_id = str(match.id)
-                            stock_item = match
-                            ingredients_updated = True
-                    if stock_item:
-                        await stock_item_service.remove_stock(
-                            str(stock_item.id),
-                            ingredient.quantity * order.quantity,
-                            reason=f"Venda de {order.ordered_item_name}",
-                        )
-
-                if ingredients_updated:
-                    await recipe_service.update_recipe(
-                        str(recipe.id),
-                        recipe_schema.RecipeUpdate(ingredients=recipe.ingredients),
-                    )
+        await _adjust_stock_for_orders(restaurant_id, [order])
 
     return order
 
 
+async def _adjust_stock_for_orders(
+    restaurant_id: str, orders: list[order_schema.OrderDocument]
+) -> None:
+    """Remove recipe ingredients from stock for the given orders.
+
+    Restaurant settings and recipes are loaded once for the whole batch.
+    """
+    restaurant = await restaurant_service.get_restaurant(restaurant_id)
+    if not (
+        restaurant
+        and restaurant.settings
+        and restaurant.settings.automatic_stock_adjustments
+    ):
+        return
+
+    recipes = await recipe_service.list_recipes_for_menu_items(
+        [order.item_id for order in orders], restaurant_id
+    )
+    if not recipes:
+        return
+
+    product_ids = {
+        ingredient.product_id
+        for order in orders
+        if order.item_id in recipes
+        for ingredient in recipes[order.item_id].ingredients
+    }
+    stock_items = {
+        str(item.id): item
+        for item in await stock_item_service.get_stock_items(list(product_ids))
+    }
+
+    updated_recipes: dict[str, recipe_schema.RecipeDocument] = {}
+    removals: list[tuple[str, float, str]] = []
+    stock_cache = None
+    for order in orders:
+        recipe = recipes.get(order.item_id)
+        if not recipe:
+            continue
+
+        for ingredient in recipe.ingredients:
+            stock_item = stock_items.get(ingredient.product_id)
+            if not stock_item:
+                if stock_cache is None:
+                    stock_cache = await stock_item_service.list_stock_items_for_restaurant(
+                        restaurant_id
+                    )
+                match = next(
+                    (
+                        s
+                        for s in stock_cache
+                        if s.name.lower() == ingredient.product_name.lower()
+                    ),
+                    None,
+                )
+                if match:
+                    ingredient.product_id = str(match.id)
+                    stock_item = match
+                    updated_recipes[str(recipe.id)] = recipe
+            if stock_item:
+                removals.append((
+                    str(stock_item.id),
+                    ingredient.quantity * order.quantity,
+                    f"Venda de {order.ordered_item_name}",
+                ))
+
+    await stock_item_service.remove_stock_many(removals)
+
+    for recipe_id, recipe in updated_recipes.items():
+        await recipe_service.update_recipe(
+            recipe_id,
+            recipe_schema.RecipeUpdate(ingredients=recipe.ingredients),
+        )
+
+
 async def place_orders(data_list: list[dict], session_id: str | None = None) -> list[order_schema.OrderDocument]:
-    """Place multiple orders sequentially.
+    """Place multiple orders as a single batch.
 
     If ``session_id`` is provided, it will be used for all orders unless an
-    individual order already specifies a ``sessionId``.
+    individual order already specifies a ``sessionId``. Orders are written with
+    one ``insert_many``, attached to their session with one update per session
+    and announced with one websocket payload per channel.
     """
-    orders: list[order_schema.OrderDocument] = []
+    if not data_list:
+        return []
+
+    order_time = now_in_luanda()
+    resolved_sessions: dict[tuple[str, int], str | None] = {}
+    payloads: list[dict] = []
+
     for data in data_list:
         payload = data.copy()
-        payload["orderTime"] = now_in_luanda()
-        if session_id and "sessionId" not in payload:
+        payload["orderTime"] = order_time
+        if session_id and not payload.get("sessionId"):
             payload["sessionId"] = session_id
-        order = await place_order(payload)
-        orders.append(order)
+
+        restaurant_id = payload.get("restaurantId")
+        table_number = payload.get("tableNumber")
+        if not payload.get("sessionId") and restaurant_id and table_number is not None:
+            key = (restaurant_id, table_number)
+            if key not in resolved_sessions:
+                session = await table_session_service.get_active_session_for_restaurant_table(
+                    restaurant_id,
+                    table_number,
+                    create_if_missing=True,
+                )
+                resolved_sessions[key] = str(session.id) if session else None
+            payload["sessionId"] = resolved_sessions[key]
+
+        payloads.append(payload)
+
+    orders = await order_model.create_many(payloads)
+    await metrics_service.record_orders_placed(orders)
+
+    orders_by_session: dict[str, list[str]] = {}
+    orders_by_restaurant: dict[str, list[order_schema.OrderDocument]] = {}
+    for order in orders:
+        if order.session_id:
+            orders_by_session.setdefault(order.session_id, []).append(str(order.id))
+        orders_by_restaurant.setdefault(order.restaurant_id, []).append(order)
+
+    await asyncio.gather(*(
+        table_session_service.add_orders_to_session(sid, order_ids)
+        for sid, order_ids in orders_by_session.items()
+    ))
+
+    websocket_manager = get_websocket_manger()
+    for restaurant_id, restaurant_orders in orders_by_restaurant.items():
+        event = encode_event(
+            [o.to_response().model_dump(mode="json", by_alias=True) for o in restaurant_orders]
+        )
+        await websocket_manager.broadcast(event, f"{restaurant_id}/order")
+        await websocket_manager.broadcast(event, f"{restaurant_id}/session_order")
+
+        await _adjust_stock_for_orders(restaurant_id, restaurant_orders)
+
     return orders
 
 
@@ -164,9 +245,10 @@ async def list_recent_orders_for_restaurant(
 
     cutoff = now_in_luanda() - timedelta(hours=hours)
 
-    # Fetch all tables for the restaurant to determine their current sessions
-    tables = await table_service.list_tables_for_restaurant(restaurant_id)
-    session_ids = [t.current_session_id for t in tables if t.current_session_id]
+    # Only the tables' current sessions are needed, not the validated tables
+    session_ids = await table_service.table_model.values(
+        "current_session_id", {"restaurantId": restaurant_id}
+    )
 
     if not session_ids:
         return []
@@ -186,3 +268,12 @@ async def update_order(order_id: str, data: order_schema.OrderUpdate) -> order_s
 
 async def delete_order(order_id: str) -> bool:
     return await order_model.delete(order_id)
+
+
+async def _recent_orders_snapshot(restaurant_id: str) -> list[dict]:
+    orders = await list_recent_orders_for_restaurant(restaurant_id)
+    return [o.to_response().model_dump(mode="json", by_alias=True) for o in orders]
+
+
+get_websocket_manger().register_snapshot("order", _recent_orders_snapshot)
+get_websocket_manger().register_snapshot("session_order", _recent_orders_snapshot)
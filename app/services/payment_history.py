@@ -5,7 +5,8 @@ from fastapi import UploadFile
 
 from app.models.payment_history import PaymentHistoryModel
 from app.schema import payment_history as payment_schema
-from app.services.google_bucket import get_google_bucket_manager
+from app.services.google_bucket import get_async_bucket_manager
+from app.utils.images import spooled_upload
 
 payment_history_model = PaymentHistoryModel()
 
@@ -41,11 +42,12 @@ async def add_payment_record(
 async def save_payment_proof(
     file: UploadFile, subscription_id: str
 ):
-    manager = get_google_bucket_manager()
+    manager = get_async_bucket_manager()
     folder = f"subscriptions/{subscription_id}/payments"
-    return manager.upload_image(
-        await file.read(), filename=file.filename, folder=folder, public=True
-    )
+    async with spooled_upload(file) as path:
+        return await manager.upload_image(
+            path, filename=file.filename, folder=folder, public=True
+        )
 
 
 async def get_payment(payment_id: str) -> Optional[payment_schema.PaymentHistoryDocument]:
@@ -1,4 +1,4 @@
-from typing import List, Optional
+from typing import Dict, Iterable, List, Optional
 
 from app.models.recipe import RecipeModel
 from app.schema import recipe as recipe_schema
@@ -31,6 +31,21 @@ async def get_recipe_by_menu_item(
     return recipes[0] if recipes else None
 
 
+async def list_recipes_for_menu_items(
+    menu_item_ids: Iterable[str], restaurant_id: str
+) -> Dict[str, recipe_schema.RecipeDocument]:
+    """Return the recipes of several menu items keyed by menu item id, in one query."""
+    filters = {
+        "menuItemId": {"$in": list(set(menu_item_ids))},
+        "restaurantId": restaurant_id,
+    }
+    recipes = await recipe_model.get_by_fields(filters, limit=0)
+    by_item: Dict[str, recipe_schema.RecipeDocument] = {}
+    for recipe in recipes:
+        by_item.setdefault(recipe.menu_item_id, recipe)
+    return by_item
+
+
 async def update_recipe(recipe_id: str, data: recipe_schema.RecipeUpdate) -> Optional[recipe_schema.RecipeDocument]:
     return await recipe_model.update(recipe_id, data.model_dump(exclude_none=True, by_alias=True))
 
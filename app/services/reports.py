@@ -1,44 +1,60 @@
 from datetime import datetime
-from typing import List, Optional
+from typing import AsyncIterator, List, Optional
 
+from app.models.restaurant_metrics import hour_bucket
 from app.schema.reports import SalesReport, SalesReportPagination
-from app.schema.invoice import InvoiceDocument, InvoiceStatus
+from app.services.restaurant_metrics import metrics_model
 
 
-async def _aggregate_sales(
-    restaurant_id: str,
-    from_date: datetime,
-    to_date: datetime,
-) -> List[SalesReport]:
-    """Return aggregated sales for each day in the range."""
-    coll = InvoiceDocument.get_motor_collection()
-    pipeline = [
+def _sales_pipeline(restaurant_id: str, from_date: datetime, to_date: datetime) -> List[dict]:
+    return [
         {
             "$match": {
                 "restaurantId": restaurant_id,
-                "createdAt": {"$gte": from_date, "$lte": to_date},
-                "status": InvoiceStatus.PAID.value,
+                "hour": {"$gte": hour_bucket(from_date), "$lte": to_date},
+                "paidInvoices": {"$gt": 0},
             }
         },
         {
             "$group": {
-                "_id": {"$dateToString": {"format": "%Y-%m-%d", "date": "$createdAt"}},
-                "grossSales": {"$sum": {"$ifNull": ["$total", 0]}},
-                "orders": {"$sum": 1},
+                "_id": {"$dateToString": {"format": "%Y-%m-%d", "date": "$hour"}},
+                "grossSales": {"$sum": "$revenue"},
+                "orders": {"$sum": "$paidInvoices"},
             }
         },
         {"$sort": {"_id": 1}},
     ]
-    docs = await coll.aggregate(pipeline).to_list(None)
-    reports = [
-        SalesReport(
-            date=datetime.fromisoformat(doc["_id"]),
-            grossSales=round(doc.get("grossSales", 0.0), 2),
-            orders=doc.get("orders", 0),
-        )
-        for doc in docs
-    ]
-    return reports
+
+
+def _to_report(doc: dict) -> SalesReport:
+    return SalesReport(
+        date=datetime.fromisoformat(doc["_id"]),
+        grossSales=round(doc.get("grossSales", 0.0), 2),
+        orders=doc.get("orders", 0),
+    )
+
+
+async def iter_sales(
+    restaurant_id: str,
+    from_date: datetime,
+    to_date: datetime,
+) -> AsyncIterator[SalesReport]:
+    """Yield aggregated sales for each day in the range, oldest first.
+
+    Reads the ``restaurant_metrics_hourly`` rollup, so the cost grows with the
+    number of hours in the range instead of the number of invoices.
+    """
+    async for doc in metrics_model.aggregate_iter(_sales_pipeline(restaurant_id, from_date, to_date)):
+        yield _to_report(doc)
+
+
+async def _aggregate_sales(
+    restaurant_id: str,
+    from_date: datetime,
+    to_date: datetime,
+) -> List[SalesReport]:
+    """Return aggregated sales for each day in the range."""
+    return [report async for report in iter_sales(restaurant_id, from_date, to_date)]
 
 
 async def paginate_sales_reports(
@@ -48,15 +64,24 @@ async def paginate_sales_reports(
     limit: int = 10,
     cursor: Optional[str] = None,
 ) -> SalesReportPagination:
-    """Paginate ``SalesReport`` entries for a date range."""
-    reports = await _aggregate_sales(restaurant_id, from_date, to_date)
+    """Paginate ``SalesReport`` entries for a date range.
+
+    Only the requested page is kept; the rest of the range is counted as it
+    streams past.
+    """
     skip = int(cursor) if cursor else 0
-    items = reports[skip : skip + limit]
-    has_more = skip + limit < len(reports)
+    items: List[SalesReport] = []
+    total = 0
+    async for report in iter_sales(restaurant_id, from_date, to_date):
+        if skip <= total < skip + limit:
+            items.append(report)
+        total += 1
+
+    has_more = skip + limit < total
     next_cursor = str(skip + limit) if has_more else None
     return SalesReportPagination(
         items=items,
         nextCursor=next_cursor,
-        totalCount=len(reports),
+        totalCount=total,
         hasMore=has_more,
     )
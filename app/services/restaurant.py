@@ -4,7 +4,7 @@ from app.models.menu import MenuModel
 
 from app.models.restaurant import RestaurantModel
 from app.schema import restaurant as restaurant_schema
-from app.utils.slug import generate_unique_slug
+from app.utils.slug import create_with_unique_slug
 from app.services import item as item_service
 
 
@@ -14,8 +14,7 @@ menu_model = MenuModel()
 async def create_restaurant(data: restaurant_schema.RestaurantCreate):
     try:
         payload = data.model_dump(by_alias=False)
-        payload["slug"] = await generate_unique_slug(payload["name"], restaurant_schema.RestaurantDocument)
-        return await restaurant_model.create(payload)
+        return await create_with_unique_slug(restaurant_model, payload)
     except Exception as error:
         print(error)
         raise HTTPException(detail=str(error), status_code=500)
@@ -0,0 +1,88 @@
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional, Tuple
+
+from app.models.restaurant_metrics import RestaurantMetricsModel, hour_bucket
+from app.schema.invoice import InvoiceDocument
+from app.schema.order import OrderDocument
+from app.schema.restaurant_metrics import RestaurantMetricsHourlyDocument
+from app.schema.table_session import TableSessionDocument
+from app.utils.time import now_in_luanda
+
+metrics_model = RestaurantMetricsModel()
+
+
+def hours_between(start: datetime, end: datetime) -> List[datetime]:
+    """Return every hourly bucket from ``start`` to ``end`` (both inclusive)."""
+    current = hour_bucket(start)
+    last = hour_bucket(end)
+    hours: List[datetime] = []
+    while current <= last:
+        hours.append(current)
+        current += timedelta(hours=1)
+    return hours
+
+
+async def record_order_placed(order: OrderDocument) -> None:
+    try:
+        await metrics_model.increment(
+            order.restaurant_id,
+            order.created_at,
+            {"orders": 1, "itemsOrdered": order.quantity},
+        )
+    except Exception as error:
+        print(f"Failed to record order metrics: {error}")
+
+
+async def record_orders_placed(orders: List[OrderDocument]) -> None:
+    """Record a batch of orders, merging those that fall in the same hourly bucket."""
+    buckets: Dict[Tuple[str, datetime], Dict[str, float]] = {}
+    for order in orders:
+        counters = buckets.setdefault(
+            (order.restaurant_id, hour_bucket(order.created_at)),
+            {"orders": 0, "itemsOrdered": 0},
+        )
+        counters["orders"] += 1
+        counters["itemsOrdered"] += order.quantity
+    try:
+        await metrics_model.increment_many(
+            (restaurant_id, hour, counters) for (restaurant_id, hour), counters in buckets.items()
+        )
+    except Exception as error:
+        print(f"Failed to record order metrics: {error}")
+
+
+async def record_invoice_paid(invoice: InvoiceDocument, reverted: bool = False) -> None:
+    """Add a paid invoice to the rollup, or remove it again when ``reverted`` is set."""
+    sign = -1 if reverted else 1
+    try:
+        await metrics_model.increment(
+            invoice.restaurant_id,
+            invoice.created_at,
+            {"paidInvoices": sign, "revenue": sign * (invoice.total or 0.0)},
+        )
+    except Exception as error:
+        print(f"Failed to record invoice metrics: {error}")
+
+
+async def record_session_ended(session: TableSessionDocument, end_time: datetime) -> None:
+    try:
+        await metrics_model.increment(session.restaurant_id, end_time, {"closedSessions": 1})
+        if session.start_time:
+            await metrics_model.increment_hours(
+                session.restaurant_id,
+                hours_between(session.start_time, end_time),
+                {"occupiedSessions": 1},
+            )
+    except Exception as error:
+        print(f"Failed to record session metrics: {error}")
+
+
+async def list_hourly_metrics(
+    restaurant_id: str, from_date: datetime, to_date: Optional[datetime] = None
+) -> List[RestaurantMetricsHourlyDocument]:
+    return await metrics_model.get_range(restaurant_id, from_date, to_date or now_in_luanda())
+
+
+async def rebuild_metrics(restaurant_id: Optional[str] = None) -> int:
+    """Rebuild the hourly rollup from raw history for one or every restaurant."""
+    return await metrics_model.rebuild(restaurant_id)
@@ -1,5 +1,7 @@
 from datetime import datetime
-from typing import List, Optional
+
+from bson import ObjectId
+from typing import List, Optional, Tuple
 
 from app.models.stock_item import StockItemModel
 from app.models.movement import MovementModel
@@ -24,6 +26,13 @@ async def get_stock_item(item_id: str) -> Optional[stock_schema.StockItemDocumen
     return await stock_item_model.get(item_id)
 
 
+async def get_stock_items(item_ids: List[str]) -> List[stock_schema.StockItemDocument]:
+    valid_ids = [item_id for item_id in item_ids if ObjectId.is_valid(item_id)]
+    if not valid_ids:
+        return []
+    return await stock_item_model.get_many(valid_ids) or []
+
+
 async def list_stock_items_for_restaurant(restaurant_id: str) -> List[stock_schema.StockItemDocument]:
     return await stock_item_model.get_by_fields({"restaurantId": restaurant_id})
 
@@ -78,19 +87,18 @@ async def remove_stock(
     reason: str = "",
     user: str = "system",
 ) -> Optional[stock_schema.StockItemDocument]:
-    item = await stock_item_model.get(item_id)
-    if not item:
+    updated = await stock_item_model.remove_many([(item_id, quantity, reason)], user=user)
+    if not updated and quantity > 0:
         return None
-    new_quantity = item.current_quantity - quantity
-    if new_quantity < 0:
-        new_quantity = 0
-    updated = await stock_item_model.update(
-        item_id,
-        {"currentQuantity": new_quantity},
-        user=user,
-        reason=reason,
-    )
-    return updated
+    return await stock_item_model.get(item_id)
+
+
+async def remove_stock_many(
+    removals: List[Tuple[str, float, str]],
+    user: str = "system",
+) -> int:
+    """Atomically remove stock for several ``(item_id, quantity, reason)`` entries."""
+    return await stock_item_model.remove_many(removals, user=user)
 
 
 async def list_categories() -> List[str]:
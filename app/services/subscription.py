@@ -96,31 +96,19 @@ async def get_usage_metrics(user_id: str) -> dict:
     if not restaurant_ids:
         return {"restaurants": 0, "tables": 0, "reservations": 0, "staff": 0}
 
-    tables = await table_model.get_by_fields({
-        "restaurantId": {"$in": list(restaurant_ids)}
-    })
-
-    table_count = len(tables)
+    in_restaurants = {"restaurantId": {"$in": list(restaurant_ids)}}
 
-    reservations = await booking_model.get_by_fields({
-        "restaurantId": {"$in": list(restaurant_ids)}
-    })
+    # Only counts are needed, so count on the server instead of loading documents
+    table_count = await table_model.count(in_restaurants)
+    reservation_count = await booking_model.count(in_restaurants)
 
-    reservation_count = len(reservations)
+    allowed_role_ids = [str(_id) for _id in await role_model.values("id", in_restaurants)]
 
-    roles_in_restaurants = await role_model.get_by_fields({
-        "restaurantId": {"$in": list(restaurant_ids)}
+    staff_count = await user_model.count({
+        "isActive": True,
+        "memberships": {"$elemMatch": {"isActive": True, "roleId": {"$in": allowed_role_ids}}},
     })
 
-    allowed_role_ids = {str(r.id) for r in roles_in_restaurants}
-
-    users = await user_model.get_by_fields({"isActive": True})
-    staff_count = 0
-    for u in users:
-        if u.memberships:
-            if any(m.is_active and m.role_id in allowed_role_ids for m in u.memberships):
-                staff_count += 1
-
     return {
         "restaurants": len(restaurant_ids),
         "tables": table_count,
@@ -150,15 +138,17 @@ async def resume_subscription(subscription_id: str) -> Optional[subscription_sch
 async def backup_account_data(user_id: str) -> bytes:
     """Create a simple JSON backup of the user's account and subscriptions."""
     user = await user_model.get(user_id)
-    subs = await subscription_model.get_by_fields({"userId": user_id})
-
-    payload = {
-        "user": user.model_dump(by_alias=True) if user else {},
-        "subscriptions": [s.model_dump(by_alias=True) for s in subs] if subs else [],
-    }
 
+    # Subscriptions are written into the archive as they are read, one at a time
     buffer = io.BytesIO()
     with zipfile.ZipFile(buffer, mode="w") as zf:
-        zf.writestr("backup.json", json.dumps(payload))
+        with zf.open("backup.json", mode="w") as backup:
+            user_payload = user.model_dump(by_alias=True) if user else {}
+            backup.write(f'{{"user": {json.dumps(user_payload)}, "subscriptions": ['.encode())
+            separator = ""
+            async for s in subscription_model.iter_by_fields({"userId": user_id}):
+                backup.write(f"{separator}{json.dumps(s.model_dump(by_alias=True))}".encode())
+                separator = ", "
+            backup.write(b"]}")
     buffer.seek(0)
     return buffer.read()
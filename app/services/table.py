@@ -1,5 +1,8 @@
 from typing import Optional, List
 
+from bson import ObjectId
+from pymongo import UpdateOne
+
 from app.models.table import TableModel
 from app.models.restaurant import RestaurantModel
 from app.schema import table as table_schema
@@ -14,24 +17,33 @@ restaurant_model = RestaurantModel()
 
 
 async def organize_table_numbers(restaurant_id: str) -> List[table_schema.TableDocument]:
-    """Ensure tables for a restaurant have sequential numbers starting at 1."""
-    tables = await table_model.get_by_fields(filters={"restaurantId": restaurant_id}, limit=400)
-    tables_sorted = sorted(tables, key=lambda t: t.number)
+    """Ensure tables for a restaurant have sequential numbers starting at 1.
+
+    This is a maintenance operation run when tables are created or deleted;
+    all renumbering is sent in a single ordered ``bulk_write``. Ordering matters:
+    numbers only ever move down, so each target number has already been freed
+    by the previous operation and the unique ``(restaurantId, number)`` index
+    is never violated.
+    """
+    tables = await list_tables_for_restaurant(restaurant_id)
 
-    expected = 1
-    for t in tables_sorted:
+    operations = []
+    for expected, t in enumerate(tables, start=1):
         if t.number != expected:
-            await table_model.update(str(t.id), {"number": expected})
+            operations.append(
+                UpdateOne({"_id": ObjectId(str(t.id))}, {"$set": {"number": expected}})
+            )
             t.number = expected
-        expected += 1
 
-    return tables_sorted
+    if operations:
+        await table_schema.TableDocument.get_motor_collection().bulk_write(operations, ordered=True)
+        for t in tables:
+            table_model.invalidate(t.id)
+
+    return tables
 
 
 async def create_table(data: table_schema.TableCreate) -> table_schema.TableDocument:
-    # Ensure numbers are sequential before creating a new one
-    await organize_table_numbers(data.restaurant_id)
-
     # Prevent duplicate table numbers
     existing = await get_table_by_restaurant_and_number(data.restaurant_id, data.number)
     if existing:
@@ -58,8 +70,11 @@ async def get_table(table_id: str) -> Optional[table_schema.TableDocument]:
 
 
 async def list_tables_for_restaurant(restaurant_id: str) -> List[table_schema.TableDocument]:
-    tables = await organize_table_numbers(restaurant_id)
-    return tables
+    return await (
+        table_schema.TableDocument.find({"restaurantId": restaurant_id})
+        .sort("number")
+        .to_list()
+    )
 
 
 async def update_table(table_id: str, data: table_schema.TableUpdate) -> Optional[table_schema.TableDocument]:
@@ -78,7 +93,10 @@ async def delete_table(table_id: str) -> bool:
     if table.current_session_id:
         await session_service.delete_session(table.current_session_id)
 
-    return await table_model.delete(table_id)
+    deleted = await table_model.delete(table_id)
+    if deleted:
+        await organize_table_numbers(table.restaurant_id)
+    return deleted
 
 
 async def update_table_status(table_id: str, is_active: bool) -> Optional[table_schema.TableDocument]:
@@ -92,8 +110,10 @@ async def update_table_session(table_id: str, session_id: Optional[str]) -> Opti
 
 
 async def get_table_by_restaurant_and_number(restaurant_id: str, number: int) -> Optional[table_schema.TableDocument]:
-    """Retrieve a table by restaurant id and table number."""
-    await organize_table_numbers(restaurant_id)
+    """Retrieve a table by restaurant id and table number.
+
+    Served by the unique ``(restaurantId, number)`` index.
+    """
     filters = {"restaurantId": restaurant_id, "number": number}
     tables = await table_model.get_by_fields(filters, limit=1)
     if tables:
@@ -168,10 +188,10 @@ async def reset_tables_for_restaurant(restaurant_id: str) -> List[table_schema.T
 
 
 async def reset_all_tables() -> List[table_schema.TableDocument]:
-    tables = await table_model.get_all()
+    # Only the ids are needed; stream them instead of loading every table
     results: List[table_schema.TableDocument] = []
-    for t in tables:
-        updated = await reset_table(str(t.id))
+    async for t in table_model.stream({}, ["_id"]):
+        updated = await reset_table(str(t["_id"]))
         if updated:
             results.append(updated)
     return results
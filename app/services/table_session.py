@@ -1,4 +1,3 @@
-import json
 from typing import List, Any
 
 from beanie.odm.operators.find.comparison import Eq, GTE, LTE, NE
@@ -9,7 +8,9 @@ from app.models.table_session import TableSessionModel
 from app.schema.table_session import TableSessionStatus, TableSessionDocument
 from app.schema.order import OrderDocument
 from app.services import invoice as invoice_service
+from app.services import restaurant_metrics as metrics_service
 from app.models import order as order_model
+from app.services.websocket_events import encode_event
 from app.services.websocket_manager import get_websocket_manger
 from app.utils.time import now_in_luanda
 
@@ -101,9 +102,12 @@ async def get_active_session_for_restaurant_table(
 
 
 async def add_order_to_session(
-    session_id: str, order_id: str
+    session_id: str, order_id: str, order: OrderDocument | None = None
 ) -> TableSessionDocument | None:
-    """Append an order ID to a table session's order list."""
+    """Append an order ID to a table session's order list.
+
+    Pass the freshly created ``order`` to avoid fetching it again for the broadcast.
+    """
     session = await session_model.get(session_id)
     if not session:
         return None
@@ -115,17 +119,23 @@ async def add_order_to_session(
     websocket_manager = get_websocket_manger()
     restaurant_id = session.restaurant_id
 
-    order = await order_model.get(order_id)
-    order_data = order.model_dump()
-
-    json_data = json.dumps(order_data)
+    if order is None:
+        order = await order_model.get(order_id)
+    event = encode_event(order.to_response().model_dump(mode="json", by_alias=True))
 
-    await websocket_manager.broadcast(json_data, f"{restaurant_id}/order")
-    await websocket_manager.broadcast(json_data, f"{restaurant_id}/session_order")
+    await websocket_manager.broadcast(event, f"{restaurant_id}/order")
+    await websocket_manager.broadcast(event, f"{restaurant_id}/session_order")
 
     return session
 
 
+async def add_orders_to_session(
+    session_id: str, order_ids: List[str]
+) -> TableSessionDocument | None:
+    """Append several order IDs to a table session in a single update."""
+    return await session_model.add_orders(session_id, order_ids)
+
+
 async def close_table_session(
     session_id: str, cancelled: bool = True
 ) -> TableSessionDocument:
@@ -148,9 +158,11 @@ async def close_table_session(
         else:
             new_status = TableSessionStatus.CLOSED.value
 
+        end_time = now_in_luanda()
         await session_model.update(
-            session_id, {"status": new_status, "endTime": now_in_luanda()}
+            session_id, {"status": new_status, "endTime": end_time}
         )
+        await metrics_service.record_session_ended(session, end_time)
 
         if not cancelled and any(o.prep_status != TableSessionStatus.CANCELLED.value for o in orders):
             await invoice_service.generate_invoice_for_session(session_id)
@@ -162,11 +174,11 @@ async def close_table_session(
         restaurant_id = session.restaurant_id
         websocket_manager = get_websocket_manger()
 
-        json_data = json.dumps([order.to_response().model_dump() for order in orders])
-        await websocket_manager.broadcast(json_data, f"{restaurant_id}/billed")
+        event = encode_event([order.to_response().model_dump(mode="json", by_alias=True) for order in orders])
+        await websocket_manager.broadcast(event, f"{restaurant_id}/billed")
 
-        json_data = json.dumps(new_session.to_response().model_dump())
-        await websocket_manager.broadcast(json_data, f"{restaurant_id}/closed_session")
+        event = encode_event(new_session.to_response().model_dump(mode="json", by_alias=True))
+        await websocket_manager.broadcast(event, f"{restaurant_id}/closed_session")
 
         return new_session
     except Exception as error:
@@ -179,13 +191,19 @@ async def mark_session_paid(session_id: str) -> TableSessionDocument | None:
     if not session:
         return None
 
+    # A closed or already paid session was invoiced and counted in the metrics rollup
+    if session.status != TableSessionStatus.ACTIVE.value and session.status != TableSessionStatus.NEED_BILL.value:
+        raise Exception("Session is not active")
+
     invoice = await invoice_service.generate_invoice_for_session(session_id)
     await invoice_service.mark_invoice_paid(str(invoice.id))
 
+    end_time = now_in_luanda()
     await session_model.update(
         session_id,
-        {"status": TableSessionStatus.PAID, "endTime": now_in_luanda()},
+        {"status": TableSessionStatus.PAID, "endTime": end_time},
     )
+    await metrics_service.record_session_ended(session, end_time)
 
     new_session = await create_session_for_table(
         session.table_id, session.restaurant_id
@@ -200,13 +218,13 @@ async def mark_session_paid(session_id: str) -> TableSessionDocument | None:
 
     websocket_manager = get_websocket_manger()
     orders = await order_model.get_many(session.orders)
-    json_data = json.dumps(
-        [order.to_response().model_dump(by_alias=True) for order in orders]
+    event = encode_event(
+        [order.to_response().model_dump(mode="json", by_alias=True) for order in orders]
     )
-    await websocket_manager.broadcast(json_data, f"{str(session.restaurant_id)}/billed")
+    await websocket_manager.broadcast(event, f"{str(session.restaurant_id)}/billed")
 
-    json_data = json.dumps(new_session.to_response().model_dump(by_alias=True))
-    await websocket_manager.broadcast(json_data, f"{session.restaurant_id}/closed_session")
+    event = encode_event(new_session.to_response().model_dump(mode="json", by_alias=True))
+    await websocket_manager.broadcast(event, f"{session.restaurant_id}/closed_session")
 
     return new_session
 
@@ -274,9 +292,8 @@ async def list_active_sessions_for_restaurant(
     restaurant_id: str,
 ) -> List[TableSessionDocument]:
     """Return active sessions that are currently referenced by a table."""
-    # Fetch all tables for the restaurant to get their current session ids
-    tables = await table_model.get_by_fields({"restaurantId": restaurant_id})
-    session_ids = [t.current_session_id for t in tables if t.current_session_id]
+    # Fetch the current session ids of the restaurant's tables
+    session_ids = await table_model.values("current_session_id", {"restaurantId": restaurant_id})
 
     if not session_ids:
         return []
@@ -292,8 +309,7 @@ async def delete_session(session_id: str) -> bool:
 
 async def delete_unlinked_sessions_for_restaurant(restaurant_id: str) -> int:
     """Delete sessions for a restaurant that are not linked to any table."""
-    tables = await table_model.get_by_fields({"restaurantId": restaurant_id})
-    linked_ids = {t.current_session_id for t in tables if t.current_session_id}
+    linked_ids = set(await table_model.values("current_session_id", {"restaurantId": restaurant_id}))
 
     coll = TableSessionDocument.get_motor_collection()
     query: dict[str, Any] = {"restaurantId": restaurant_id}
@@ -326,3 +342,11 @@ async def calculate_session_time_length(session_id: str) -> float:
 
     duration_seconds = (end_time - first_order_time).total_seconds()
     return duration_seconds / 60.0
+
+
+async def _active_sessions_snapshot(restaurant_id: str) -> list[dict]:
+    sessions = await list_active_sessions_for_restaurant(restaurant_id)
+    return [s.to_response().model_dump(mode="json", by_alias=True) for s in sessions]
+
+
+get_websocket_manger().register_snapshot("session-status", _active_sessions_snapshot)
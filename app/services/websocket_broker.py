@@ -0,0 +1,159 @@
+import asyncio
+import uuid
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from typing import Awaitable, Callable, Optional
+
+from motor.motor_asyncio import AsyncIOMotorDatabase
+from pymongo import CursorType, ReturnDocument
+from pymongo.errors import CollectionInvalid, PyMongoError
+
+from app.services.websocket_events import EncodedEvent
+from app.utils.time import now_in_luanda
+
+Deliver = Callable[[str, EncodedEvent], Awaitable[None]]
+
+
+class WebsocketBroker(ABC):
+    """Carries ``(key, event)`` pairs from the worker that publishes them to every worker.
+
+    Each worker hands the events it receives to ``deliver``, which fans them out
+    to the sockets connected to that worker only.
+    """
+
+    def __init__(self):
+        self.deliver: Optional[Deliver] = None
+
+    async def start(self, deliver: Deliver) -> None:
+        self.deliver = deliver
+
+    async def stop(self) -> None:
+        pass
+
+    @abstractmethod
+    async def publish(self, key: str, event: EncodedEvent) -> None:
+        ...
+
+
+class InMemoryBroker(WebsocketBroker):
+    """Single-process broker: events only reach sockets connected to this worker."""
+
+    async def publish(self, key: str, event: EncodedEvent) -> None:
+        if self.deliver:
+            await self.deliver(key, event)
+
+
+class MongoBroker(WebsocketBroker):
+    """Cross-worker broker backed by a capped collection tailed by every worker.
+
+    Tailable cursors work on standalone servers as well as replica sets, so no
+    extra infrastructure is needed. Events are delivered to local sockets
+    straight away and skipped when they come back through the tail.
+
+    Every event carries a ``seq`` from a shared ``$inc`` counter, because
+    ObjectIds made by different workers do not sort in insertion order. Two
+    publishers can still insert their sequence numbers out of order, so
+    whenever the tail (re)starts it reads back the last ``replay_window``
+    sequence numbers and skips the ones it has already seen, instead of
+    resuming strictly after the highest one.
+    """
+
+    def __init__(
+        self,
+        db: AsyncIOMotorDatabase,
+        collection_name: str = "websocket_events",
+        size_bytes: int = 16 * 1024 * 1024,
+        retry_delay: float = 1,
+        replay_window: int = 1000,
+    ):
+        super().__init__()
+        self.db = db
+        self.collection_name = collection_name
+        self.size_bytes = size_bytes
+        self.retry_delay = retry_delay
+        self.replay_window = replay_window
+        self.origin = uuid.uuid4().hex
+        self._listener: Optional[asyncio.Task] = None
+        self._seen: "OrderedDict[int, None]" = OrderedDict()
+
+    @property
+    def collection(self):
+        return self.db[self.collection_name]
+
+    @property
+    def counters(self):
+        return self.db[f"{self.collection_name}_sequence"]
+
+    async def _next_seq(self) -> int:
+        counter = await self.counters.find_one_and_update(
+            {"_id": self.collection_name},
+            {"$inc": {"seq": 1}},
+            upsert=True,
+            return_document=ReturnDocument.AFTER,
+        )
+        return counter["seq"]
+
+    def _mark_seen(self, seq: int) -> bool:
+        """Remember ``seq``; False if it was already seen."""
+        if seq in self._seen:
+            return False
+        self._seen[seq] = None
+        while len(self._seen) > 2 * self.replay_window:
+            self._seen.popitem(last=False)
+        return True
+
+    async def start(self, deliver: Deliver) -> None:
+        await super().start(deliver)
+        try:
+            await self.db.create_collection(self.collection_name, capped=True, size=self.size_bytes)
+        except CollectionInvalid:
+            pass  # Already created by another worker
+        self._listener = asyncio.create_task(self._listen())
+
+    async def stop(self) -> None:
+        if self._listener:
+            self._listener.cancel()
+            try:
+                await self._listener
+            except asyncio.CancelledError:
+                pass
+            self._listener = None
+
+    async def publish(self, key: str, event: EncodedEvent) -> None:
+        await self.deliver(key, event)
+        await self.collection.insert_one({
+            "seq": await self._next_seq(),
+            "key": key,
+            "message": event.text,
+            "origin": self.origin,
+            "createdAt": now_in_luanda(),
+        })
+
+    async def _listen(self) -> None:
+        # Start after the newest event so a new worker does not replay history; events
+        # already in the window are marked seen, late inserts below the newest are not
+        latest = await self.collection.find_one({"seq": {"$exists": True}}, sort=[("$natural", -1)])
+        highest = latest["seq"] if latest else 0
+        async for event in self.collection.find({"seq": {"$gt": highest - self.replay_window}}, {"seq": 1}):
+            self._mark_seen(event["seq"])
+
+        while True:
+            query = {"seq": {"$gt": highest - self.replay_window}}
+            try:
+                cursor = self.collection.find(query, cursor_type=CursorType.TAILABLE_AWAIT)
+                async for event in cursor:
+                    if not self._mark_seen(event["seq"]):
+                        continue
+                    highest = max(highest, event["seq"])
+                    if event.get("origin") == self.origin:
+                        continue
+                    try:
+                        await self.deliver(event["key"], EncodedEvent.from_text(event["message"]))
+                    except Exception as error:
+                        print(f"Failed to deliver websocket event {event['seq']}: {error}")
+            except asyncio.CancelledError:
+                raise
+            except PyMongoError as error:
+                print(f"Websocket event stream interrupted: {error}")
+            # A tailable cursor dies when the collection is empty or the tail is overrun
+            await asyncio.sleep(self.retry_delay)
@@ -0,0 +1,56 @@
+import json
+from typing import Any, Optional
+
+import msgpack
+
+# Subprotocol a client offers (``Sec-WebSocket-Protocol: msgpack``) to receive binary frames
+MSGPACK_SUBPROTOCOL = "msgpack"
+
+_UNSET = object()
+
+
+class EncodedEvent:
+    """A websocket payload serialised at most once per wire format.
+
+    The same instance is handed to every subscriber (and to every channel the
+    event is broadcast on), so all of them share one JSON string and, if any
+    client negotiated msgpack, one msgpack buffer.
+    """
+
+    __slots__ = ("_payload", "_text", "_packed")
+
+    def __init__(self, payload: Any = _UNSET, text: Optional[str] = None):
+        self._payload = payload
+        self._text = text
+        self._packed: Optional[bytes] = None
+
+    @classmethod
+    def from_text(cls, text: str) -> "EncodedEvent":
+        return cls(text=text)
+
+    @property
+    def payload(self) -> Any:
+        if self._payload is _UNSET:
+            self._payload = json.loads(self._text)
+        return self._payload
+
+    @property
+    def text(self) -> str:
+        if self._text is None:
+            self._text = json.dumps(self._payload)
+        return self._text
+
+    @property
+    def packed(self) -> bytes:
+        if self._packed is None:
+            self._packed = msgpack.packb(self.payload)
+        return self._packed
+
+
+def encode_event(payload: Any) -> EncodedEvent:
+    """Wrap ``payload`` (a JSON-compatible value, or an already encoded JSON string)."""
+    if isinstance(payload, EncodedEvent):
+        return payload
+    if isinstance(payload, str):
+        return EncodedEvent.from_text(payload)
+    return EncodedEvent(payload)
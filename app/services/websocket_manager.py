@@ -1,45 +1,328 @@
-from typing import Dict, List
+import asyncio
+import time
+import uuid
+from collections import deque
+from dataclasses import dataclass, asdict, field
+from enum import Enum
+from typing import Any, Awaitable, Callable, Deque, Dict, List, Optional, Tuple
 from fastapi import WebSocket
 from threading import Lock
 
 from starlette.websockets import WebSocketState
 
+from app.services.websocket_broker import InMemoryBroker, WebsocketBroker
+from app.services.websocket_events import MSGPACK_SUBPROTOCOL, EncodedEvent, encode_event
+
+
+class SlowConsumerPolicy(str, Enum):
+    DROP_OLDEST = "drop_oldest"  # Discard the oldest pending message to make room
+    DISCONNECT = "disconnect"    # Close the socket; the client reconnects and catches up
+
+
+@dataclass
+class ChannelMetrics:
+    sent: int = 0
+    failed: int = 0
+    dropped: int = 0
+    slow_disconnects: int = 0
+    send_latency_total_ms: float = 0.0
+    send_latency_max_ms: float = 0.0
+    # Coalescing: broadcasts folded into batched frames, frames published, duplicate orders dropped
+    coalesced_messages: int = 0
+    coalesced_frames: int = 0
+    deduplicated: int = 0
+
+
+@dataclass
+class ChannelLog:
+    """Sequence counter and bounded replay buffer of one channel."""
+    seq: int = 0
+    events: Deque[Tuple[int, EncodedEvent]] = field(default_factory=deque)
+
+
+SnapshotProvider = Callable[[str], Awaitable[Any]]
+
+
+class ConnectionSender:
+    """Bounded send queue for one socket, drained by its own task.
+
+    Broadcasting only enqueues, so a slow or stalled client delays nobody but
+    itself; when its queue is full the slow-consumer policy applies. Sockets
+    that negotiated the msgpack subprotocol get binary frames. A resumable
+    client that sees a gap in ``seq`` (e.g. after a drop) should reconnect
+    with its ``last_seq``.
+    """
+
+    def __init__(
+        self,
+        websocket: WebSocket,
+        metrics: ChannelMetrics,
+        max_pending: int,
+        policy: SlowConsumerPolicy,
+        binary: bool = False,
+        resumable: bool = False,
+    ):
+        self.websocket = websocket
+        self.binary = binary
+        self.resumable = resumable
+        self.metrics = metrics
+        self.policy = policy
+        self.queue: asyncio.Queue = asyncio.Queue(maxsize=max_pending)
+        self.closed = False
+        self._task = asyncio.create_task(self._drain())
+
+    @property
+    def depth(self) -> int:
+        return self.queue.qsize()
+
+    def enqueue(self, event: EncodedEvent) -> bool:
+        """Queue ``event`` for sending; return ``False`` if the connection must be dropped."""
+        if self.closed:
+            return False
+        if self.queue.full():
+            if self.policy == SlowConsumerPolicy.DISCONNECT:
+                self.metrics.slow_disconnects += 1
+                return False
+            self.queue.get_nowait()
+            self.metrics.dropped += 1
+        self.queue.put_nowait((time.perf_counter(), event))
+        return True
+
+    async def _drain(self) -> None:
+        while True:
+            queued_at, event = await self.queue.get()
+            try:
+                if self.binary:
+                    await self.websocket.send_bytes(event.packed)
+                else:
+                    await self.websocket.send_text(event.text)
+            except Exception as e:
+                print(f"Failed to send message to {self.websocket}: {e}")
+                self.metrics.failed += 1
+                self.closed = True
+                return
+            latency_ms = (time.perf_counter() - queued_at) * 1000
+            self.metrics.sent += 1
+            self.metrics.send_latency_total_ms += latency_ms
+            self.metrics.send_latency_max_ms = max(self.metrics.send_latency_max_ms, latency_ms)
+
+    async def close(self) -> None:
+        self.closed = True
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        if self.websocket.client_state != WebSocketState.DISCONNECTED:
+            try:
+                await self.websocket.close()
+            except Exception:
+                pass
+
 
 class WebsocketConnectionManager:
     _instance = None
     _lock: Lock = Lock()
 
+    # Messages a single socket may have pending before the slow-consumer policy kicks in
+    max_pending: int = 100
+    slow_consumer_policy: SlowConsumerPolicy = SlowConsumerPolicy.DROP_OLDEST
+
+    # High-frequency channels whose broadcasts are batched into one array frame per window
+    coalesce_window: float = 0.05
+    coalesced_channels: tuple = ("/order", "/session_order")
+
+    # Events kept per channel for resuming clients
+    replay_size: int = 256
+
     def __new__(cls):
         with cls._lock:
             if not cls._instance:
                 cls._instance = super(WebsocketConnectionManager, cls).__new__(cls)
-                cls._instance.active_connections: Dict[str, List[WebSocket]] = {}
+                cls._instance.active_connections: Dict[str, Dict[WebSocket, ConnectionSender]] = {}
+                cls._instance.metrics: Dict[str, ChannelMetrics] = {}
+                cls._instance.broker = None
+                cls._instance._pending: Dict[str, Dict[Any, Any]] = {}
+                cls._instance._flushes: Dict[str, asyncio.Task] = {}
+                # Sequence numbers are per worker; the stream id tells a client which worker they belong to
+                cls._instance.stream_id = uuid.uuid4().hex
+                cls._instance.logs: Dict[str, ChannelLog] = {}
+                cls._instance.snapshot_providers: Dict[str, SnapshotProvider] = {}
             return cls._instance
 
-    async def connect(self, websocket: WebSocket, key: str):
-        await websocket.accept()
-        if key not in self.active_connections:
-            self.active_connections[key] = []
-        self.active_connections[key].append(websocket)
+    async def start(self, broker: WebsocketBroker | None = None):
+        """Route broadcasts through ``broker`` (in-memory unless another backend is given)."""
+        await self.stop()
+        self.broker = broker or InMemoryBroker()
+        await self.broker.start(self.deliver)
+
+    async def stop(self):
+        if self.broker:
+            await self.flush()
+            await self.broker.stop()
+            self.broker = None
+
+    def register_snapshot(self, category: str, provider: SnapshotProvider):
+        """Use ``provider(restaurant_id)`` to rebuild ``category`` for clients too far behind to replay."""
+        self.snapshot_providers[category] = provider
+
+    async def connect(
+        self,
+        websocket: WebSocket,
+        key: str,
+        resumable: bool = False,
+        last_seq: Optional[int] = None,
+        stream: Optional[str] = None,
+    ):
+        """Accept ``websocket`` as a subscriber of ``key``.
+
+        Resumable clients receive ``{"seq", "stream", "data"}`` frames. When they
+        reconnect with the ``last_seq`` and ``stream`` of the last frame seen,
+        the missed events are replayed from the channel log; if those are no
+        longer available (or the stream belongs to another worker) a single
+        ``{"snapshot": true}`` frame with the channel's current state is sent
+        instead.
+        """
+        binary = MSGPACK_SUBPROTOCOL in websocket.scope.get("subprotocols", [])
+        await websocket.accept(subprotocol=MSGPACK_SUBPROTOCOL if binary else None)
+        metrics = self.metrics.setdefault(key, ChannelMetrics())
+        log = self.logs.setdefault(key, ChannelLog(events=deque(maxlen=self.replay_size)))
+        resumable = resumable or last_seq is not None
+
+        replay_from = None
+        snapshot = None
+        if resumable and last_seq is not None:
+            oldest = log.events[0][0] if log.events else log.seq + 1
+            if stream == self.stream_id and oldest - 1 <= last_seq <= log.seq:
+                replay_from = last_seq
+            else:
+                replay_from = log.seq
+                snapshot = await self._snapshot(key, log.seq)
+
+        sender = ConnectionSender(
+            websocket, metrics, self.max_pending, self.slow_consumer_policy, binary, resumable
+        )
+        self.active_connections.setdefault(key, {})[websocket] = sender
+
+        # No await from here on, so nothing is delivered between the replay and live events
+        if snapshot:
+            sender.enqueue(snapshot)
+        if replay_from is not None:
+            for seq, envelope in log.events:
+                if seq > replay_from:
+                    sender.enqueue(envelope)
+
+    async def _snapshot(self, key: str, seq: int) -> EncodedEvent:
+        restaurant_id, _, category = key.partition("/")
+        provider = self.snapshot_providers.get(category)
+        data = None
+        if provider:
+            try:
+                data = await provider(restaurant_id)
+            except Exception as error:
+                print(f"Failed to build snapshot for {key}: {error}")
+        # ``data`` is null when no snapshot is available; the client should refetch
+        return EncodedEvent({"seq": seq, "stream": self.stream_id, "snapshot": True, "data": data})
 
     async def disconnect(self, websocket: WebSocket, key: str):
-        if key in self.active_connections:
-            self.active_connections[key].remove(websocket)
-            if not websocket.client_state == WebSocketState.DISCONNECTED:
-                await websocket.close()
-
-    async def broadcast(self, message: str, key: str):
-        with self._lock:
-            if key in self.active_connections:
-                for connection in self.active_connections[key][:]:
-                    if connection.client_state == WebSocketState.CONNECTED:
-                        try:
-                            await connection.send_text(message)
-                        except Exception as e:
-                            print(f"Failed to send message to {connection}: {e}")
-                            self.active_connections[key].remove(connection)
-                    else:
-                        self.active_connections[key].remove(connection)
+        sender = self.active_connections.get(key, {}).pop(websocket, None)
+        if sender:
+            await sender.close()
+        elif websocket.client_state != WebSocketState.DISCONNECTED:
+            await websocket.close()
+
+    async def broadcast(self, message: Any, key: str):
+        """Publish ``message`` to every subscriber of ``key``, on any worker.
+
+        ``message`` is a JSON string, a JSON-compatible value or an
+        ``EncodedEvent``; pass the same ``EncodedEvent`` when broadcasting one
+        payload on several channels so it is only serialised once. Messages on
+        ``coalesced_channels`` are delivered in batches, see ``_coalesce``.
+        """
+        if self.broker is None:
+            await self.start()
+        event = encode_event(message)
+        if self.coalesce_window and key.endswith(self.coalesced_channels):
+            self._coalesce(key, event)
+        else:
+            await self.broker.publish(key, event)
+
+    def _coalesce(self, key: str, event: EncodedEvent):
+        """Buffer an order event (one order or a list of them) for ``coalesce_window`` seconds.
+
+        The window's orders are published as a single array frame; an order
+        broadcast more than once keeps its first position and its latest data.
+        """
+        payload = event.payload
+        pending = self._pending.setdefault(key, {})
+        metrics = self.metrics.setdefault(key, ChannelMetrics())
+        metrics.coalesced_messages += 1
+
+        for item in payload if isinstance(payload, list) else [payload]:
+            item_id = (item.get("_id") or item.get("id")) if isinstance(item, dict) else None
+            dedupe_key = item_id if item_id is not None else object()
+            if dedupe_key in pending:
+                metrics.deduplicated += 1
+            pending[dedupe_key] = item
+
+        if key not in self._flushes:
+            self._flushes[key] = asyncio.create_task(self._flush_later(key))
+
+    async def _flush_later(self, key: str):
+        await asyncio.sleep(self.coalesce_window)
+        self._flushes.pop(key, None)
+        await self._publish_pending(key)
+
+    async def _publish_pending(self, key: str):
+        items = list(self._pending.pop(key, {}).values())
+        if not items:
+            return
+        self.metrics.setdefault(key, ChannelMetrics()).coalesced_frames += 1
+        try:
+            await self.broker.publish(key, encode_event(items))
+        except Exception as error:
+            print(f"Failed to publish coalesced events for {key}: {error}")
+
+    async def flush(self):
+        """Publish every buffered batch now instead of waiting for its window."""
+        for task in self._flushes.values():
+            task.cancel()
+        self._flushes.clear()
+        for key in list(self._pending):
+            await self._publish_pending(key)
+
+    async def deliver(self, key: str, event: EncodedEvent):
+        """Record ``event`` in the channel log and queue it on every socket subscribed to ``key`` on this worker."""
+        log = self.logs.setdefault(key, ChannelLog(events=deque(maxlen=self.replay_size)))
+        log.seq += 1
+        envelope = EncodedEvent({"seq": log.seq, "stream": self.stream_id, "data": event.payload})
+        log.events.append((log.seq, envelope))
+
+        connections = self.active_connections.get(key)
+        if not connections:
+            return
+
+        dropped: List[WebSocket] = [
+            websocket
+            for websocket, sender in list(connections.items())
+            if websocket.client_state != WebSocketState.CONNECTED
+            or not sender.enqueue(envelope if sender.resumable else event)
+        ]
+        if dropped:
+            await asyncio.gather(*(self.disconnect(websocket, key) for websocket in dropped))
+
+    def get_metrics(self) -> Dict[str, Dict[str, Any]]:
+        report = {}
+        for key, metrics in self.metrics.items():
+            depths = [sender.depth for sender in self.active_connections.get(key, {}).values()]
+            report[key] = {
+                **asdict(metrics),
+                "connections": len(depths),
+                "queue_depth_total": sum(depths),
+                "queue_depth_max": max(depths, default=0),
+                "send_latency_avg_ms": metrics.send_latency_total_ms / metrics.sent if metrics.sent else 0.0,
+            }
+        return report
 
 
 def get_websocket_manger():
@@ -1,5 +1,11 @@
+import asyncio
+import hashlib
+import time
 from datetime import timedelta
+from threading import Lock
 from typing import Optional, Dict, Any
+
+from cachetools import TTLCache
 from starlette.status import HTTP_401_UNAUTHORIZED
 from fastapi import Request, Response, HTTPException, Depends
 from firebase_admin import auth
@@ -43,6 +49,72 @@ def verify_session_cookie(session_cookie: str) -> Dict[str, Any]:
         raise ValueError(f"Failed to verify session cookie: {str(e)}")
 
 
+class VerifiedSessionCache:
+    """Claims of recently verified session cookies, keyed by a SHA-256 of the cookie.
+
+    An entry is reused until the cookie's own ``exp`` or until
+    ``revocation_interval`` seconds after it was verified, whichever is first,
+    so a revoked or disabled session stops being accepted within that window.
+    Verification failures are never cached.
+    """
+
+    def __init__(self, maxsize: int = 10_000, revocation_interval: float = 300):
+        self.revocation_interval = revocation_interval
+        self._entries: TTLCache = TTLCache(maxsize=maxsize, ttl=revocation_interval)
+        self._lock = Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def _key(session_cookie: str) -> str:
+        return hashlib.sha256(session_cookie.encode()).hexdigest()
+
+    def get(self, session_cookie: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            claims = self._entries.get(self._key(session_cookie))
+            if claims is not None and claims.get("exp", 0) <= time.time():
+                claims = None
+            if claims is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+            return claims
+
+    def set(self, session_cookie: str, claims: Dict[str, Any]) -> None:
+        with self._lock:
+            self._entries[self._key(session_cookie)] = claims
+
+    def discard(self, session_cookie: str) -> None:
+        with self._lock:
+            self._entries.pop(self._key(session_cookie), None)
+
+    def stats(self) -> Dict[str, Any]:
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "size": len(self._entries),
+            "revocation_interval": self.revocation_interval,
+        }
+
+
+verified_sessions = VerifiedSessionCache()
+
+
+async def verify_session_cookie_cached(session_cookie: str) -> Dict[str, Any]:
+    """Like ``verify_session_cookie``, but served from ``verified_sessions`` when possible.
+
+    On a miss the (CPU-bound, possibly key-fetching) verification runs in a
+    worker thread so the event loop is not blocked.
+    """
+    claims = verified_sessions.get(session_cookie)
+    if claims is None:
+        claims = await asyncio.to_thread(verify_session_cookie, session_cookie)
+        verified_sessions.set(session_cookie, claims)
+    return claims
+
+
 def set_auth_cookies(response: Response, id_token: str) -> None:
     """Set authentication cookies in the response."""
     # Create session cookie
@@ -131,7 +203,7 @@ async def get_current_user(request: Request):
         )
     try:
         # Verify the session cookie
-        decoded_claims = verify_session_cookie(token)
+        decoded_claims = await verify_session_cookie_cached(token)
         uid = decoded_claims['sub']  # Firebase stores the UID in the 'sub' claim
         return uid
     except ValueError as e:
@@ -0,0 +1,206 @@
+"""Pillow work for uploaded images.
+
+Everything here is a plain module-level function so it can run in a process
+pool; keep this module free of app settings, database and cloud imports, since
+every pool worker imports it. Images are passed either as bytes or as the path
+of a spooled upload, which the worker reads itself so large uploads are never
+copied between processes.
+"""
+import io
+from dataclasses import dataclass
+from enum import Enum
+from typing import List, Optional, Sequence, Tuple, Union
+
+from PIL import Image, ImageOps
+
+
+class ImageFormat(Enum):
+    """Supported image formats"""
+    JPEG = "JPEG"
+    PNG = "PNG"
+    WEBP = "WEBP"
+    AVIF = "AVIF"
+
+
+# Raw image bytes or the path of a file holding them
+ImageInput = Union[bytes, str]
+
+CONTENT_TYPES = {
+    ImageFormat.JPEG: 'image/jpeg',
+    ImageFormat.PNG: 'image/png',
+    ImageFormat.WEBP: 'image/webp',
+    ImageFormat.AVIF: 'image/avif'
+}
+
+
+@dataclass
+class ProcessedImage:
+    """Bytes ready to store, plus what Pillow read from them"""
+    data: bytes
+    content_type: str
+    width: int = 0
+    height: int = 0
+    format: str = 'Unknown'
+    optimized: bool = False
+    error: Optional[str] = None
+
+
+def optimize_image(
+        image: Image.Image,
+        format_type: ImageFormat = ImageFormat.JPEG,
+        quality: int = 85
+) -> Tuple[bytes, str]:
+    """
+    Optimize image for web usage
+
+    Returns:
+        Tuple of (optimized_image_bytes, content_type)
+    """
+    # Convert to RGB if necessary (for JPEG)
+    if format_type == ImageFormat.JPEG and image.mode in ('RGBA', 'LA', 'P'):
+        background = Image.new('RGB', image.size, (255, 255, 255))
+        if image.mode == 'P':
+            image = image.convert('RGBA')
+        background.paste(image, mask=image.split()[-1] if image.mode == 'RGBA' else None)
+        image = background
+
+    # Save optimized image to bytes
+    output = io.BytesIO()
+    save_kwargs = {}
+
+    if format_type in [ImageFormat.JPEG, ImageFormat.WEBP]:
+        save_kwargs['quality'] = quality
+        save_kwargs['optimize'] = True
+
+    if format_type == ImageFormat.AVIF:
+        save_kwargs['quality'] = quality
+
+    if format_type == ImageFormat.PNG:
+        save_kwargs['optimize'] = True
+
+    image.save(output, format=format_type.value, **save_kwargs)
+
+    return output.getvalue(), CONTENT_TYPES[format_type]
+
+
+@dataclass
+class ImageVariantData:
+    """One resized and re-encoded copy of an image"""
+    data: bytes
+    width: int
+    height: int
+    format: ImageFormat
+
+    @property
+    def content_type(self) -> str:
+        return CONTENT_TYPES[self.format]
+
+
+def open_image(image_input: ImageInput) -> Image.Image:
+    """Open an image lazily: only the header is read until pixels are needed."""
+    return Image.open(io.BytesIO(image_input) if isinstance(image_input, bytes) else image_input)
+
+
+def read_bytes(image_input: ImageInput) -> bytes:
+    if isinstance(image_input, bytes):
+        return image_input
+    with open(image_input, 'rb') as f:
+        return f.read()
+
+
+def variant_formats() -> Tuple[ImageFormat, ...]:
+    """Formats to encode variants in, smallest first; JPEG is always last as the fallback"""
+    Image.init()
+    preferred = (ImageFormat.AVIF, ImageFormat.WEBP)
+    # AVIF needs Pillow >= 11.2 built with libavif (or pillow-avif-plugin)
+    return tuple(f for f in preferred if f.value in Image.SAVE) + (ImageFormat.JPEG,)
+
+
+def build_variants(
+        image_input: ImageInput,
+        widths: Sequence[int],
+        quality: int = 85
+) -> List[ImageVariantData]:
+    """Resize ``image_input`` to each of ``widths`` and encode every size in each of ``variant_formats()``.
+
+    Images are never upscaled: widths larger than the original collapse into
+    one variant at the original width.
+    """
+    formats = variant_formats()
+    variants = []
+
+    with open_image(image_input) as original:
+        # Phone photos are often stored sideways with an EXIF rotation flag
+        image = ImageOps.exif_transpose(original)
+        if image.mode not in ('RGB', 'RGBA'):
+            has_alpha = image.mode in ('LA', 'PA') or 'transparency' in image.info
+            image = image.convert('RGBA' if has_alpha else 'RGB')
+
+        for width in sorted({min(w, image.width) for w in widths}):
+            height = max(1, round(image.height * width / image.width))
+            resized = image if width == image.width else image.resize((width, height), Image.Resampling.LANCZOS)
+            for format_type in formats:
+                data, _ = optimize_image(resized, format_type, quality)
+                variants.append(ImageVariantData(data=data, width=width, height=height, format=format_type))
+
+    return variants
+
+
+def read_image_info(image_input: ImageInput) -> Tuple[int, int, str]:
+    """Return ``(width, height, format)`` from the image header without decoding pixels."""
+    with open_image(image_input) as image:
+        return image.size[0], image.size[1], image.format or 'Unknown'
+
+
+def process_image(
+        image_input: ImageInput,
+        format_type: ImageFormat = ImageFormat.JPEG,
+        quality: int = 85,
+        optimize: bool = True
+) -> ProcessedImage:
+    """Decode, optimize and re-encode ``image_input``.
+
+    If optimization fails the original bytes are kept and the reason is
+    reported in ``error``, so the caller can still upload them.
+    """
+    content_type = 'image/jpeg'
+    optimized = False
+    error = None
+    image_data = None
+
+    if optimize:
+        try:
+            with open_image(image_input) as image:
+                image_data, content_type = optimize_image(image, format_type, quality)
+            optimized = True
+        except Exception as e:
+            error = str(e)
+
+    if image_data is None:
+        image_data = read_bytes(image_input)
+
+    try:
+        width, height, image_format = read_image_info(image_data)
+    except Exception:
+        width, height, image_format = 0, 0, 'Unknown'
+
+    return ProcessedImage(
+        data=image_data,
+        content_type=content_type,
+        width=width,
+        height=height,
+        format=image_format,
+        optimized=optimized,
+        error=error
+    )
+
+
+def make_thumbnail(image_input: ImageInput, size: Tuple[int, int] = (150, 150), quality: int = 85) -> bytes:
+    """Shrink ``image_input`` to fit within ``size`` and encode it as JPEG"""
+    with open_image(image_input) as image:
+        image.thumbnail(size, Image.Resampling.LANCZOS)
+        if image.mode not in ('RGB', 'L'):
+            image = image.convert('RGB')
+        output = io.BytesIO()
+        image.save(output, format='JPEG', quality=quality, optimize=True)
+    return output.getvalue()
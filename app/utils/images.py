@@ -1,12 +1,20 @@
-from typing import Optional, Tuple, List
+import asyncio
+import os
+import shutil
+import tempfile
+from contextlib import asynccontextmanager
+from pathlib import Path
+from typing import AsyncIterator, BinaryIO, Optional, Tuple, List, Union
 from fastapi import UploadFile
 from PIL import Image
 import io
 import re
 
 from app.core.dependencies import get_settings
+from app.schema.image import ImageVariant, ResponsiveImage
 
 from app.services.google_bucket import (
+    get_async_bucket_manager,
     get_google_bucket_manager,
     ImageFormat,
     UploadResult,
@@ -20,6 +28,112 @@ RESTAURANT_LOGO = "logo"
 MAX_BANNER_DIMENSIONS = (1920, 1080)  # 16:9 aspect ratio
 MAX_LOGO_DIMENSIONS = (500, 500)  # Square format
 
+# Uploads are copied to disk in chunks of this size instead of being read into memory
+UPLOAD_CHUNK_SIZE = 1024 * 1024
+
+# Widths of the responsive variants generated at upload time
+ITEM_IMAGE_WIDTHS = (320, 640, 960)
+BANNER_IMAGE_WIDTHS = (640, 1280, 1920)
+LOGO_IMAGE_WIDTHS = (128, 256, 500)
+
+
+@asynccontextmanager
+async def spooled_upload(upload: UploadFile) -> AsyncIterator[str]:
+    """Copy ``upload`` to a temporary file chunk by chunk and yield its path.
+
+    Image workers open the path themselves, so the upload is never held in
+    memory as a whole. The file is removed on exit.
+    """
+    image_manager = get_async_bucket_manager()
+    suffix = Path(upload.filename or "").suffix
+    spool = tempfile.NamedTemporaryFile(prefix="upload_", suffix=suffix, delete=False)
+    try:
+        await upload.seek(0)
+        await image_manager.run_io(shutil.copyfileobj, upload.file, spool, UPLOAD_CHUNK_SIZE)
+        await image_manager.run_io(spool.close)
+        yield spool.name
+    finally:
+        spool.close()
+        await image_manager.run_io(os.remove, spool.name)
+
+
+async def _upload_with_variants(
+    content: Union[bytes, str],
+    filename: str,
+    folder: str,
+    variant_folder: str,
+    widths: Tuple[int, ...],
+    metadata: dict,
+    optimize: bool = True,
+) -> UploadResult:
+    """Upload the optimized image and its responsive variants concurrently.
+
+    ``content`` is the image bytes or the path of a spooled upload. If the variants fail the upload still succeeds, with ``variants`` empty.
+    """
+    image_manager = get_async_bucket_manager()
+    result, variants = await asyncio.gather(
+        image_manager.upload_image(
+            image_source=content,
+            filename=filename,
+            folder=folder,
+            public=True,
+            optimize=optimize,
+            format_type=ImageFormat.JPEG,
+            quality=85,
+            metadata=metadata,
+        ),
+        image_manager.upload_variants(
+            content,
+            filename=filename or "image",
+            folder=variant_folder,
+            widths=widths,
+            quality=80,
+            metadata={**metadata, "variant": "true"},
+        ),
+    )
+
+    if not result.success:
+        await asyncio.gather(*(image_manager.delete_image(v.blob_name) for v in variants))
+        return result
+
+    result.variants = variants
+    return result
+
+
+def responsive_image(upload: UploadResult) -> Optional[ResponsiveImage]:
+    """Build the stored ``srcset`` structure from an upload's variants."""
+    if not upload.variants:
+        return None
+    return ResponsiveImage.from_variants([
+        ImageVariant(
+            url=variant.public_url,
+            width=variant.metadata.width,
+            height=variant.metadata.height,
+            type=variant.metadata.content_type,
+        )
+        for variant in upload.variants
+    ])
+
+
+def image_urls(url: Optional[str], image: Optional[ResponsiveImage]) -> List[str]:
+    """Every stored URL of an image: the original and its variants."""
+    urls = [url] if url else []
+    if image:
+        urls.extend(variant.url for variant in image.variants)
+    return urls
+
+
+async def delete_image_variants(image: Optional[ResponsiveImage]) -> bool:
+    """Delete every variant of a responsive image."""
+    if not image:
+        return True
+    blob_names = [_blob_name_from_url(variant.url) for variant in image.variants]
+    image_manager = get_async_bucket_manager()
+    results = await asyncio.gather(
+        *(image_manager.delete_image(blob_name) for blob_name in blob_names if blob_name)
+    )
+    return all(results)
+
 # =====================
 # Item Image Utils
 # =====================
@@ -31,25 +145,23 @@ async def save_item_image(
     item_id: str,
     optimize: bool = True,
 ) -> UploadResult:
-    """Save an item image to cloud storage."""
-    content = await image.read()
-    image_manager = get_google_bucket_manager()
+    """Save an item image and its responsive variants to cloud storage."""
     folder = f"restaurants/{restaurant_id}/items/{item_id}"
 
-    return image_manager.upload_image(
-        image_source=content,
-        filename=image.filename,
-        folder=folder,
-        public=True,
-        optimize=optimize,
-        format_type=ImageFormat.JPEG,
-        quality=85,
-        metadata={
-            "restaurant_id": restaurant_id,
-            "item_id": item_id,
-            "original_filename": image.filename,
-        },
-    )
+    async with spooled_upload(image) as path:
+        return await _upload_with_variants(
+            path,
+            filename=image.filename,
+            folder=folder,
+            variant_folder=f"{folder}/variants",
+            widths=ITEM_IMAGE_WIDTHS,
+            optimize=optimize,
+            metadata={
+                "restaurant_id": restaurant_id,
+                "item_id": item_id,
+                "original_filename": image.filename,
+            },
+        )
 
 
 def _blob_name_from_url(url: str) -> Optional[str]:
@@ -67,15 +179,18 @@ async def delete_item_image(image_url: str) -> bool:
 
     if not blob_name:
         return False
-    manager = get_google_bucket_manager()
-    return manager.delete_image(blob_name)
+    manager = get_async_bucket_manager()
+    return await manager.delete_image(blob_name)
 
 
 async def save_restaurant_image(
     image: UploadFile, restaurant_id: str, image_type: str, optimize: bool = True
 ) -> UploadResult:
     """
-    Save a restaurant image (banner or logo) to cloud storage.
+    Save a restaurant image (banner or logo) and its responsive variants to cloud storage.
+
+    Variants are stored under ``restaurants/{id}/variants/{image_type}`` so
+    listing the image type's folder still only returns the main images.
 
     Args:
         image: The uploaded image file
@@ -92,37 +207,29 @@ async def save_restaurant_image(
             f"Invalid image type. Must be one of: {RESTAURANT_BANNER}, {RESTAURANT_LOGO}"
         )
 
-    # Read image content
-    content = await image.read()
-
-    # Get image manager
-    image_manager = get_google_bucket_manager()
-
-    # Determine folder and dimensions based on image type
+    # Determine folder and variant widths based on image type
     folder = f"restaurants/{restaurant_id}/{image_type}"
-    max_dimensions = (
-        MAX_BANNER_DIMENSIONS
+    widths = (
+        BANNER_IMAGE_WIDTHS
         if image_type == RESTAURANT_BANNER
-        else MAX_LOGO_DIMENSIONS
+        else LOGO_IMAGE_WIDTHS
     )
 
-    # Process and upload image
-    result = image_manager.upload_image(
-        image_source=content,
-        filename=image.filename,
-        folder=folder,
-        public=True,  # Make images publicly accessible
-        optimize=optimize,
-        format_type=ImageFormat.JPEG,
-        quality=85,
-        metadata={
-            "restaurant_id": restaurant_id,
-            "image_type": image_type,
-            "original_filename": image.filename,
-        },
-    )
-
-    return result
+    # Process and upload image from a temporary copy of the upload
+    async with spooled_upload(image) as path:
+        return await _upload_with_variants(
+            path,
+            filename=image.filename,
+            folder=folder,
+            variant_folder=f"restaurants/{restaurant_id}/variants/{image_type}",
+            widths=widths,
+            optimize=optimize,
+            metadata={
+                "restaurant_id": restaurant_id,
+                "image_type": image_type,
+                "original_filename": image.filename,
+            },
+        )
 
 
 async def delete_restaurant_image(
@@ -146,21 +253,21 @@ async def delete_restaurant_image(
             f"Invalid image type. Must be one of: {RESTAURANT_BANNER}, {RESTAURANT_LOGO}"
         )
 
-    image_manager = get_google_bucket_manager()
+    image_manager = get_async_bucket_manager()
 
     if blob_name:
         # Delete specific image
-        return image_manager.delete_image(blob_name)
+        return await image_manager.delete_image(blob_name)
     else:
         # List images in the restaurant's folder
         folder = f"restaurants/{restaurant_id}/{image_type}"
-        images = image_manager.list_images(folder=folder)
+        images = await image_manager.list_images(folder=folder)
 
         if not images:
             return False
 
         # Delete the most recent image
-        return image_manager.delete_image(images[-1])
+        return await image_manager.delete_image(images[-1])
 
 
 def get_restaurant_image_url(
@@ -204,21 +311,31 @@ def get_restaurant_image_url(
 
 
 def validate_image_dimensions(
-    image_data: bytes, image_type: str
+    image_data: Union[bytes, BinaryIO], image_type: str
 ) -> Tuple[bool, Optional[str]]:
     """
     Validate image dimensions based on type.
 
+    Only the image header is read (Pillow opens images lazily), so pass the
+    upload's file object rather than reading it into memory first; its
+    position is restored afterwards.
+
     Args:
-        image_data: The image data in bytes
+        image_data: The image data in bytes, or a seekable file object
         image_type: Type of image (banner or logo)
 
     Returns:
         Tuple[bool, Optional[str]]: (is_valid, error_message)
     """
     try:
-        image = Image.open(io.BytesIO(image_data))
-        width, height = image.size
+        if isinstance(image_data, bytes):
+            image_data = io.BytesIO(image_data)
+        position = image_data.tell()
+        try:
+            with Image.open(image_data) as image:
+                width, height = image.size
+        finally:
+            image_data.seek(position)
 
         if image_type == RESTAURANT_BANNER:
             max_width, max_height = MAX_BANNER_DIMENSIONS
@@ -265,12 +382,12 @@ async def rename_restaurant_image(
             f"Invalid image type. Must be one of: {RESTAURANT_BANNER}, {RESTAURANT_LOGO}"
         )
 
-    image_manager = get_google_bucket_manager()
+    image_manager = get_async_bucket_manager()
 
     if not blob_name:
         # Get the most recent image for this type
         folder = f"restaurants/{old_restaurant_id}/{image_type}"
-        images = image_manager.list_images(folder=folder)
+        images = await image_manager.list_images(folder=folder)
         if not images:
             return None
         blob_name = images[-1]
@@ -278,23 +395,7 @@ async def rename_restaurant_image(
     # Create new blob name
     new_blob_name = blob_name.replace(old_restaurant_id, new_restaurant_id)
 
-    try:
-        # Get the source blob
-        source_blob = image_manager.bucket.blob(blob_name)
-
-        # Create a new blob with the new name
-        new_blob = image_manager.bucket.blob(new_blob_name)
-
-        # Copy the source blob to the new blob
-        image_manager.bucket.copy_blob(source_blob, image_manager.bucket, new_blob_name)
-
-        # Delete the old blob
-        source_blob.delete()
-
-        return new_blob_name
-    except Exception as e:
-        image_manager.logger.error(f"Failed to rename blob {blob_name}: {e}")
-        return None
+    return await image_manager.rename_image(blob_name, new_blob_name)
 
 
 async def cleanup_restaurant_images(
@@ -317,12 +418,12 @@ async def cleanup_restaurant_images(
             f"Invalid image type. Must be one of: {RESTAURANT_BANNER}, {RESTAURANT_LOGO}"
         )
 
-    image_manager = get_google_bucket_manager()
+    image_manager = get_async_bucket_manager()
 
     try:
         # List all images for this restaurant and type
         folder = f"restaurants/{restaurant_id}/{image_type}"
-        images = image_manager.list_images(folder=folder)
+        images = await image_manager.list_images(folder=folder)
 
         if not images:
             return True
@@ -331,16 +432,17 @@ async def cleanup_restaurant_images(
             # Keep the most recent image, delete the rest
             images_to_delete = images[:-1]
         else:
-            # Delete all images
-            images_to_delete = images
-
-        # Delete the images
-        success = True
-        for blob_name in images_to_delete:
-            if not image_manager.delete_image(blob_name):
-                success = False
-
-        return success
+            # Delete all images, along with their responsive variants
+            variants = await image_manager.list_images(
+                folder=f"restaurants/{restaurant_id}/variants/{image_type}"
+            )
+            images_to_delete = images + variants
+
+        # Delete the images concurrently; the manager bounds the storage calls in flight
+        results = await asyncio.gather(
+            *(image_manager.delete_image(blob_name) for blob_name in images_to_delete)
+        )
+        return all(results)
     except Exception as e:
         image_manager.logger.error(
             f"Failed to cleanup images for restaurant {restaurant_id}: {e}"
@@ -1,6 +1,11 @@
 import re
-from typing import Type
+from typing import Any, Dict, List, Sequence, Set, Type
+
 from beanie import Document
+from bson.regex import Regex
+from pymongo.errors import DuplicateKeyError
+
+from app.db.crud import MongoCrud
 
 
 def slugify(text: str) -> str:
@@ -9,13 +14,75 @@ def slugify(text: str) -> str:
     return slug
 
 
+def _mark_taken(taken: Dict[str, Set[int]], slug: str) -> None:
+    """Record ``slug`` as suffix 1 of itself and, for ``base-n``, as suffix ``n`` of ``base``."""
+    if slug in taken:
+        taken[slug].add(1)
+    base, _, suffix = slug.rpartition("-")
+    if suffix.isdigit() and base in taken:
+        taken[base].add(int(suffix))
+
+
+async def _taken_suffixes(bases: Set[str], model: Type[Document], slug_field: str) -> Dict[str, Set[int]]:
+    """Suffixes in use for each of ``bases``, read with a single query."""
+    taken: Dict[str, Set[int]] = {base: set() for base in bases}
+    # Slugs only hold [a-z0-9-], so the bases need no escaping and each pattern is
+    # an anchored prefix the slug index can bound
+    patterns = [Regex(rf"^{base}(-[0-9]+)?$") for base in bases]
+    cursor = model.get_motor_collection().find({slug_field: {"$in": patterns}}, {slug_field: 1, "_id": 0})
+    async for document in cursor:
+        _mark_taken(taken, document[slug_field])
+    return taken
+
+
+async def generate_unique_slugs(
+        names: Sequence[str], model: Type[Document], slug_field: str = "slug"
+) -> List[str]:
+    """Unique slugs for ``names``, also unique among themselves, in one round trip.
+
+    Each name gets its slug, or ``slug-2``, ``slug-3``, ... with the lowest
+    free suffix. Another writer may take the same slug before it is inserted;
+    the unique slug index rejects the second insert, see ``create_with_unique_slug``.
+    """
+    bases = [slugify(name) for name in names]
+    if not bases:
+        return []
+
+    taken = await _taken_suffixes(set(bases), model, slug_field)
+    slugs = []
+    for base in bases:
+        suffix = 1
+        while suffix in taken[base]:
+            suffix += 1
+        slug = base if suffix == 1 else f"{base}-{suffix}"
+        _mark_taken(taken, slug)
+        slugs.append(slug)
+    return slugs
+
+
 async def generate_unique_slug(name: str, model: Type[Document], slug_field: str = "slug") -> str:
-    base_slug = slugify(name)
-    slug = base_slug
-    counter = 1
-    existing = await model.find_one({slug_field: slug})
-    while existing:
-        counter += 1
-        slug = f"{base_slug}-{counter}"
-        existing = await model.find_one({slug_field: slug})
-    return slug
+    return (await generate_unique_slugs([name], model, slug_field))[0]
+
+
+def _is_slug_conflict(error: DuplicateKeyError, slug_field: str) -> bool:
+    return slug_field in (error.details or {}).get("keyPattern", {})
+
+
+async def create_with_unique_slug(
+        crud: MongoCrud,
+        payload: Dict[str, Any],
+        slug_field: str = "slug",
+        attempts: int = 3,
+) -> Document:
+    """Insert ``payload`` through ``crud.create`` under a fresh slug of ``payload["name"]``.
+
+    A concurrent insert that took the same slug makes the unique index reject
+    this one; the slug is then allocated again.
+    """
+    for attempt in range(attempts):
+        payload[slug_field] = await generate_unique_slug(payload["name"], crud.model, slug_field)
+        try:
+            return await crud.create(payload)
+        except DuplicateKeyError as error:
+            if attempt == attempts - 1 or not _is_slug_conflict(error, slug_field):
+                raise
@@ -3,6 +3,8 @@ from typing import Optional
 
 import pytz
 
+LUANDA_TIMEZONE = "Africa/Luanda"
+
 
 def now_in_luanda() -> datetime:
     """Returns the current datetime in the Luanda, Angola timezone (WAT, UTC+1)."""
@@ -23,4 +25,4 @@ def to_luanda_timezone(value: Optional[datetime]) -> Optional[datetime]:
 
     if value.tzinfo is None:
         value = value.replace(tzinfo=timezone.utc)
-    return value.astimezone(pytz.timezone("Africa/Luanda"))
+    return value.astimezone(pytz.timezone(LUANDA_TIMEZONE))
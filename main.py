@@ -1,17 +1,23 @@
+import asyncio
 from collections.abc import AsyncIterator
-from contextlib import asynccontextmanager
+from contextlib import asynccontextmanager, suppress
 
 import requests
 from fastapi import FastAPI, WebSocket, WebSocketDisconnect, Response, Request
 from starlette.middleware.cors import CORSMiddleware
 import json
 
+from app.api.route_policy import public
 from app.auth.firebase import initialize_firebase
 from app.core.dependencies import get_settings, get_logger, get_mongo
+from app.db.cache import watch_invalidations
+from app.db.query_audit import enable_query_audit
 from app.middleware.auth_middleware import AuthMiddleware
 from app.middleware.response_middleware import ResponseFormatterMiddleware
 
 from app.api.base_router import router as base_router
+from app.services.google_bucket import close_async_bucket_manager
+from app.services.websocket_broker import MongoBroker
 from app.services.websocket_manager import get_websocket_manger
 from app.utils.time import now_in_luanda
 
@@ -36,8 +42,32 @@ async def lifespan(application: FastAPI) -> AsyncIterator[None]:
     except Exception as error:
         logger.error(error)
 
+    if settings.QUERY_AUDIT:
+        logger.info("Recording query shapes for the query plan audit")
+        enable_query_audit()
+
+    if settings.WEBSOCKET_BROKER == "mongo" and mongo_client.db is not None:
+        logger.info("Starting websocket broker on MongoDB")
+        await websocket_manager.start(MongoBroker(mongo_client.get_db()))
+    else:
+        await websocket_manager.start()
+
+    invalidation_task = None
+    if settings.CACHE_INVALIDATION_STREAM and mongo_client.db is not None:
+        logger.info("Watching cached collections for cross-worker invalidation")
+        invalidation_task = asyncio.create_task(watch_invalidations(mongo_client.get_db()))
+
     yield
 
+    if invalidation_task:
+        invalidation_task.cancel()
+        with suppress(asyncio.CancelledError):
+            await invalidation_task
+
+    await websocket_manager.stop()
+
+    close_async_bucket_manager()
+
     logger.info("Closing Mongo DB client connection")
     await mongo_client.close_connection()
 
@@ -57,12 +87,13 @@ app.add_middleware(
 
 
 app.add_middleware(ResponseFormatterMiddleware)
-app.add_middleware(AuthMiddleware)
+app.add_middleware(AuthMiddleware, routes=app.routes)
 
 app.include_router(base_router, prefix=settings.API_BASE_ROUTE)
 
 
 @app.get("/health", tags=["Health"])
+@public
 async def health_check():
     return {
         "status": "healthy",
@@ -72,6 +103,7 @@ async def health_check():
 
 
 @app.post("/compile-latex")
+@public
 async def compile_latex(request: Request):
     body = await request.json()
     latex_code = body["inputs"]["main.tex"]
@@ -97,12 +129,21 @@ async def compile_latex(request: Request):
 
 
 @app.websocket("/ws/{restaurant_id}/{category}")
+@public
 async def websocket_endpoint(
         websocket: WebSocket,
         restaurant_id: str,
         category: str):
     key = f"{restaurant_id}/{category}"
-    await websocket_manager.connect(websocket, key)
+    # Resumable clients pass ?resume=1, or ?last_seq=<n>&stream=<id> when reconnecting
+    last_seq = websocket.query_params.get("last_seq")
+    await websocket_manager.connect(
+        websocket,
+        key,
+        resumable=websocket.query_params.get("resume") == "1",
+        last_seq=int(last_seq) if last_seq and last_seq.isdigit() else None,
+        stream=websocket.query_params.get("stream"),
+    )
     try:
         while True:
             # if websocket.application_state == WebSocketState.CONNECTED: